@@ -0,0 +1,51 @@
+@echo off
+REM ===================================================================
+REM GHALI CONSULTANTS - MEMBER SCHEDULE BATCH
+REM Calculation sheets for every beam and column of a schedule
+REM Usage: generate_schedule_pdfs.bat schedule.xlsx [--engine reportlab] [--resume]
+REM ===================================================================
+
+echo.
+echo ===============================================================
+echo     GHALI CONSULTANTS - Member Schedule Batch
+echo ===============================================================
+echo.
+
+if "%~1"=="" (
+    echo ❌ No schedule given
+    echo 💡 Usage: generate_schedule_pdfs.bat schedule.xlsx [--engine reportlab] [--resume]
+    echo.
+    pause
+    exit /b 1
+)
+
+REM Change to project root directory
+cd /d "%~dp0\..\.."
+
+REM Activate virtual environment if it exists
+if exist "venv\Scripts\activate.bat" (
+    echo 🐍 Activating virtual environment...
+    call venv\Scripts\activate.bat
+    echo    ✓ Virtual environment activated
+    echo.
+) else (
+    echo ⚠️  Virtual environment not found - using system Python
+    echo.
+)
+
+REM Design and build every member of the schedule
+echo 🏗️  Building schedule calculation sheets...
+python scripts\pdf_generators\schedule_batch.py %*
+
+if errorlevel 1 (
+    echo.
+    echo ❌ Some members failed or were invalid
+    echo 💡 See the manifest in output\, fix the rows and rerun with --resume
+    echo.
+) else (
+    echo.
+    echo ✅ SUCCESS! All schedule sheets generated in output\
+    echo.
+)
+
+pause
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Benchmark Suite
+===================================
+Reproducible timings of the calculation, plotting and PDF hot paths, at
+several member counts, appended to a JSON history so regressions show up
+release to release.
+
+Every case runs on the same seeded synthetic members (spans, loads and
+sections in the ranges of the sample schedules) and records:
+
+    wall         seconds spent in the measured stages (setup excluded)
+    per_member   wall / members
+    stages       per-stage breakdown of wall, e.g. plot_bmd_sfd, pdflatex
+    peak_rss_mb  peak resident memory of the process that ran the case
+
+Each (case, members) pair runs in a fresh process so peak RSS belongs to
+that case alone. A size whose time, extrapolated linearly from the
+previous size, would exceed the per-case budget is recorded as skipped
+with the estimate instead of being run; cases that need pdflatex are
+skipped when it is not installed.
+
+Usage:
+    python scripts/benchmarks/benchmark_suite.py                     # 1, 100, 10k members
+    python scripts/benchmarks/benchmark_suite.py --cases beam_calculations --sizes 1 100000
+    python scripts/benchmarks/benchmark_suite.py --budget 60 --no-history
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import io
+import json
+import multiprocessing
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+DEFAULT_SIZES = (1, 100, 10000)
+DEFAULT_BUDGET = 300.0          # Seconds allowed per (case, size) before it is skipped
+DEFAULT_HISTORY = project_root / "reports" / "benchmarks" / "benchmark_history.json"
+REGRESSION_THRESHOLD = 1.10     # Flag cases more than 10% slower than the previous run
+REGRESSION_MIN_SECONDS = 0.05   # ...and at least this much slower (ignores timer noise)
+SEED = 2025
+
+
+class StageTimer:
+    """Accumulates wall time per named stage"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block and add it to the stage's total"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def add(self, name: str, seconds: float):
+        """Add externally measured time to a stage"""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+
+def sample_beams(n: int, seed: int = SEED) -> Dict[str, np.ndarray]:
+    """Seeded synthetic beams, as arrays (length m, loads kN/m, section mm)"""
+    rng = np.random.default_rng(seed)
+    length = np.round(rng.uniform(4.0, 12.0, n), 1)
+    return {
+        'length': length,
+        'dead_load': np.round(rng.uniform(10.0, 40.0, n), 1),
+        'live_load': np.round(rng.uniform(5.0, 35.0, n), 1),
+        'width': rng.choice([300, 350, 400], n),
+        'height': rng.choice([500, 600, 700], n),
+        'bar_diameter': rng.choice([20, 25], n),
+        'steel_area_req': (length * 225).astype(int)
+    }
+
+
+def sample_beam_dicts(n: int, seed: int = SEED) -> List[Dict]:
+    """The synthetic beams as the beam_data dictionaries the generators take"""
+    from scripts.calculations.load_combinations import governing_factored_load
+
+    arrays = sample_beams(n, seed)
+    factored_load, combinations = governing_factored_load(arrays['dead_load'],
+                                                          arrays['live_load'])
+    factored_load = np.atleast_1d(factored_load)
+    combinations = np.atleast_1d(combinations)
+    return [{
+        **{key: values[i].item() for key, values in arrays.items()},
+        'factored_load': float(factored_load[i]),
+        'load_combination': str(combinations[i]),
+        'fc': 25,
+        'fy': 420
+    } for i in range(n)]
+
+
+# Benchmark cases: each takes (members, timer) and times its stages
+
+def bench_structural_plotter(n: int, timer: StageTimer):
+    """StructuralPlotter plot methods, LaTeX preset serialized in memory"""
+    from scripts.utilities.structural_plotting import EXPORT_PRESETS, StructuralPlotter
+
+    for beam in sample_beam_dicts(n):
+        plotter = StructuralPlotter(**EXPORT_PRESETS['latex'], in_memory=True)
+        with timer.stage('plot_beam_diagram'):
+            plotter.plot_beam_diagram(beam['length'], beam['dead_load'], beam['live_load'],
+                                      beam['width'], beam['height'])
+        with timer.stage('plot_bmd_sfd'):
+            plotter.plot_bmd_sfd(beam['length'], beam['factored_load'])
+        with timer.stage('plot_steel_layout'):
+            plotter.plot_steel_layout(beam['width'], beam['height'], beam['steel_area_req'],
+                                      beam['bar_diameter'])
+
+
+def bench_create_all_structural_plots(n: int, timer: StageTimer):
+    """create_all_structural_plots, LaTeX preset serialized in memory"""
+    from scripts.utilities.structural_plotting import EXPORT_PRESETS, create_all_structural_plots
+
+    for beam in sample_beam_dicts(n):
+        with timer.stage('create_all_structural_plots'):
+            create_all_structural_plots(beam, **EXPORT_PRESETS['latex'], in_memory=True)
+
+
+def bench_populate_template(n: int, timer: StageTimer):
+    """GhaliPDFGenerator.populate_template for both template styles"""
+    from scripts.pdf_generators.pdf_generator_system import GhaliPDFGenerator
+
+    beams = sample_beam_dicts(n)
+    for style in ('standard', 'cambridge'):
+        generator = GhaliPDFGenerator(template_style=style, use_cache=False)
+        with timer.stage(f'load_template_{style}'):
+            template = generator.load_template()
+        with timer.stage(f'populate_{style}'):
+            for beam in beams:
+                generator.populate_template(template, beam,
+                                            generator._get_default_project_info(beam))
+
+
+def bench_compile_pdf(n: int, timer: StageTimer):
+    """GhaliPDFGenerator.compile_pdf (standard style, cache disabled)"""
+    from scripts.pdf_generators.pdf_generator_system import GhaliPDFGenerator
+
+    generator = GhaliPDFGenerator(template_style='standard', use_cache=False)
+    template = generator.load_template()
+    with tempfile.TemporaryDirectory(prefix="ghali_bench_") as output_dir:
+        for index, beam in enumerate(sample_beam_dicts(n)):
+            with redirect_stdout(io.StringIO()):
+                plots_data = generator.generate_plots(beam, in_memory=True)
+                latex_content = generator.populate_template(
+                    template, beam, generator._get_default_project_info(beam))
+                start = time.perf_counter()
+                pdf_path = generator.compile_pdf(latex_content, f"bench_{index:05d}",
+                                                 output_dir=output_dir,
+                                                 figures=plots_data['files'])
+            elapsed = time.perf_counter() - start
+            if pdf_path is None:
+                raise RuntimeError("compile_pdf did not produce a PDF")
+            pdflatex = sum(generator.latex_pass_times)
+            timer.add('pdflatex', pdflatex)
+            timer.add('compile_overhead', elapsed - pdflatex)
+
+
+def bench_direct_pdf(n: int, timer: StageTimer):
+    """reportlab generate_aci318_method_c_direct_pdf"""
+    from scripts.pdf_generators.aci318_method_c_direct_pdf import \
+        generate_aci318_method_c_direct_pdf
+
+    with tempfile.TemporaryDirectory(prefix="ghali_bench_") as output_dir:
+        for index in range(n):
+            with timer.stage('generate_aci318_method_c_direct_pdf'), \
+                    redirect_stdout(io.StringIO()):
+                generate_aci318_method_c_direct_pdf(
+                    output_pdf=Path(output_dir) / f"column_{index:05d}.pdf", open_viewer=False)
+
+
+def bench_beam_calculations(n: int, timer: StageTimer):
+    """Notebook beam calculation for n beams: combinations, analysis, flexure"""
+    from scripts.calculations.aci318_flexure import design_flexure
+    from scripts.calculations.beam_analyzer import uniform_load_diagrams
+    from scripts.calculations.load_combinations import governing_factored_load
+
+    beams = sample_beams(n)
+    with timer.stage('load_combinations'):
+        w_u, _ = governing_factored_load(beams['dead_load'], beams['live_load'])
+    with timer.stage('analysis'):
+        diagrams = uniform_load_diagrams(beams['length'], w_u)
+    with timer.stage('flexure'):
+        design_flexure(diagrams['M_max'], beams['width'], beams['height'] - 50, 25.0, 420.0)
+
+
+def bench_column_calculations(n: int, timer: StageTimer):
+    """Notebook column calculation for n columns: Method C and P-M interaction"""
+    from scripts.calculations.aci318_interaction import check_columns, perimeter_section_signature
+    from scripts.calculations.aci318_method_c_engine import analyze_columns
+
+    rng = np.random.default_rng(SEED)
+    section_types = [(200, 1000, 6), (300, 600, 4), (400, 400, 3), (250, 800, 5)]
+    types = rng.integers(0, len(section_types), n)
+    b = np.array([section_types[t][0] for t in types], dtype=float)
+    h = np.array([section_types[t][1] for t in types], dtype=float)
+    Pu = rng.uniform(500, 2500, n)
+    M2_minor = rng.uniform(10, 60, n)
+    M2_major = rng.uniform(20, 150, n)
+
+    with timer.stage('method_c'):
+        results = analyze_columns(b, h, 2900.0, Pu, 0.5 * M2_minor, M2_minor,
+                                  0.5 * M2_major, M2_major, 28.0, 420.0, 12, 16.0)
+    with timer.stage('section_signatures'):
+        signatures = [perimeter_section_signature(section_types[t][0], section_types[t][1],
+                                                  42.0, 16.0, 2, section_types[t][2],
+                                                  28.0, 420.0)
+                      for t in types]
+    with timer.stage('interaction'):
+        check_columns(signatures, Pu, results['mc_method1_major'], results['mc_method1_minor'])
+
+
+CASES: Dict[str, Callable[[int, StageTimer], None]] = {
+    'structural_plotter': bench_structural_plotter,
+    'create_all_structural_plots': bench_create_all_structural_plots,
+    'populate_template': bench_populate_template,
+    'compile_pdf': bench_compile_pdf,
+    'direct_pdf': bench_direct_pdf,
+    'beam_calculations': bench_beam_calculations,
+    'column_calculations': bench_column_calculations
+}
+
+REQUIREMENTS = {'compile_pdf': 'pdflatex'}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (None where unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _measure(case: str, members: int) -> Dict:
+    """Run one case in this (fresh) process and collect its measurements"""
+    timer = StageTimer()
+    try:
+        CASES[case](members, timer)
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+    wall = sum(timer.stages.values())
+    return {
+        'wall': wall,
+        'per_member': wall / members,
+        'stages': timer.stages,
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+
+def _isolated(case: str, members: int) -> Dict:
+    """Run _measure in a fresh spawned process"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_measure, case, members).result()
+
+
+def run_suite(cases: Sequence[str] = tuple(CASES), sizes: Sequence[int] = DEFAULT_SIZES,
+              budget: float = DEFAULT_BUDGET, isolate: bool = True) -> Dict:
+    """
+    Run the benchmark cases at every size
+
+    Args:
+        cases: Case names (keys of CASES)
+        sizes: Member counts, run in increasing order
+        budget (float): Seconds allowed per (case, size); larger sizes whose
+            linear estimate exceeds it are skipped
+        isolate (bool): Run every measurement in a fresh process (needed for
+            a per-case peak RSS)
+
+    Returns:
+        Dict: Run record with metadata and results[case][members]
+    """
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {sorted(unknown)}; expected {list(CASES)}")
+
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': sorted(sizes),
+        'budget': budget,
+        'results': {}
+    }
+
+    for case in cases:
+        print(f"\n⏱️ {case}")
+        results = record['results'][case] = {}
+        requirement = REQUIREMENTS.get(case)
+        measured = []
+        for members in sorted(sizes):
+            estimate = _estimate(measured, members)
+            if requirement and shutil.which(requirement) is None:
+                result = {'skipped': f"{requirement} not found"}
+            elif estimate > budget:
+                result = {'skipped': f"estimated {estimate:,.0f} s > budget {budget:,.0f} s"}
+            else:
+                result = _isolated(case, members) if isolate else _measure(case, members)
+                if 'wall' in result:
+                    measured.append((members, result['wall']))
+
+            results[str(members)] = result
+            print(f"   {members:>7,} members  {_describe(result)}")
+
+    return record
+
+
+def _estimate(measured: Sequence, members: int) -> float:
+    """
+    Linear estimate of a case's wall time at a larger member count
+
+    Uses the marginal cost between the last two measured sizes, so fixed
+    setup (imports, template loading) does not inflate the estimate of
+    vectorized cases; with a single measurement it scales per member.
+    """
+    if not measured:
+        return 0.0
+    last_members, last_wall = measured[-1]
+    if len(measured) == 1:
+        return last_wall / last_members * members
+    previous_members, previous_wall = measured[-2]
+    marginal = max(last_wall - previous_wall, 0.0) / (last_members - previous_members)
+    return last_wall + marginal * (members - last_members)
+
+
+def _describe(result: Dict) -> str:
+    """One-line summary of a measurement"""
+    if 'skipped' in result:
+        return f"skipped ({result['skipped']})"
+    if 'error' in result:
+        return f"❌ {result['error']}"
+    rss = f" · peak {result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] else ""
+    stages = ", ".join(f"{name} {seconds:.3f}" for name, seconds in result['stages'].items())
+    return f"{result['wall']:.3f} s ({result['per_member'] * 1000:.2f} ms/member){rss} [{stages}]"
+
+
+def _git_commit() -> Optional[str]:
+    """Current commit of the project, if it is a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(history_file=DEFAULT_HISTORY) -> List[Dict]:
+    """All recorded runs, oldest first"""
+    history_file = Path(history_file)
+    if not history_file.exists():
+        return []
+    with open(history_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_history(record: Dict, history_file=DEFAULT_HISTORY) -> Path:
+    """Append a run record to the JSON history"""
+    history_file = Path(history_file)
+    history = load_history(history_file)
+    history.append(record)
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_file, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+    return history_file
+
+
+def compare(record: Dict, previous: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """
+    Compare a run with an earlier one
+
+    Args:
+        record (Dict): Current run
+        previous (Dict): Earlier run from the history
+        threshold (float): Slowdown ratio reported as a regression
+
+    Returns:
+        List[str]: Regressions as '<case> @ <members>: <old> → <new> s (×ratio)'
+    """
+    regressions = []
+    for case, results in record['results'].items():
+        for members, result in results.items():
+            before = previous.get('results', {}).get(case, {}).get(members, {})
+            if 'wall' in result and before.get('wall'):
+                ratio = result['wall'] / before['wall']
+                if ratio > threshold and result['wall'] - before['wall'] > REGRESSION_MIN_SECONDS:
+                    regressions.append(f"{case} @ {int(members):,}: {before['wall']:.3f} → "
+                                       f"{result['wall']:.3f} s (×{ratio:.2f})")
+    return regressions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark calculation, plotting and PDF hot paths')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES),
+                        help='Cases to run (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES),
+                        help='Member counts (default: 1 100 10000)')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help='Seconds allowed per case and size before larger sizes are skipped')
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY), help='JSON history file')
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Run every case in this process (faster; peak RSS is cumulative)')
+
+    args = parser.parse_args()
+
+    print("🏗️  GHALI CONSULTANTS - Benchmark Suite")
+    print("=" * 50)
+
+    record = run_suite(args.cases, args.sizes, args.budget, isolate=not args.in_process)
+
+    history = load_history(args.history)
+    if history:
+        regressions = compare(record, history[-1])
+        print(f"\n📈 Compared with {history[-1]['timestamp']} ({history[-1].get('commit')})")
+        for regression in regressions:
+            print(f"   ⚠️ {regression}")
+        if not regressions:
+            print("   ✓ No regressions")
+
+    if not args.no_history:
+        print(f"\n📁 Recorded in {append_history(record, args.history)}")
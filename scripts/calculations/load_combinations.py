@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - ACI 318-19 Load Combinations
+================================================
+Strength load combinations of ACI 318-19 Table 5.3.1 applied to per-case
+force arrays, with max/min envelopes and the governing combination at
+every station.
+
+All combinations are rows of one factor matrix (combinations × load
+types), so combining any number of members and stations is a single
+matrix product:
+
+    U = F @ [D, L, Lr, S, R, W, E]
+
+Wind and earthquake are reversible and appear with both signs. Only the
+load types that are actually supplied are kept; combinations that become
+identical are merged (the first Table 5.3.1 equation keeps its ID).
+
+Usage:
+    env = envelope({'D': M_dead, 'L': M_live, 'W': M_wind})
+    env['max'], env['min'], env['ids'][env['max_combo']]
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+LOAD_TYPES = ('D', 'L', 'Lr', 'S', 'R', 'W', 'E')
+ROOF_LOADS = ('Lr', 'S', 'R')
+REDUCED_LIVE_FACTOR = 0.5     # Load factor on L in 5.3.1(c)-(e) where 5.3.3 permits
+
+
+def _table_5_3_1(reduced_live: bool = False) -> List[Tuple[str, Dict[str, float]]]:
+    """Every Table 5.3.1 combination as (equation, {load type: factor})"""
+    f_live = REDUCED_LIVE_FACTOR if reduced_live else 1.0
+    combinations = [('5.3.1a', {'D': 1.4})]
+
+    for roof in ROOF_LOADS:
+        combinations.append(('5.3.1b', {'D': 1.2, 'L': 1.6, roof: 0.5}))
+    for roof in ROOF_LOADS:
+        combinations.append(('5.3.1c', {'D': 1.2, roof: 1.6, 'L': f_live}))
+        for sign in (1.0, -1.0):
+            combinations.append(('5.3.1c', {'D': 1.2, roof: 1.6, 'W': 0.5 * sign}))
+    for sign in (1.0, -1.0):
+        for roof in ROOF_LOADS:
+            combinations.append(('5.3.1d', {'D': 1.2, 'W': sign, 'L': f_live, roof: 0.5}))
+    for sign in (1.0, -1.0):
+        combinations.append(('5.3.1e', {'D': 1.2, 'E': sign, 'L': f_live, 'S': 0.2}))
+    for sign in (1.0, -1.0):
+        combinations.append(('5.3.1f', {'D': 0.9, 'W': sign}))
+    for sign in (1.0, -1.0):
+        combinations.append(('5.3.1g', {'D': 0.9, 'E': sign}))
+
+    return combinations
+
+
+def combination_expression(factors: Sequence[float], load_types: Sequence[str]) -> str:
+    """Readable form of one combination, e.g. '1.2D + 1.6L + 0.5S'"""
+    terms = []
+    for factor, load_type in zip(factors, load_types):
+        if factor == 0:
+            continue
+        sign = '-' if factor < 0 else '+'
+        term = f"{abs(factor):.1f}{load_type}"
+        terms.append(term if not terms and sign == '+' else f"{sign} {term}")
+    return ' '.join(terms) if terms else '0'
+
+
+def load_combinations(load_types: Sequence[str] = LOAD_TYPES,
+                      reduced_live: bool = False) -> Tuple[List[str], np.ndarray]:
+    """
+    Table 5.3.1 factor matrix for the given load types
+
+    Args:
+        load_types: Load types present (subset of LOAD_TYPES), matrix column order
+        reduced_live (bool): Use 0.5L in 5.3.1(c)-(e) (ACI 318-19 5.3.3)
+
+    Returns:
+        tuple: (combination IDs such as '5.3.1b: 1.2D + 1.6L',
+        factor matrix of shape (n_combinations, len(load_types)))
+    """
+    unknown = set(load_types) - set(LOAD_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown load types {sorted(unknown)}; expected {LOAD_TYPES}")
+
+    ids = []
+    rows = []
+    seen = set()
+    for equation, factors in _table_5_3_1(reduced_live):
+        row = tuple(factors.get(load_type, 0.0) for load_type in load_types)
+        if row in seen or not any(row):
+            continue
+        seen.add(row)
+        ids.append(f"{equation}: {combination_expression(row, load_types)}")
+        rows.append(row)
+
+    return ids, np.array(rows, dtype=float).reshape(len(rows), len(load_types))
+
+
+def _stack_cases(cases: Mapping[str, np.ndarray]) -> Tuple[List[str], np.ndarray, tuple]:
+    """Order cases as in LOAD_TYPES and stack them into a (n_types, N) matrix"""
+    load_types = [load_type for load_type in LOAD_TYPES if load_type in cases]
+    unknown = set(cases) - set(LOAD_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown load types {sorted(unknown)}; expected {LOAD_TYPES}")
+    if 'D' not in cases:
+        raise ValueError("Dead load case 'D' is required")
+
+    arrays = np.broadcast_arrays(*(np.asarray(cases[load_type], dtype=float)
+                                   for load_type in load_types))
+    shape = arrays[0].shape
+    return load_types, np.stack([array.ravel() for array in arrays]), shape
+
+
+def combine(cases: Mapping[str, np.ndarray], reduced_live: bool = False) -> Dict:
+    """
+    Apply every applicable combination to per-case forces
+
+    Args:
+        cases: Load type → force array (any shape, e.g. members × stations);
+            arrays are broadcast against each other
+        reduced_live (bool): Use 0.5L in 5.3.1(c)-(e)
+
+    Returns:
+        Dict: 'ids', 'factors' (n_combinations, n_types), 'load_types' and
+        'values' of shape (n_combinations, *case shape)
+    """
+    load_types, stacked, shape = _stack_cases(cases)
+    ids, factors = load_combinations(load_types, reduced_live)
+    return {
+        'ids': ids,
+        'factors': factors,
+        'load_types': load_types,
+        'values': (factors @ stacked).reshape((len(ids),) + shape)
+    }
+
+
+def envelope(cases: Mapping[str, np.ndarray], reduced_live: bool = False) -> Dict:
+    """
+    Max/min envelope over all applicable combinations
+
+    Args:
+        cases: Load type → force array (any shape), as for combine()
+        reduced_live (bool): Use 0.5L in 5.3.1(c)-(e)
+
+    Returns:
+        Dict: 'max', 'min' (case shape), 'max_combo', 'min_combo' (indices
+        into 'ids' per station), 'ids' and 'factors'
+    """
+    combined = combine(cases, reduced_live)
+    values = combined['values']
+    return {
+        'ids': combined['ids'],
+        'factors': combined['factors'],
+        'max': values.max(axis=0),
+        'min': values.min(axis=0),
+        'max_combo': values.argmax(axis=0),
+        'min_combo': values.argmin(axis=0)
+    }
+
+
+def governing_factored_load(dead_load, live_load=0.0, reduced_live: bool = False, **other):
+    """
+    Governing factored gravity load, e.g. a beam's uniform w_u
+
+    Args:
+        dead_load: Dead load D (scalar or array)
+        live_load: Live load L
+        reduced_live (bool): Use 0.5L in 5.3.1(c)-(e)
+        **other: Further load types by name (Lr, S, R, W, E)
+
+    Returns:
+        tuple: (governing factored load, governing combination ID); floats
+        and a string for scalar input, arrays otherwise
+    """
+    env = envelope({'D': dead_load, 'L': live_load, **other}, reduced_live)
+    ids = np.asarray(env['ids'])[env['max_combo']]
+    if np.ndim(env['max']) == 0:
+        return float(env['max']), str(ids)
+    return env['max'], ids
+
+
+if __name__ == "__main__":
+    import time
+
+    print("🏗️  GHALI CONSULTANTS - ACI 318-19 Load Combinations")
+    print("=" * 50)
+
+    ids, factors = load_combinations()
+    print(f"Table 5.3.1: {len(ids)} combinations for {', '.join(LOAD_TYPES)}")
+    for combination_id in ids:
+        print(f"   {combination_id}")
+
+    w_u, governing = governing_factored_load(15.0, 20.0)
+    print(f"\nw_D = 15, w_L = 20 kN/m → w_u = {w_u:.1f} kN/m ({governing})")
+    w_u, governing = governing_factored_load(40.0, 3.0)
+    print(f"w_D = 40, w_L = 3 kN/m → w_u = {w_u:.1f} kN/m ({governing})")
+
+    rng = np.random.default_rng(0)
+    shape = (5000, 101)
+    cases = {load_type: rng.normal(size=shape) * 100 for load_type in LOAD_TYPES}
+    start = time.perf_counter()
+    env = envelope(cases)
+    print(f"\n{shape[0]} members × {shape[1]} stations × {len(env['ids'])} combinations "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Material and Section Properties
+===================================================
+Interned, memoized material objects for the scalar, per-section code paths
+(the interaction surfaces of aci318_interaction).
+
+A property object is built once per unique set of inputs: asking for
+Concrete(25) again returns the same instance, with β1 and Ec already
+computed. Objects are immutable, use __slots__ and hash by their inputs, so
+they can key dicts and caches (and survive pickling to worker processes by
+re-interning on the other side).
+
+    Concrete(fc_prime)             f'c, Ec = 4700 sqrt(f'c), β1
+
+Formulas come from aci318_flexure and aci318_method_c_engine, whose
+vectorized functions remain the way to evaluate whole arrays at once; the
+column and beam sheets take their section values from those engines.
+
+Units: mm, MPa.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import math
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Add project root to path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.calculations.aci318_flexure import beta1
+from scripts.calculations.aci318_method_c_engine import EC_FACTOR
+
+MAX_INTERNED = 8192           # Unique objects kept per property class
+
+
+class _Interned:
+    """
+    Base of the property classes: immutable, interned on the input fields
+
+    Subclasses list their inputs in _fields, name every attribute in
+    __slots__ and compute derived values in _derive().
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        def build(*key):
+            if len(key) != len(cls._fields):
+                raise TypeError(f"{cls.__name__} takes {len(cls._fields)} arguments "
+                                f"({', '.join(cls._fields)}), got {len(key)}")
+            instance = object.__new__(cls)
+            for name, value in zip(cls._fields, key):
+                object.__setattr__(instance, name, value)
+            for name, value in instance._derive().items():
+                object.__setattr__(instance, name, value)
+            return instance
+
+        cls._intern = staticmethod(lru_cache(maxsize=MAX_INTERNED)(build))
+
+    def __new__(cls, *args):
+        # Floats as keys, so 25, 25.0 and np.float64(25) share one instance
+        return cls._intern(*map(float, args))
+
+    def _derive(self) -> Dict:
+        return {}
+
+    def key(self) -> Tuple:
+        """Input values identifying the object"""
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        return self is other or (type(other) is type(self) and other.key() == self.key())
+
+    def __hash__(self):
+        return hash((type(self).__name__, self.key()))
+
+    def __reduce__(self):
+        return type(self), self.key()
+
+    def __repr__(self):
+        inputs = ', '.join(f"{name}={value:g}" for name, value in zip(self._fields, self.key()))
+        return f"{type(self).__name__}({inputs})"
+
+
+class Concrete(_Interned):
+    """Normal-weight concrete of compressive strength f'c (MPa)"""
+    __slots__ = ('fc_prime', 'ec', 'beta1')
+    _fields = ('fc_prime',)
+
+    def _derive(self) -> Dict:
+        return {'ec': EC_FACTOR * math.sqrt(self.fc_prime),   # Eq. 19.2.2.1.b
+                'beta1': float(beta1(self.fc_prime))}         # Table 22.2.2.4.3
+
+
+def cache_info() -> Dict[str, object]:
+    """Hit/miss statistics of the intern cache of every property class"""
+    return {cls.__name__: cls._intern.cache_info()
+            for cls in (Concrete,)}
+
+
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    print("🏗️  GHALI CONSULTANTS - Material Properties")
+    print("=" * 50)
+
+    # Concrete of column C36 in the Method C notebook
+    concrete = Concrete(11)
+    print(f"f'c = 11 MPa: Ec = {concrete.ec:,.1f} MPa, β1 = {concrete.beta1:.3f}")
+    print(f"   Interned: {Concrete(11.0) is concrete}")
+
+    rng = np.random.default_rng(0)
+    n = 100000
+    strengths = rng.choice([25, 30, 35, 40], n).tolist()
+    start = time.perf_counter()
+    materials = [Concrete(fc_prime) for fc_prime in strengths]
+    print(f"{n} lookups over {len(set(materials))} unique concretes in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"   {cache_info()['Concrete']}")
@@ -10,34 +10,42 @@ Version: 1.0 Direct PDF
 
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
-def install_reportlab():
-    """Install reportlab if not available"""
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+
+def reportlab_available():
+    """Check that reportlab is installed (it is never pip-installed at run time)"""
     try:
         import reportlab
-        return True
     except ImportError:
-        print("📦 Installing reportlab for PDF generation...")
-        import subprocess
-        result = subprocess.run([sys.executable, "-m", "pip", "install", "reportlab"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("   ✅ Reportlab installed successfully")
-            return True
-        else:
-            print(f"   ❌ Failed to install reportlab: {result.stderr}")
-            return False
+        print("❌ reportlab is not installed. Run: pip install -r requirements.txt")
+        return False
+    return True
 
-def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
-    """Generate PDF directly using reportlab"""
-    
-    if not install_reportlab():
+@traced('aci318_method_c_direct_pdf')
+def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025", output_pdf=None, open_viewer=True):
+    """
+    Generate PDF directly using reportlab
+    
+    Args:
+        project_id (str): Project identifier
+        output_pdf (str, optional): Destination PDF
+            (defaults to output/ACI318_Method_C_Column_Design_Direct.pdf)
+        open_viewer (bool): Open the PDF in the default viewer when done
+        
+    Returns:
+        str: Path to generated PDF file
+    """
+    
+    if not reportlab_available():
         return None
     
     from reportlab.lib.pagesizes import letter, A4
@@ -47,14 +55,24 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
     from reportlab.platypus import PageBreak, Image
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+    from scripts.calculations.aci318_method_c_engine import column_adequate, column_checks
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import column_c36_data
+    from scripts.pdf_generators.template_engine import format_value as fmt
     
     print("🏗️  GHALI CONSULTANTS - ACI 318-19 Method C Direct PDF Generator")
     print("=" * 68)
+    trace = current_trace()
+    story_start = time.perf_counter()
+    
+    # Column C36, computed by the Method C engine
+    c = column_c36_data()
+    checks = column_checks(c)
+    critical = 'minor' if c['axis'] == 'minor' else 'major'
     
     # Setup document
-    output_dir = project_root / "output"
-    output_dir.mkdir(exist_ok=True)
-    pdf_file = output_dir / "ACI318_Method_C_Column_Design_Direct.pdf"
+    pdf_file = Path(output_pdf) if output_pdf else \
+        project_root / "output" / "ACI318_Method_C_Column_Design_Direct.pdf"
+    pdf_file.parent.mkdir(parents=True, exist_ok=True)
     
     doc = SimpleDocTemplate(str(pdf_file), pagesize=A4,
                            rightMargin=2*mm, leftMargin=2*mm,
@@ -104,7 +122,7 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     project_data = [
         ['Parameter', 'Value'],
         ['Project ID', project_id],
-        ['Column ID', 'C36 (297)'],
+        ['Column ID', c['column_id']],
         ['Design Code', 'ACI 318-19'],
         ['Analysis Method', 'Method C (Moment Magnification)'],
         ['Engineer', 'Ahmed Ghali, P.E.']
@@ -128,9 +146,9 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     content.append(Paragraph("Material Properties", header_style))
     material_data = [
         ['Property', 'Value', 'Unit'],
-        ["Concrete Strength, f'c", '11.0', 'MPa'],
-        ['Steel Yield Strength, fy', '500', 'MPa'],
-        ['Concrete Modulus, Ec', '15,588.1', 'MPa'],
+        ["Concrete Strength, f'c", f"{c['fc_prime']:.1f}", 'MPa'],
+        ['Steel Yield Strength, fy', f"{c['fy']:.0f}", 'MPa'],
+        ['Concrete Modulus, Ec', f"{c['ec']:,.1f}", 'MPa'],
         ['Steel Modulus, Es', '200,000', 'MPa']
     ]
     
@@ -152,13 +170,13 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     content.append(Paragraph("Column Geometry", header_style))
     geometry_data = [
         ['Parameter', 'Value', 'Unit'],
-        ['Width (short), b', '200', 'mm'],
-        ['Height (long), h', '1000', 'mm'],
-        ['Unsupported Length, Lu', '2900', 'mm'],
-        ['Effective Length, Le', '2900', 'mm'],
-        ['Gross Area, Ag', '200,000', 'mm²'],
-        ['Critical Ig (minor axis)', '666,666,667', 'mm⁴'],
-        ['Steel Area, As', '2412.7', 'mm²']
+        ['Width (short), b', f"{c['b']:.0f}", 'mm'],
+        ['Height (long), h', f"{c['h']:.0f}", 'mm'],
+        ['Unsupported Length, Lu', f"{c['lu']:.0f}", 'mm'],
+        ['Effective Length, Le', f"{c['le']:.0f}", 'mm'],
+        ['Gross Area, Ag', f"{c['ag']:,.0f}", 'mm²'],
+        [f"Critical Ig ({critical} axis)", f"{c['ig']:,.0f}", 'mm⁴'],
+        ['Steel Area, As', f"{c['as_total']:.1f}", 'mm²']
     ]
     
     geometry_table = Table(geometry_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
@@ -179,12 +197,12 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     content.append(Paragraph("Applied Forces", header_style))
     forces_data = [
         ['Force/Moment', 'Value', 'Unit'],
-        ['Factored Axial Load, Pu', '1583.5', 'kN'],
-        ['End Moment 1, M1u', '8.0383', 'kN·m'],
-        ['End Moment 2, M2u', '10.9098', 'kN·m'],
-        ['Sustained Load, Psus', '1583.5', 'kN'],
-        ['βdns Factor', '1.00', '--'],
-        ['Cm Factor', '0.3053', '--']
+        ['Factored Axial Load, Pu', f"{c['pu']:.1f}", 'kN'],
+        ['End Moment 1, M1u', f"{c['m1u']:.4f}", 'kN·m'],
+        ['End Moment 2, M2u', f"{c['m2u']:.4f}", 'kN·m'],
+        ['Sustained Load, Psus', f"{c['psus']:.1f}", 'kN'],
+        ['βdns Factor', f"{c['beta_dns']:.2f}", '--'],
+        ['Cm Factor', f"{c['cm']:.4f}", '--']
     ]
     
     forces_table = Table(forces_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
@@ -205,10 +223,11 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     content.append(Paragraph("🎯 Critical Buckling Direction Analysis", header_style))
     buckling_data = [
         ['Direction', 'Inertia (mm⁴)', 'Applied Moment', 'Critical'],
-        ['Major Axis', '16,666,666,667', 'M33 Range', 'No'],
-        ['Minor Axis', '666,666,667', 'M22 Range', 'YES']
+        ['Major Axis', f"{c['imajor']:,.0f}", 'M33 Range', 'YES' if critical == 'major' else 'No'],
+        ['Minor Axis', f"{c['iminor']:,.0f}", 'M22 Range', 'YES' if critical == 'minor' else 'No']
     ]
     
+    critical_row = 2 if critical == 'minor' else 1
     buckling_table = Table(buckling_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 1*inch])
     buckling_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#fff3cd')),
@@ -219,16 +238,17 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
         ('BACKGROUND', (0, 1), (-1, -1), colors.white),
         ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('TEXTCOLOR', (3, 2), (3, 2), colors.red),
-        ('FONTNAME', (3, 2), (3, 2), 'Helvetica-Bold')
+        ('TEXTCOLOR', (3, critical_row), (3, critical_row), colors.red),
+        ('FONTNAME', (3, critical_row), (3, critical_row), 'Helvetica-Bold')
     ]))
     content.append(buckling_table)
     content.append(Spacer(1, 15))
     
     # Key findings box
-    content.append(Paragraph("<b>Key Finding:</b> Minor axis buckling governs due to smaller moment of inertia.", styles['Normal']))
-    content.append(Paragraph("<b>Slenderness Ratio:</b> Le/b = 2900/200 = 14.5", styles['Normal']))
-    content.append(Paragraph("<b>Classification:</b> SHORT (Limit = 22 for braced frames)", styles['Normal']))
+    depth_name, depth = ('b', c['b']) if critical == 'minor' else ('h', c['h'])
+    content.append(Paragraph(f"<b>Key Finding:</b> {critical.capitalize()} axis governs (lower Pu/0.75Pc margin).", styles['Normal']))
+    content.append(Paragraph(f"<b>Slenderness Ratio:</b> Le/{depth_name} = {c['le']:.0f}/{depth:.0f} = {c['slenderness']:.1f}", styles['Normal']))
+    content.append(Paragraph(f"<b>Classification:</b> {c['slender_class']} (Limit = 22 for braced frames)", styles['Normal']))
     content.append(Spacer(1, 20))
     
     # Method C Analysis
@@ -236,15 +256,15 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     
     content.append(Paragraph("Method 1: Conservative Approach (ACI 318-19 Eq. 6.6.4.4.4a)", subheader_style))
     content.append(Paragraph("(EI)eff = 0.4 × Ec × Ig / (1 + βdns)", styles['Normal']))
-    content.append(Paragraph("= 0.4 × 15,588.1 × 666,666,667 / (1 + 1.00)", styles['Normal']))
-    content.append(Paragraph("= 51,960.5 kN·m²", styles['Normal']))
+    content.append(Paragraph(f"= 0.4 × {c['ec']:,.1f} × {c['ig']:,.0f} / (1 + {c['beta_dns']:.2f})", styles['Normal']))
+    content.append(Paragraph(f"= {c['ei_method1']:,.1f} kN·m²", styles['Normal']))
     content.append(Spacer(1, 15))
     
     content.append(Paragraph("Method 2: Refined Approach (ACI 318-19 Eq. 6.6.4.4.4c)", subheader_style))
     content.append(Paragraph("(EI)eff = Ec × Ig × Ifactor / (1 + βdns)", styles['Normal']))
-    content.append(Paragraph("= 15,588.1 × 666,666,667 × 0.70 / (1 + 1.00)", styles['Normal']))
-    content.append(Paragraph("= 90,930.8 kN·m²", styles['Normal']))
-    content.append(Paragraph("<i>where Ifactor = 0.70 (conservative estimate per Table 6.6.3.1.1(b))</i>", styles['Normal']))
+    content.append(Paragraph(f"= {c['ec']:,.1f} × {c['ig']:,.0f} × {c['i_factor']:.2f} / (1 + {c['beta_dns']:.2f})", styles['Normal']))
+    content.append(Paragraph(f"= {c['ei_method2']:,.1f} kN·m²", styles['Normal']))
+    content.append(Paragraph(f"<i>where Ifactor = {c['i_factor']:.2f} (conservative estimate per Table 6.6.3.1.1(b))</i>", styles['Normal']))
     content.append(Spacer(1, 20))
     
     # Critical Buckling Load & Moment Magnification
@@ -255,8 +275,10 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     
     buckling_load_data = [
         ['Method', 'Pc (kN)', '0.75Pc (kN)', 'Pu/0.75Pc', 'Status'],
-        ['Method 1', '15,695.0', '11,771.25', '0.1345', 'OK'],
-        ['Method 2', '27,465.0', '20,598.75', '0.0769', 'OK']
+        ['Method 1', f"{c['pc_method1']:,.1f}", f"{c['pc75_method1']:,.2f}", f"{c['ratio1']:.4f}",
+         'OK' if c['ratio1'] < 1.0 else 'NG'],
+        ['Method 2', f"{c['pc_method2']:,.1f}", f"{c['pc75_method2']:,.2f}", f"{c['ratio2']:.4f}",
+         'OK' if c['ratio2'] < 1.0 else 'NG']
     ]
     
     buckling_load_table = Table(buckling_load_data, colWidths=[1.2*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.2*inch])
@@ -269,7 +291,8 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
         ('BACKGROUND', (0, 1), (-1, -1), colors.white),
         ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('TEXTCOLOR', (4, 1), (4, -1), colors.green),
+        ('TEXTCOLOR', (4, 1), (4, 1), colors.green if c['ratio1'] < 1.0 else colors.red),
+        ('TEXTCOLOR', (4, 2), (4, 2), colors.green if c['ratio2'] < 1.0 else colors.red),
         ('FONTNAME', (4, 1), (4, -1), 'Helvetica-Bold')
     ]))
     content.append(buckling_load_table)
@@ -277,12 +300,14 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     
     content.append(Paragraph("<b>Moment Magnification Factor (ACI 318-19 Eq. 6.6.4.5.2):</b>", styles['Normal']))
     content.append(Paragraph("δns = Cm / (1 - Pu/0.75Pc) ≥ 1.0", styles['Normal']))
+    content.append(Paragraph(f"M2,min = Pu (15 + 0.03{depth_name}) = {c['m2_min']:.2f} kN·m (ACI 318-19 Eq. 6.6.4.5.4)", styles['Normal']))
+    content.append(Paragraph("Mc = δns × max(M2u, M2,min)", styles['Normal']))
     content.append(Spacer(1, 15))
     
     magnification_data = [
         ['Method', 'δns', 'Magnified Moment Mc (kN·m)'],
-        ['Method 1', '1.00', '10.91'],
-        ['Method 2', '1.00', '10.91']
+        ['Method 1', fmt(c['deltans_method1'], '.2f'), fmt(c['mc_method1'], '.2f')],
+        ['Method 2', fmt(c['deltans_method2'], '.2f'), fmt(c['mc_method2'], '.2f')]
     ]
     
     magnification_table = Table(magnification_data, colWidths=[2*inch, 2*inch, 2*inch])
@@ -301,22 +326,35 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     
     # Cross-Section
     content.append(Paragraph("Column Cross-Section", header_style))
-    content.append(Paragraph("<b>Column C36 (297)</b>", styles['Normal']))
-    content.append(Paragraph("Dimensions: 200 mm × 1000 mm", styles['Normal']))
-    content.append(Paragraph("Reinforcement: 12 × Ø16 mm", styles['Normal']))
-    content.append(Paragraph("Steel Ratio: ρ = 1.21%", styles['Normal']))
-    content.append(Paragraph("[Cross-section diagram - Critical buckling about 200mm direction (minor axis)]", styles['Normal']))
+    content.append(Paragraph(f"<b>Column {c['column_id']}</b>", styles['Normal']))
+    content.append(Paragraph(f"Dimensions: {c['b']:.0f} mm × {c['h']:.0f} mm", styles['Normal']))
+    content.append(Paragraph(f"Reinforcement: {c['rebar_count']} × {c['rebar_size']} mm", styles['Normal']))
+    content.append(Paragraph(f"Steel Ratio: ρ = {c['rho']:.2f}%", styles['Normal']))
+    content.append(Paragraph(f"[Cross-section diagram - Critical buckling about {depth:.0f}mm direction ({critical} axis)]", styles['Normal']))
     content.append(Spacer(1, 20))
     
+    # Strength Interaction - design Mc of both methods about the governing axis
+    content.append(Paragraph("Strength Interaction", header_style))
+    content.append(Paragraph(
+        f"Pu = {c['pu']:.1f} kN → φMn = {checks['phi_mn']:.1f} kN·m about the {critical} axis at Pu", styles['Normal']))
+    for method in (1, 2):
+        content.append(Paragraph(
+            f"Method {method}: Mc = {fmt(c[f'mc_method{method}'], '.2f')} kN·m, "
+            f"Mc/φMn = {fmt(checks[f'interaction_ratio{method}'], '.3f')}", styles['Normal']))
+    content.append(Spacer(1, 20))
+
     # Design Verification
     content.append(Paragraph("Design Verification Summary", header_style))
     verification_data = [
         ['Requirement', 'Status', 'Reference'],
-        ['Slenderness Limits', 'OK', 'ACI 6.2.5'],
-        ['Method C Applicability', 'OK', 'ACI 6.6.4.4.2'],
-        ['Moment Magnification', 'OK', 'ACI 6.6.4.5.2'],
-        ['Strength Interaction', 'OK', 'ACI 22.4']
+        ['Slenderness Limits', checks['slenderness'], 'ACI 6.2.5'],
+        ['Method C Applicability', checks['method_c'], 'ACI 6.6.4.4.2'],
+        ['Moment Magnification', checks['magnification'], 'ACI 6.6.4.5.2'],
+        ['Strength Interaction', checks['interaction'], 'ACI 22.4']
     ]
+    status_colors = [('TEXTCOLOR', (1, row), (1, row),
+                      colors.green if status == 'OK' else colors.red)
+                     for row, (_, status, _) in enumerate(verification_data[1:], start=1)]
     
     verification_table = Table(verification_data, colWidths=[2.5*inch, 1.5*inch, 2*inch])
     verification_table.setStyle(TableStyle([
@@ -328,22 +366,27 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
         ('BACKGROUND', (0, 1), (-1, -1), colors.white),
         ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('TEXTCOLOR', (1, 1), (1, -1), colors.green),
-        ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold')
+        ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+        *status_colors
     ]))
     content.append(verification_table)
     content.append(Spacer(1, 20))
     
     # Conclusion
     content.append(Paragraph("Conclusion", header_style))
-    content.append(Paragraph("The ACI 318-19 Method C analysis demonstrates that Column C36 (297) satisfies all applicable code requirements for slenderness and stability. The moment magnification approach provides adequate safety factors while maintaining structural efficiency.", styles['Normal']))
+    adequate = column_adequate(checks)
+    if adequate:
+        content.append(Paragraph(f"The ACI 318-19 Method C analysis demonstrates that Column {c['column_id']} satisfies all applicable code requirements for slenderness and stability. The moment magnification approach provides adequate safety factors while maintaining structural efficiency.", styles['Normal']))
+    else:
+        content.append(Paragraph(f"The ACI 318-19 Method C analysis shows that Column {c['column_id']} does not satisfy the requirements marked NG above. The section or reinforcement must be revised.", styles['Normal']))
     content.append(Spacer(1, 15))
     
     content.append(Paragraph("<b>Key Design Features:</b>", styles['Normal']))
-    content.append(Paragraph("• Critical buckling direction properly identified (minor axis)", styles['Normal']))
-    content.append(Paragraph("• Method C applicability verified (Pu < 0.75Pc)", styles['Normal']))
+    content.append(Paragraph(f"• Critical buckling direction identified ({critical} axis)", styles['Normal']))
+    content.append(Paragraph(f"• Method C applicability checked (Pu < 0.75Pc): {checks['method_c']}", styles['Normal']))
     content.append(Paragraph("• Conservative and refined stiffness approaches compared", styles['Normal']))
-    content.append(Paragraph("• Complete ACI 318-19 Section 6.6 compliance", styles['Normal']))
+    if adequate:
+        content.append(Paragraph("• Complete ACI 318-19 Section 6.6 compliance", styles['Normal']))
     content.append(Spacer(1, 30))
     
     # Signature block
@@ -374,15 +417,19 @@ def generate_aci318_method_c_direct_pdf(project_id="GC-COL-2025"):
     content.append(Paragraph("<font size=8>This calculation follows ACI 318-19 Method C requirements and professional engineering standards. All calculations and results are subject to independent review and verification per professional engineering protocols.</font>", styles['Normal']))
     
     # Build PDF
-    doc.build(content)
+    trace.record_stage('story', time.perf_counter() - story_start, flowables=len(content))
+    with trace.stage('build'):
+        doc.build(content)
+    trace.file_written(pdf_file)
     
     print(f"✅ Direct PDF created: {pdf_file}")
     print(f"📄 Size: {pdf_file.stat().st_size / 1024:.1f} KB")
     
     # Open PDF
-    import webbrowser
-    webbrowser.open(f"file://{pdf_file.absolute()}")
-    print("🌐 Opened in default PDF viewer")
+    if open_viewer:
+        import webbrowser
+        webbrowser.open(f"file://{pdf_file.absolute()}")
+        print("🌐 Opened in default PDF viewer")
     
     return str(pdf_file)
 
@@ -391,8 +438,10 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Generate ACI 318-19 Method C Direct PDF')
     parser.add_argument('--project-id', default='GC-COL-2025', help='Project ID')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
     pdf_path = generate_aci318_method_c_direct_pdf(args.project_id)
     
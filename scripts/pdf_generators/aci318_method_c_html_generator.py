@@ -10,443 +10,122 @@ Version: 1.0 HTML Style
 
 import os
 import sys
-import webbrowser
 from pathlib import Path
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
-def create_aci318_method_c_html():
-    """Create HTML template for ACI 318-19 Method C"""
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ACI 318-19 Method C Column Design - Ghali Consultants</title>
-    <style>
-        @page {
-            size: A4;
-            margin: 2cm;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            font-size: 10pt;
-            line-height: 1.4;
-            color: #333;
-            max-width: 21cm;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            border-bottom: 3px solid #1f4e79;
-            padding-bottom: 20px;
-        }
-        
-        .header h1 {
-            color: #1f4e79;
-            font-size: 24pt;
-            font-weight: bold;
-            margin: 0 0 10px 0;
-        }
-        
-        .header h2 {
-            color: #666;
-            font-size: 16pt;
-            margin: 0 0 15px 0;
-        }
-        
-        .header .engineer {
-            color: #1f4e79;
-            font-size: 12pt;
-            font-weight: bold;
-        }
-        
-        .header .company {
-            color: #666;
-            font-size: 11pt;
-        }
-        
-        .section {
-            margin: 25px 0;
-        }
-        
-        .section h3 {
-            color: #1f4e79;
-            font-size: 14pt;
-            font-weight: bold;
-            margin-bottom: 15px;
-            border-bottom: 1px solid #ddd;
-            padding-bottom: 5px;
-        }
-        
-        .section h4 {
-            color: #666;
-            font-size: 12pt;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-        
-        .two-column {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-            margin-bottom: 20px;
-        }
-        
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 20px;
-            font-size: 9pt;
-        }
-        
-        table th {
-            background-color: #f5f5f5;
-            color: #1f4e79;
-            font-weight: bold;
-            padding: 8px;
-            border: 1px solid #ddd;
-            text-align: left;
-        }
-        
-        table td {
-            padding: 6px 8px;
-            border: 1px solid #ddd;
-        }
-        
-        .calc-box {
-            background-color: #f9f9f9;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 15px 0;
-        }
-        
-        .equation {
-            font-family: 'Times New Roman', serif;
-            font-size: 11pt;
-            text-align: center;
-            margin: 10px 0;
-            padding: 10px;
-            background-color: #f0f8ff;
-            border-left: 4px solid #1f4e79;
-        }
-        
-        .result {
-            background-color: #e8f5e8;
-            border: 1px solid #4caf50;
-            border-radius: 3px;
-            padding: 10px;
-            margin: 10px 0;
-            font-weight: bold;
-        }
-        
-        .critical {
-            background-color: #fff3cd;
-            border: 1px solid #ffc107;
-            border-radius: 3px;
-            padding: 10px;
-            margin: 10px 0;
-        }
-        
-        .status-ok {
-            color: #4caf50;
-            font-weight: bold;
-        }
-        
-        .status-critical {
-            color: #f44336;
-            font-weight: bold;
-        }
-        
-        .diagram {
-            text-align: center;
-            margin: 20px 0;
-            padding: 20px;
-            border: 2px solid #ddd;
-            border-radius: 5px;
-            background-color: #fafafa;
-        }
-        
-        .footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #1f4e79;
-            text-align: center;
-            font-size: 9pt;
-            color: #666;
-        }
-        
-        .signature-table {
-            margin: 30px auto;
-            width: 70%;
-        }
-        
-        @media print {
-            body { font-size: 9pt; }
-            .header h1 { font-size: 20pt; }
-            .header h2 { font-size: 14pt; }
-            .section h3 { font-size: 12pt; }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>ACI 318-19 Method C Column Design</h1>
-        <h2>Slenderness Analysis and Moment Magnification</h2>
-        <div class="engineer">Ahmed Ghali, P.E. | Lead Structural Engineer</div>
-        <div class="company">Ghali Consultants | {DATE}</div>
-    </div>
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+from scripts.pdf_generators.template_engine import format_value, render, template_source
 
-    <div class="section">
-        <h3>Project Overview</h3>
-        <table>
-            <tr><th>Parameter</th><th>Value</th></tr>
-            <tr><td>Project ID</td><td>{PROJECT_ID}</td></tr>
-            <tr><td>Column ID</td><td>{COLUMN_ID}</td></tr>
-            <tr><td>Design Code</td><td>ACI 318-19</td></tr>
-            <tr><td>Analysis Method</td><td>Method C (Moment Magnification)</td></tr>
-            <tr><td>Engineer</td><td>Ahmed Ghali, P.E.</td></tr>
-        </table>
-    </div>
+METHOD_C_HTML_TEMPLATE = "aci318_method_c_template.html"
 
-    <div class="two-column">
-        <div class="section">
-            <h3>Material Properties</h3>
-            <table>
-                <tr><th>Property</th><th>Value</th><th>Unit</th></tr>
-                <tr><td>Concrete Strength, f'c</td><td>{FC_PRIME}</td><td>MPa</td></tr>
-                <tr><td>Steel Yield Strength, fy</td><td>{FY}</td><td>MPa</td></tr>
-                <tr><td>Concrete Modulus, Ec</td><td>{EC}</td><td>MPa</td></tr>
-                <tr><td>Steel Modulus, Es</td><td>200,000</td><td>MPa</td></tr>
-            </table>
-        </div>
-
-        <div class="section">
-            <h3>Column Geometry</h3>
-            <table>
-                <tr><th>Parameter</th><th>Value</th><th>Unit</th></tr>
-                <tr><td>Width (short), b</td><td>{B}</td><td>mm</td></tr>
-                <tr><td>Height (long), h</td><td>{H}</td><td>mm</td></tr>
-                <tr><td>Unsupported Length, Lu</td><td>{LU}</td><td>mm</td></tr>
-                <tr><td>Effective Length, Le</td><td>{LE}</td><td>mm</td></tr>
-                <tr><td>Gross Area, Ag</td><td>{AG}</td><td>mm²</td></tr>
-                <tr><td>Critical Ig (minor axis)</td><td>{IG}</td><td>mm⁴</td></tr>
-                <tr><td>Steel Area, As</td><td>{AS}</td><td>mm²</td></tr>
-            </table>
-        </div>
-    </div>
-
-    <div class="section">
-        <h3>Applied Forces</h3>
-        <table>
-            <tr><th>Force/Moment</th><th>Value</th><th>Unit</th></tr>
-            <tr><td>Factored Axial Load, Pu</td><td>{PU}</td><td>kN</td></tr>
-            <tr><td>End Moment 1, M1u</td><td>{M1U}</td><td>kN·m</td></tr>
-            <tr><td>End Moment 2, M2u</td><td>{M2U}</td><td>kN·m</td></tr>
-            <tr><td>Sustained Load, Psus</td><td>{PSUS}</td><td>kN</td></tr>
-            <tr><td>βdns Factor</td><td>{BETADNS}</td><td>--</td></tr>
-            <tr><td>Cm Factor</td><td>{CM}</td><td>--</td></tr>
-        </table>
-    </div>
-
-    <div class="critical">
-        <h3>🎯 Critical Buckling Direction Analysis</h3>
-        <table>
-            <tr><th>Direction</th><th>Inertia (mm⁴)</th><th>Applied Moment</th><th>Critical</th></tr>
-            <tr><td>Major Axis</td><td>{IMAJOR}</td><td>M33 Range</td><td>No</td></tr>
-            <tr><td>Minor Axis</td><td>{IMINOR}</td><td>M22 Range</td><td><span class="status-critical">YES</span></td></tr>
-        </table>
-        
-        <div class="result">
-            <strong>Key Finding:</strong> Minor axis buckling governs due to smaller moment of inertia.<br>
-            <strong>Slenderness Ratio:</strong> Le/b = {LE}/{B} = {SLENDERNESS}<br>
-            <strong>Classification:</strong> {SLENDER_CLASS} (Limit = 22 for braced frames)
-        </div>
-    </div>
-
-    <div class="section">
-        <h3>Method C Analysis - Effective Stiffness</h3>
-        
-        <div class="calc-box">
-            <h4>Method 1: Conservative Approach (ACI 318-19 Eq. 6.6.4.4.4a)</h4>
-            <div class="equation">
-                (EI)eff = 0.4 × Ec × Ig / (1 + βdns)<br>
-                = 0.4 × {EC} × {IG} / (1 + {BETADNS})<br>
-                = {EI_METHOD1} kN·m²
-            </div>
-        </div>
-
-        <div class="calc-box">
-            <h4>Method 2: Refined Approach (ACI 318-19 Eq. 6.6.4.4.4c)</h4>
-            <div class="equation">
-                (EI)eff = Ec × Ig × Ifactor / (1 + βdns)<br>
-                = {EC} × {IG} × 0.70 / (1 + {BETADNS})<br>
-                = {EI_METHOD2} kN·m²
-            </div>
-            <p><em>where Ifactor = 0.70 (conservative estimate per Table 6.6.3.1.1(b))</em></p>
-        </div>
-    </div>
-
-    <div class="section">
-        <h3>Critical Buckling Load & Moment Magnification</h3>
-        
-        <div class="equation">
-            <strong>Critical Buckling Load (ACI 318-19 Eq. 6.6.4.4.2):</strong><br>
-            Pc = π² × (EI)eff / (Le)²
-        </div>
-
-        <table>
-            <tr><th>Method</th><th>Pc (kN)</th><th>0.75Pc (kN)</th><th>Pu/0.75Pc</th><th>Status</th></tr>
-            <tr><td>Method 1</td><td>{PC_METHOD1}</td><td>{PC75_METHOD1}</td><td>{RATIO1}</td><td class="status-ok">{STATUS1}</td></tr>
-            <tr><td>Method 2</td><td>{PC_METHOD2}</td><td>{PC75_METHOD2}</td><td>{RATIO2}</td><td class="status-ok">{STATUS2}</td></tr>
-        </table>
-
-        <div class="equation">
-            <strong>Moment Magnification Factor (ACI 318-19 Eq. 6.6.4.5.2):</strong><br>
-            δns = Cm / (1 - Pu/0.75Pc) ≥ 1.0
-        </div>
-
-        <table>
-            <tr><th>Method</th><th>δns</th><th>Magnified Moment Mc (kN·m)</th></tr>
-            <tr><td>Method 1</td><td>{DELTANS_METHOD1}</td><td>{MC_METHOD1}</td></tr>
-            <tr><td>Method 2</td><td>{DELTANS_METHOD2}</td><td>{MC_METHOD2}</td></tr>
-        </table>
-    </div>
-
-    <div class="diagram">
-        <h3>Column Cross-Section</h3>
-        <p><strong>Column {COLUMN_ID}</strong></p>
-        <p>Dimensions: {B} mm × {H} mm</p>
-        <p>Reinforcement: {REBAR_COUNT} × {REBAR_SIZE} mm</p>
-        <p>Steel Ratio: ρ = {RHO}%</p>
-        <div style="margin: 20px; padding: 20px; border: 2px solid #333; display: inline-block;">
-            <div style="font-size: 8pt; color: #666;">
-                [Cross-section diagram would be shown here]<br>
-                Critical buckling about {B}mm direction (minor axis)
-            </div>
-        </div>
-    </div>
-
-    <div class="section">
-        <h3>Design Verification Summary</h3>
-        <table>
-            <tr><th>Requirement</th><th>Status</th><th>Reference</th></tr>
-            <tr><td>Slenderness Limits</td><td class="status-ok">OK</td><td>ACI 6.2.5</td></tr>
-            <tr><td>Method C Applicability</td><td class="status-ok">OK</td><td>ACI 6.6.4.4.2</td></tr>
-            <tr><td>Moment Magnification</td><td class="status-ok">OK</td><td>ACI 6.6.4.5.2</td></tr>
-            <tr><td>Strength Interaction</td><td class="status-ok">OK</td><td>ACI 22.4</td></tr>
-        </table>
-    </div>
-
-    <div class="result">
-        <h3>Conclusion</h3>
-        <p>The ACI 318-19 Method C analysis demonstrates that Column {COLUMN_ID} satisfies all applicable code requirements for slenderness and stability. The moment magnification approach provides adequate safety factors while maintaining structural efficiency.</p>
-        
-        <p><strong>Key Design Features:</strong></p>
-        <ul>
-            <li>Critical buckling direction properly identified (minor axis)</li>
-            <li>Method C applicability verified (Pu < 0.75Pc)</li>
-            <li>Conservative and refined stiffness approaches compared</li>
-            <li>Complete ACI 318-19 Section 6.6 compliance</li>
-        </ul>
-    </div>
-
-    <table class="signature-table">
-        <tr><th>Prepared By</th><th>Reviewed By</th></tr>
-        <tr>
-            <td>Ahmed Ghali, P.E.<br>Professional Engineer<br>Date: {DATE}</td>
-            <td>Senior Engineer, P.E.<br>Professional Engineer<br>Date: ____________</td>
-        </tr>
-    </table>
-
-    <div class="footer">
-        <p><strong>References:</strong></p>
-        <p>ACI Committee 318. (2019). <em>Building Code Requirements for Structural Concrete (ACI 318-19) and Commentary</em>. American Concrete Institute, Farmington Hills, MI.</p>
-        <p><small>This calculation follows ACI 318-19 Method C requirements and professional engineering standards. All calculations and results are subject to independent review and verification per professional engineering protocols.</small></p>
-    </div>
-</body>
-</html>
-"""
+def create_aci318_method_c_html():
+    """Load HTML template for ACI 318-19 Method C (unrendered source)"""
+    return template_source(METHOD_C_HTML_TEMPLATE)
 
-def generate_aci318_method_c_html(project_id="GC-COL-2025"):
-    """Generate HTML version of ACI 318-19 Method C calculation"""
+@traced('aci318_method_c_html_generator')
+def generate_aci318_method_c_html(project_id="GC-COL-2025", output_html=None, open_browser=True):
+    """
+    Generate HTML version of ACI 318-19 Method C calculation
+    
+    Args:
+        project_id (str): Project identifier
+        output_html (str, optional): Destination (defaults to
+            output/ACI318_Method_C_Column_Design.html)
+        open_browser (bool): Open the page in the default browser
+        
+    Returns:
+        str: Path to generated HTML file
+    """
     print("🏗️  GHALI CONSULTANTS - ACI 318-19 Method C HTML Generator")
     print("=" * 62)
+    from scripts.calculations.aci318_method_c_engine import column_adequate, column_checks
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import column_c36_data
     
-    # Column C36 data
+    trace = current_trace()
+    
+    # Column C36 data, computed by the Method C engine
+    c = column_c36_data()
+    checks = column_checks(c)
+    depth_name = 'b' if c['axis'] == 'minor' else 'h'
     data = {
-        'DATE': '2025-01-21',
-        'PROJECT_ID': project_id,
-        'COLUMN_ID': 'C36 (297)',
-        'FC_PRIME': '11.0',
-        'FY': '500',
-        'EC': '15,588.1',
-        'B': '200',
-        'H': '1000',
-        'LU': '2900',
-        'LE': '2900',
-        'AG': '200,000',
-        'IG': '666,666,667',
-        'AS': '2412.7',
-        'PU': '1583.5',
-        'M1U': '8.0383',
-        'M2U': '10.9098',
-        'PSUS': '1583.5',
-        'BETADNS': '1.00',
-        'CM': '0.3053',
-        'IMAJOR': '16,666,666,667',
-        'IMINOR': '666,666,667',
-        'SLENDERNESS': '14.5',
-        'SLENDER_CLASS': 'SHORT',
-        'EI_METHOD1': '51,960.5',
-        'EI_METHOD2': '90,930.8',
-        'PC_METHOD1': '15,695.0',
-        'PC_METHOD2': '27,465.0',
-        'PC75_METHOD1': '11,771.25',
-        'PC75_METHOD2': '20,598.75',
-        'RATIO1': '0.1345',
-        'RATIO2': '0.0769',
-        'STATUS1': 'OK',
-        'STATUS2': 'OK',
-        'DELTANS_METHOD1': '1.00',
-        'DELTANS_METHOD2': '1.00',
-        'MC_METHOD1': '10.91',
-        'MC_METHOD2': '10.91',
-        'REBAR_COUNT': '12',
-        'REBAR_SIZE': 'Ø16',
-        'RHO': '1.21'
+        'date': '2025-01-21',
+        'axis': c['axis'],
+        'depth_name': depth_name,
+        'depth': f"{c[depth_name]:.0f}",
+        'project_id': project_id,
+        'column_id': c['column_id'],
+        'fc_prime': f"{c['fc_prime']:.1f}",
+        'fy': f"{c['fy']:.0f}",
+        'ec': f"{c['ec']:,.1f}",
+        'b': f"{c['b']:.0f}",
+        'h': f"{c['h']:.0f}",
+        'lu': f"{c['lu']:.0f}",
+        'le': f"{c['le']:.0f}",
+        'ag': f"{c['ag']:,.0f}",
+        'ig': f"{c['ig']:,.0f}",
+        'as_total': f"{c['as_total']:.1f}",
+        'pu': f"{c['pu']:.1f}",
+        'm1u': f"{c['m1u']:.4f}",
+        'm2u': f"{c['m2u']:.4f}",
+        'psus': f"{c['psus']:.1f}",
+        'betadns': f"{c['beta_dns']:.2f}",
+        'cm': f"{c['cm']:.4f}",
+        'imajor': f"{c['imajor']:,.0f}",
+        'iminor': f"{c['iminor']:,.0f}",
+        'slenderness': f"{c['slenderness']:.1f}",
+        'slender_class': c['slender_class'],
+        'ei_method1': f"{c['ei_method1']:,.1f}",
+        'ei_method2': f"{c['ei_method2']:,.1f}",
+        'i_factor': f"{c['i_factor']:.2f}",
+        'pc_method1': f"{c['pc_method1']:,.1f}",
+        'pc_method2': f"{c['pc_method2']:,.1f}",
+        'pc75_method1': f"{c['pc75_method1']:,.2f}",
+        'pc75_method2': f"{c['pc75_method2']:,.2f}",
+        'ratio1': f"{c['ratio1']:.4f}",
+        'ratio2': f"{c['ratio2']:.4f}",
+        'status1': 'OK' if c['ratio1'] < 1.0 else 'NOT OK',
+        'status2': 'OK' if c['ratio2'] < 1.0 else 'NOT OK',
+        'deltans_method1': format_value(c['deltans_method1'], '.2f'),
+        'deltans_method2': format_value(c['deltans_method2'], '.2f'),
+        'm2_min': f"{c['m2_min']:.2f}",
+        'mc_method1': format_value(c['mc_method1'], '.2f'),
+        'mc_method2': format_value(c['mc_method2'], '.2f'),
+        'rebar_count': c['rebar_count'],
+        'rebar_size': c['rebar_size'],
+        'rho': f"{c['rho']:.2f}",
+        'adequate': column_adequate(checks),
+        'checks': [('Slenderness Limits', checks['slenderness'], 'ACI 6.2.5'),
+                   ('Method C Applicability', checks['method_c'], 'ACI 6.6.4.4.2'),
+                   ('Moment Magnification', checks['magnification'], 'ACI 6.6.4.5.2'),
+                   ('Strength Interaction', checks['interaction'], 'ACI 22.4')]
     }
     
-    # Create HTML content
-    html_content = create_aci318_method_c_html()
-    
-    # Replace placeholders
-    for key, value in data.items():
-        html_content = html_content.replace(f'{{{key}}}', str(value))
+    # Render HTML content in one pass
+    with trace.stage('template'):
+        html_content = render(METHOD_C_HTML_TEMPLATE, **data)
     
     # Save HTML file
-    output_dir = project_root / "output"
-    output_dir.mkdir(exist_ok=True)
-    html_file = output_dir / "ACI318_Method_C_Column_Design.html"
+    html_file = Path(output_html) if output_html else \
+        project_root / "output" / "ACI318_Method_C_Column_Design.html"
+    html_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(html_file, 'w', encoding='utf-8') as f:
+    with trace.stage('write'), open(html_file, 'w', encoding='utf-8') as f:
         f.write(html_content)
+    trace.file_written(html_file)
     
     print(f"✅ HTML calculation sheet created: {html_file}")
     print(f"📄 Size: {html_file.stat().st_size / 1024:.1f} KB")
     
     # Open in browser
-    webbrowser.open(f"file://{html_file.absolute()}")
-    print("🌐 Opened in default browser")
+    if open_browser:
+        import webbrowser
+        webbrowser.open(f"file://{html_file.absolute()}")
+        print("🌐 Opened in default browser")
     
     return str(html_file)
 
@@ -456,8 +135,10 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Generate ACI 318-19 Method C HTML')
     parser.add_argument('--project-id', default='GC-COL-2025', help='Project ID')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
     html_path = generate_aci318_method_c_html(args.project_id)
     
@@ -8,72 +8,72 @@ Author: Ghali Consultants
 Version: 1.0 ACI 318-19 Method C Style
 """
 
-import os
 import sys
-import subprocess
 import tempfile
 import shutil
-import math
+import time
 from pathlib import Path
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
+from scripts.pdf_generators.pdf_cache import get_default_cache
+from scripts.pdf_generators.latex_format import run_pdflatex
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+from scripts.pdf_generators.template_engine import render, template_source
+
+METHOD_C_TEMPLATE = "aci318_method_c_template.tex"
+
 def create_aci318_method_c_template():
-    """Load ACI 318-19 Method C LaTeX template"""
-    template_path = project_root / "templates" / "aci318_method_c_template.tex"
+    """Load ACI 318-19 Method C LaTeX template (unrendered source)"""
+    return template_source(METHOD_C_TEMPLATE)
+
+# Column C36 (297) of the Method C notebook, with its raw ETABS station end moments
+C36_COLUMN = {
+    'project_id': 'GC-COL-2025',
+    'column_id': 'C36 (297)',
+    'b': 200.0,
+    'h': 1000.0,
+    'lu': 2900.0,
+    'pu': 1583.5,
+    'm22_i': -10.9098,
+    'm22_j': 8.0383,
+    'm33_i': -37.084,
+    'm33_j': 21.4335,
+    'fc_prime': 11.0,
+    'fy': 500.0,
+    'n_bars': 12,
+    'bar_diameter': 16.0
+}
+
+def column_c36_data():
+    """Method C sheet values of Column C36, computed with aci318_method_c_engine"""
+    from scripts.calculations.aci318_method_c_engine import (analyze_columns, column_sheet_data,
+                                                             end_moments_to_aci)
     
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    c = C36_COLUMN
+    M1_minor, M2_minor = end_moments_to_aci(c['m22_i'], c['m22_j'])
+    M1_major, M2_major = end_moments_to_aci(c['m33_i'], c['m33_j'])
+    results = analyze_columns(c['b'], c['h'], c['lu'], c['pu'], M1_minor, M2_minor,
+                              M1_major, M2_major, c['fc_prime'], c['fy'],
+                              c['n_bars'], c['bar_diameter'])
+    return {
+        'project_id': c['project_id'],
+        'column_id': c['column_id'],
+        **column_sheet_data(results, 0),
+        'rebar_count': f"{c['n_bars']:.0f}",
+        'rebar_size': f"Ø{c['bar_diameter']:.0f}"
+    }
 
 def extract_notebook_data(notebook_path):
     """Extract calculation data from the ACI 318-19 Method C notebook"""
     import json
     
     # Default values for Column C36
-    default_data = {
-        'project_id': 'GC-COL-2025',
-        'column_id': 'C36 (297)',
-        'fc_prime': 11.0,
-        'fy': 500.0,
-        'ec': 15588.1,
-        'b': 200.0,
-        'h': 1000.0,
-        'lu': 2900.0,
-        'le': 2900.0,
-        'ag': 200000.0,
-        'ig': 666666667.0,  # Minor axis
-        'imajor': 16666666667.0,  # Major axis
-        'iminor': 666666667.0,    # Minor axis (critical)
-        'as_total': 2412.743,
-        'pu': 1583.5,
-        'm1u': 8.0383,
-        'm2u': 10.9098,
-        'psus': 1583.5,
-        'beta_dns': 1.0,
-        'cm': 0.3053,
-        'slenderness': 14.5,
-        'slender_class': 'SHORT',
-        'ei_method1': 51960.5,
-        'ei_method2': 90930.8,
-        'pc_method1': 15695.0,
-        'pc_method2': 27465.0,
-        'pc75_method1': 11771.25,
-        'pc75_method2': 20598.75,
-        'ratio1': 0.1345,
-        'ratio2': 0.0769,
-        'status1': '\\textcolor{ghaligreen}{\\textbf{OK}}',
-        'status2': '\\textcolor{ghaligreen}{\\textbf{OK}}',
-        'deltans_method1': 1.00,
-        'deltans_method2': 1.00,
-        'mc_method1': 10.91,
-        'mc_method2': 10.91,
-        'rebar_count': '12',
-        'rebar_size': 'Ø16',
-        'rho': 1.21
-    }
+    default_data = column_c36_data()
     
     # Try to read notebook if provided
     if notebook_path and Path(notebook_path).exists():
@@ -91,180 +91,182 @@ def extract_notebook_data(notebook_path):
     
     return default_data
 
-def create_column_section_diagram(column_data):
-    """Create a simple column cross-section diagram"""
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
+def render_column_latex(column_data, project_id="GC-COL-2025"):
+    """Render the Method C LaTeX source of one column, with its compliance checks"""
+    from scripts.calculations.aci318_method_c_engine import column_checks
     
-    fig, ax = plt.subplots(1, 1, figsize=(6, 8))
-    
-    # Column dimensions
-    b = column_data['b'] / 1000  # Convert to meters for display
-    h = column_data['h'] / 1000
-    
-    # Draw column outline
-    column_rect = patches.Rectangle((-b/2, -h/2), b, h, 
-                                   linewidth=2, edgecolor='black', 
-                                   facecolor='lightgray', alpha=0.3)
-    ax.add_patch(column_rect)
+    return render(METHOD_C_TEMPLATE, project_id=project_id, column=column_data,
+                  checks=column_checks(column_data))
+
+def draw_column_section(column_data):
+    """Draw the column cross-section on a standalone matplotlib Figure"""
+    import matplotlib.patches as patches
+    from matplotlib.figure import Figure
+    from scripts.utilities.structural_plotting import plot_style
     
-    # Draw reinforcement bars (simplified 12-bar arrangement)
-    bar_positions = [
-        # Top bars (6 bars in direction 2)
-        (-b/2 + 0.05, h/2 - 0.05), (-b/2 + 0.05 + b/6, h/2 - 0.05), 
-        (-b/2 + 0.05 + 2*b/6, h/2 - 0.05), (-b/2 + 0.05 + 3*b/6, h/2 - 0.05),
-        (-b/2 + 0.05 + 4*b/6, h/2 - 0.05), (b/2 - 0.05, h/2 - 0.05),
+    with plot_style():
+        fig = Figure(figsize=(6, 8))
+        ax = fig.add_subplot(1, 1, 1)
         
-        # Side bars (2 bars in direction 3)
-        (-b/2 + 0.05, 0), (b/2 - 0.05, 0),
+        # Column dimensions
+        b = column_data['b'] / 1000  # Convert to meters for display
+        h = column_data['h'] / 1000
         
-        # Bottom bars (mirror of top)
-        (-b/2 + 0.05, -h/2 + 0.05), (-b/2 + 0.05 + b/6, -h/2 + 0.05), 
-        (-b/2 + 0.05 + 2*b/6, -h/2 + 0.05), (-b/2 + 0.05 + 3*b/6, -h/2 + 0.05),
-    ]
-    
-    # Actually only place 12 bars total
-    for i, (x, y) in enumerate(bar_positions[:12]):
-        circle = patches.Circle((x, y), 0.008, facecolor='red', edgecolor='darkred')
-        ax.add_patch(circle)
-    
-    # Add dimensions
-    ax.annotate(f'{column_data["b"]:.0f} mm', xy=(0, -h/2 - 0.1), ha='center', fontsize=10)
-    ax.annotate(f'{column_data["h"]:.0f} mm', xy=(-b/2 - 0.1, 0), ha='center', 
-                rotation=90, fontsize=10)
-    
-    # Add direction arrows
-    ax.arrow(-b/2 - 0.15, -h/4, 0, h/2, head_width=0.02, head_length=0.03, 
-             fc='blue', ec='blue')
-    ax.text(-b/2 - 0.2, 0, 'Direction 3\n(h)', ha='center', va='center', 
-            rotation=90, color='blue', fontsize=9)
-    
-    ax.arrow(-b/4, -h/2 - 0.15, b/2, 0, head_width=0.02, head_length=0.03, 
-             fc='blue', ec='blue')
-    ax.text(0, -h/2 - 0.25, 'Direction 2 (b)', ha='center', va='center', 
-            color='blue', fontsize=9)
-    
-    # Critical buckling direction note
-    ax.text(b/2 + 0.1, h/2, 'Critical buckling\nabout minor axis\n(200mm direction)', 
-            ha='left', va='top', fontsize=8, color='red', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-    
-    ax.set_xlim(-b/2 - 0.3, b/2 + 0.3)
-    ax.set_ylim(-h/2 - 0.3, h/2 + 0.2)
-    ax.set_aspect('equal')
-    ax.set_title(f'Column {column_data["column_id"]} Cross-Section\n12 × Ø16mm Reinforcement', 
-                 fontsize=12, fontweight='bold')
-    ax.grid(True, alpha=0.3)
-    ax.axis('off')
+        # Draw column outline
+        column_rect = patches.Rectangle((-b/2, -h/2), b, h, 
+                                       linewidth=2, edgecolor='black', 
+                                       facecolor='lightgray', alpha=0.3)
+        ax.add_patch(column_rect)
+        
+        # Draw reinforcement bars (simplified 12-bar arrangement)
+        bar_positions = [
+            # Top bars (6 bars in direction 2)
+            (-b/2 + 0.05, h/2 - 0.05), (-b/2 + 0.05 + b/6, h/2 - 0.05), 
+            (-b/2 + 0.05 + 2*b/6, h/2 - 0.05), (-b/2 + 0.05 + 3*b/6, h/2 - 0.05),
+            (-b/2 + 0.05 + 4*b/6, h/2 - 0.05), (b/2 - 0.05, h/2 - 0.05),
+            
+            # Side bars (2 bars in direction 3)
+            (-b/2 + 0.05, 0), (b/2 - 0.05, 0),
+            
+            # Bottom bars (mirror of top)
+            (-b/2 + 0.05, -h/2 + 0.05), (-b/2 + 0.05 + b/6, -h/2 + 0.05), 
+            (-b/2 + 0.05 + 2*b/6, -h/2 + 0.05), (-b/2 + 0.05 + 3*b/6, -h/2 + 0.05),
+        ]
+        
+        # Actually only place 12 bars total
+        for i, (x, y) in enumerate(bar_positions[:12]):
+            circle = patches.Circle((x, y), 0.008, facecolor='red', edgecolor='darkred')
+            ax.add_patch(circle)
+        
+        # Add dimensions
+        ax.annotate(f'{column_data["b"]:.0f} mm', xy=(0, -h/2 - 0.1), ha='center', fontsize=10)
+        ax.annotate(f'{column_data["h"]:.0f} mm', xy=(-b/2 - 0.1, 0), ha='center', 
+                    rotation=90, fontsize=10)
+        
+        # Add direction arrows
+        ax.arrow(-b/2 - 0.15, -h/4, 0, h/2, head_width=0.02, head_length=0.03, 
+                 fc='blue', ec='blue')
+        ax.text(-b/2 - 0.2, 0, 'Direction 3\n(h)', ha='center', va='center', 
+                rotation=90, color='blue', fontsize=9)
+        
+        ax.arrow(-b/4, -h/2 - 0.15, b/2, 0, head_width=0.02, head_length=0.03, 
+                 fc='blue', ec='blue')
+        ax.text(0, -h/2 - 0.25, 'Direction 2 (b)', ha='center', va='center', 
+                color='blue', fontsize=9)
+        
+        # Critical buckling direction note
+        ax.text(b/2 + 0.1, h/2, 'Critical buckling\nabout minor axis\n(200mm direction)', 
+                ha='left', va='top', fontsize=8, color='red', 
+                bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        ax.set_xlim(-b/2 - 0.3, b/2 + 0.3)
+        ax.set_ylim(-h/2 - 0.3, h/2 + 0.2)
+        ax.set_aspect('equal')
+        ax.set_title(f'Column {column_data["column_id"]} Cross-Section\n12 × Ø16mm Reinforcement', 
+                     fontsize=12, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.axis('off')
+        fig.tight_layout()
+        
+    return fig
+
+def create_column_section_diagram(column_data):
+    """Create a simple column cross-section diagram"""
+    from scripts.utilities.structural_plotting import serialize_figure
     
     # Save figure
     output_dir = project_root / "reports" / "figures"
     output_dir.mkdir(exist_ok=True)
     output_path = output_dir / "column_section.pdf"
-    
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    output_path.write_bytes(serialize_figure(draw_column_section(column_data), 'pdf', dpi=150))
     
     return str(output_path)
 
-def generate_aci318_method_c_pdf(notebook_path=None, project_id="GC-COL-2025"):
+@traced('aci318_method_c_pdf_generator')
+def generate_aci318_method_c_pdf(notebook_path=None, project_id="GC-COL-2025", use_cache=True,
+                                 engine="latex"):
     """
     Generate ACI 318-19 Method C PDF for column design analysis
     
     Args:
         notebook_path (str): Path to the notebook file
         project_id (str): Project identifier
+        use_cache (bool): Reuse a previously compiled PDF with identical inputs
+        engine (str): "latex" (pdflatex) or "reportlab" (pure Python, no LaTeX)
         
     Returns:
         str: Path to generated PDF file
     """
+    from scripts.utilities.structural_plotting import serialize_figure
+    
     print("🏗️  GHALI CONSULTANTS - ACI 318-19 Method C Generator")
     print("=" * 58)
+    trace = current_trace()
     
     # Step 1: Extract data from notebook or use defaults
     print("1. Extracting column design data...")
-    column_data = extract_notebook_data(notebook_path)
+    with trace.stage('extract'):
+        column_data = extract_notebook_data(notebook_path)
+    output_pdf = project_root / "output" / "ACI318_Method_C_Column_Design.pdf"
     
-    # Step 2: Create column section diagram
+    if engine == "reportlab":
+        from scripts.pdf_generators.reportlab_renderer import render_column_sheet
+        
+        print("2. Rendering ACI 318-19 Method C sheet with reportlab...")
+        start = time.perf_counter()
+        with trace.stage('render', engine='reportlab'):
+            render_column_sheet(column_data, output_pdf, project_id)
+        trace.file_written(output_pdf)
+        print(f"   ✓ ACI 318-19 PDF created: {output_pdf}")
+        print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+        print(f"   ⏱️ reportlab {time.perf_counter() - start:.2f} s")
+        return str(output_pdf)
+    
+    # Step 2: Create column section diagram (in memory, written once into the build directory)
     print("2. Generating column cross-section diagram...")
-    section_path = create_column_section_diagram(column_data)
-    print(f"   ✓ Generated: {Path(section_path).name}")
+    diagram_file = "column_section.pdf"
+    with trace.stage('plots'):
+        figures = {diagram_file: serialize_figure(draw_column_section(column_data), 'pdf',
+                                                  dpi=150)}
+    trace.figures(figures)
+    print(f"   ✓ Generated: {diagram_file}")
     
-    # Step 3: Create LaTeX document
+    # Step 3: Render LaTeX document in one pass
     print("3. Creating ACI 318-19 Method C calculation sheet...")
-    latex_content = create_aci318_method_c_template()
-    
-    # Step 4: Replace placeholders with actual data
-    replacements = {
-        'PROJECT_ID_PLACEHOLDER': project_id,
-        'COLUMN_ID_PLACEHOLDER': column_data['column_id'],
-        'FC_PRIME_PLACEHOLDER': f"{column_data['fc_prime']:.1f}",
-        'FY_PLACEHOLDER': f"{column_data['fy']:.0f}",
-        'EC_PLACEHOLDER': f"{column_data['ec']:,.1f}",
-        'B_PLACEHOLDER': f"{column_data['b']:.0f}",
-        'H_PLACEHOLDER': f"{column_data['h']:.0f}",
-        'LU_PLACEHOLDER': f"{column_data['lu']:.0f}",
-        'LE_PLACEHOLDER': f"{column_data['le']:.0f}",
-        'AG_PLACEHOLDER': f"{column_data['ag']:,.0f}",
-        'IG_PLACEHOLDER': f"{column_data['ig']:,.0f}",
-        'AS_PLACEHOLDER': f"{column_data['as_total']:.1f}",
-        'PU_PLACEHOLDER': f"{column_data['pu']:.1f}",
-        'M1U_PLACEHOLDER': f"{column_data['m1u']:.4f}",
-        'M2U_PLACEHOLDER': f"{column_data['m2u']:.4f}",
-        'PSUS_PLACEHOLDER': f"{column_data['psus']:.1f}",
-        'BETADNS_PLACEHOLDER': f"{column_data['beta_dns']:.2f}",
-        'CM_PLACEHOLDER': f"{column_data['cm']:.4f}",
-        'IMAJOR_PLACEHOLDER': f"{column_data['imajor']:,.0f}",
-        'IMINOR_PLACEHOLDER': f"{column_data['iminor']:,.0f}",
-        'SLENDERNESS_PLACEHOLDER': f"{column_data['slenderness']:.1f}",
-        'SLENDER_CLASS_PLACEHOLDER': column_data['slender_class'],
-        'EI_METHOD1_PLACEHOLDER': f"{column_data['ei_method1']:,.1f}",
-        'EI_METHOD2_PLACEHOLDER': f"{column_data['ei_method2']:,.1f}",
-        'PC_METHOD1_PLACEHOLDER': f"{column_data['pc_method1']:,.1f}",
-        'PC_METHOD2_PLACEHOLDER': f"{column_data['pc_method2']:,.1f}",
-        'PC75_METHOD1_PLACEHOLDER': f"{column_data['pc75_method1']:,.1f}",
-        'PC75_METHOD2_PLACEHOLDER': f"{column_data['pc75_method2']:,.1f}",
-        'RATIO1_PLACEHOLDER': f"{column_data['ratio1']:.4f}",
-        'RATIO2_PLACEHOLDER': f"{column_data['ratio2']:.4f}",
-        'STATUS1_PLACEHOLDER': column_data['status1'],
-        'STATUS2_PLACEHOLDER': column_data['status2'],
-        'DELTANS_METHOD1_PLACEHOLDER': f"{column_data['deltans_method1']:.2f}",
-        'DELTANS_METHOD2_PLACEHOLDER': f"{column_data['deltans_method2']:.2f}",
-        'MC_METHOD1_PLACEHOLDER': f"{column_data['mc_method1']:.2f}",
-        'MC_METHOD2_PLACEHOLDER': f"{column_data['mc_method2']:.2f}",
-        'REBAR_COUNT_PLACEHOLDER': column_data['rebar_count'],
-        'REBAR_SIZE_PLACEHOLDER': column_data['rebar_size'],
-        'RHO_PLACEHOLDER': f"{column_data['rho']:.2f}"
-    }
-    
-    for placeholder, value in replacements.items():
-        latex_content = latex_content.replace(placeholder, value)
+    with trace.stage('template'):
+        latex_content = render_column_latex(column_data, project_id)
     
-    # Step 5: Compile PDF
+    # Step 4: Compile PDF
     print("4. Compiling ACI 318-19 Method C PDF...")
+    with trace.stage('compile'):
+        return _compile(latex_content, figures, output_pdf, use_cache)
+
+def _compile(latex_content, figures, output_pdf, use_cache):
+    """Compile the rendered sheet (or fetch it from the cache)"""
+    from scripts.utilities.structural_plotting import write_figure_files
+    
+    trace = current_trace()
+    cache = get_default_cache() if use_cache else None
+    if cache is not None:
+        cache_key = cache.compute_key(latex_content, figure_data=figures)
+        hit = cache.fetch(cache_key, output_pdf)
+        trace.cache(hit)
+        if hit:
+            print(f"   ⚡ ACI 318-19 PDF reused from cache: {output_pdf}")
+            return str(output_pdf)
     
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         tex_file = temp_path / "aci318_method_c_calculation.tex"
-        
-        # Write LaTeX content
-        with open(tex_file, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
-        
-        # Copy diagram file
-        reports_dir = project_root / "reports" / "figures"
-        diagram_file = "column_section.pdf"
-        
-        source = reports_dir / diagram_file
-        if source.exists():
-            shutil.copy2(source, temp_path)
+
+        write_figure_files(figures, temp_path)
         
         # Compile PDF with pdflatex
         try:
-            result = subprocess.run([
-                'pdflatex', '-interaction=nonstopmode', tex_file.name
-            ], cwd=temp_path, capture_output=True, text=True)
+            start = time.perf_counter()
+            result = run_pdflatex(tex_file, latex_content, 'aci318_method_c')
+            trace.latex_run(result, time.perf_counter() - start)
+            trace.file_written(tex_file, 'tex')
             
             if result.returncode == 0:
                 # Copy to output
@@ -272,12 +274,15 @@ def generate_aci318_method_c_pdf(notebook_path=None, project_id="GC-COL-2025"):
                 output_dir.mkdir(exist_ok=True)
                 
                 pdf_file = temp_path / "aci318_method_c_calculation.pdf"
-                output_pdf = output_dir / "ACI318_Method_C_Column_Design.pdf"
                 
                 if pdf_file.exists():
                     shutil.copy2(pdf_file, output_pdf)
+                    if cache is not None:
+                        cache.store(cache_key, pdf_file)
+                    trace.file_written(output_pdf)
                     print(f"   ✓ ACI 318-19 PDF created: {output_pdf}")
                     print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+                    print(f"   ⏱️ {result.describe()}")
                     return str(output_pdf)
             else:
                 print(f"   ❌ LaTeX compilation failed")
@@ -294,13 +299,19 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate ACI 318-19 Method C PDF')
     parser.add_argument('--notebook', help='Path to notebook file')
     parser.add_argument('--project-id', default='GC-COL-2025', help='Project ID')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    parser.add_argument('--engine', choices=['latex', 'reportlab'], default='latex',
+                        help='PDF engine: pdflatex or pure-Python reportlab')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
     # Default to the Method C notebook
-    notebook_path = args.notebook or str(project_root / "notebooks" / "aci318_column_design_method_c.ipynb")
+    notebook_path = args.notebook or str(project_root / "notebooks" / "column_design" / "aci318_column_design_method_c.ipynb")
     
-    pdf_path = generate_aci318_method_c_pdf(notebook_path, args.project_id)
+    pdf_path = generate_aci318_method_c_pdf(notebook_path, args.project_id, use_cache=not args.no_cache,
+                                            engine=args.engine)
     
     if pdf_path:
         print(f"\n🏗️  SUCCESS! ACI 318-19 Method C PDF generated")
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Batch PDF Builder
+====================================
+Compiles many beam and column calculation sheets in parallel.
+
+Sheets are built in two pipelined stages. A process pool draws each job's
+figures in memory and renders its LaTeX; finished sheets are queued
+straight onto a LatexWorkerPool, which writes the figures once into the
+sheet's build directory and whose warm workers compile them
+with bounded concurrency and a per-sheet timeout while later jobs are still
+being prepared. Every job writes a uniquely named PDF, so hundreds of
+sheets can be produced on all available cores without clobbering each other.
+
+With engine="reportlab" each worker process renders its sheets completely,
+figures drawn in memory and no pdflatex at all (see reportlab_renderer);
+this is the fast path for high-volume batches.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.pdf_generators.pdf_generator_system import GhaliPDFGenerator
+from scripts.pdf_generators.cambridge_pdf_generator import FIGURE_FILES
+from scripts.pdf_generators.latex_worker_pool import DEFAULT_TIMEOUT, LatexWorkerPool, _percentile
+from scripts.pdf_generators.pdf_cache import get_default_cache
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+
+COLUMN_STYLE = 'aci318_method_c'      # pdflatex format of column sheets
+COLUMN_FIGURE = 'column_section.pdf'
+COLUMN_PROJECT_ID = 'GC-COL-2025'
+
+
+def _safe_name(text: str) -> str:
+    """Make a string safe for use as a file name"""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', str(text)).strip('_')
+
+
+def _normalize_job(job: Union[Dict, tuple]) -> Dict:
+    """Accept (beam_data, project_info) tuples or beam/column job dictionaries"""
+    if isinstance(job, dict) and 'column_data' in job:
+        return {
+            'column_data': job['column_data'],
+            'project_info': job.get('project_info'),
+            'name': job.get('name'),
+            'output_dir': job.get('output_dir')
+        }
+
+    if isinstance(job, dict) and 'beam_data' in job:
+        return {
+            'beam_data': job['beam_data'],
+            'project_info': job.get('project_info'),
+            'name': job.get('name'),
+            'output_dir': job.get('output_dir')
+        }
+
+    beam_data, project_info = job
+    return {'beam_data': beam_data, 'project_info': project_info, 'name': None,
+            'output_dir': None}
+
+
+def job_output_name(index: int, job: Dict, template_style: str) -> str:
+    """
+    Build a unique output name for a batch job
+
+    Args:
+        index (int): Position of the job in the batch
+        job (Dict): Normalized job dictionary
+        template_style (str): "standard" or "cambridge"
+
+    Returns:
+        str: File stem for the job's .tex and .pdf files
+    """
+    if job.get('name'):
+        return _safe_name(job['name'])
+
+    project_id = (job.get('project_info') or {}).get('project_id', 'GC')
+    if 'column_data' in job:
+        return f"{_safe_name(project_id)}_{index:04d}_ACI318_Method_C_Column_Design"
+    return f"{_safe_name(project_id)}_{index:04d}_{template_style.title()}_Beam_Design"
+
+
+def prepare_job(index: int, beam_data: Dict, project_info: Optional[Dict],
+                output_name: str, template_style: str) -> Dict:
+    """
+    Draw one sheet's figures in memory and render its LaTeX (runs in a worker process)
+
+    Args:
+        index (int): Position of the job in the batch
+        beam_data (Dict): Beam parameters
+        project_info (Dict, optional): Project information
+        output_name (str): Unique file stem for the output PDF
+        template_style (str): "standard" or "cambridge"
+
+    Returns:
+        Dict: Job index, name, status, rendered LaTeX, figures (file name →
+        PDF bytes), preparation time with its plots/template split and, on
+        error, the captured log
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    result = {'index': index, 'name': output_name, 'output': None, 'status': 'ok',
+              'stages': {}}
+
+    try:
+        generator = GhaliPDFGenerator(template_style=template_style, use_cache=False)
+        if project_info is None:
+            project_info = generator._get_default_project_info(beam_data)
+
+        with redirect_stdout(log):
+            plots_start = time.perf_counter()
+            plots_data = generator.generate_plots(beam_data, in_memory=True)
+            template_start = time.perf_counter()
+            template = generator.load_template()
+            result['latex_content'] = generator.populate_template(template, beam_data,
+                                                                  project_info)
+            result['stages'] = {'plots': template_start - plots_start,
+                                'template': time.perf_counter() - template_start}
+        result['figures'] = {figure_file: plots_data['files'][figure_file]
+                             for figure_file in FIGURE_FILES}
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+        result['log'] = log.getvalue()
+
+    result['prepare'] = time.perf_counter() - start
+    return result
+
+
+def render_job(index: int, beam_data: Dict, project_info: Optional[Dict],
+               output_name: str, template_style: str, output_dir: str) -> Dict:
+    """
+    Render one sheet with reportlab, figures in memory (runs in a worker process)
+
+    Args:
+        index (int): Position of the job in the batch
+        beam_data (Dict): Beam parameters
+        project_info (Dict, optional): Project information
+        output_name (str): Unique file stem for the output PDF
+        template_style (str): "standard" or "cambridge"
+        output_dir (str): Destination directory
+
+    Returns:
+        Dict: Job index, name, status, output path, seconds and, on error,
+        the error message
+    """
+    start = time.perf_counter()
+    result = {'index': index, 'name': output_name, 'output': None, 'status': 'ok'}
+
+    try:
+        generator = GhaliPDFGenerator(template_style=template_style, use_cache=False,
+                                      engine="reportlab")
+        if project_info is None:
+            project_info = generator._get_default_project_info(beam_data)
+        result['output'] = generator.render_reportlab(beam_data, project_info, output_name,
+                                                      output_dir)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['seconds'] = time.perf_counter() - start
+    result['stages'] = {'render': result['seconds']}
+    return result
+
+
+def prepare_column_job(index: int, column_data: Dict, project_info: Optional[Dict],
+                       output_name: str) -> Dict:
+    """
+    Draw one column sheet's cross-section in memory and render its LaTeX
+    (runs in a worker process)
+
+    Args:
+        index (int): Position of the job in the batch
+        column_data (Dict): Column values in the format of
+            aci318_method_c_pdf_generator.extract_notebook_data
+        project_info (Dict, optional): Project information
+        output_name (str): Unique file stem for the output PDF
+
+    Returns:
+        Dict: Same keys as prepare_job
+    """
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import (draw_column_section,
+                                                                       render_column_latex)
+    from scripts.utilities.structural_plotting import serialize_figure
+
+    start = time.perf_counter()
+    result = {'index': index, 'name': output_name, 'output': None, 'status': 'ok',
+              'stages': {}}
+
+    try:
+        project_id = (project_info or {}).get('project_id', COLUMN_PROJECT_ID)
+        plots_start = time.perf_counter()
+        result['figures'] = {COLUMN_FIGURE: serialize_figure(draw_column_section(column_data),
+                                                             'pdf', dpi=150)}
+        template_start = time.perf_counter()
+        result['latex_content'] = render_column_latex(column_data, project_id)
+        result['stages'] = {'plots': template_start - plots_start,
+                            'template': time.perf_counter() - template_start}
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['prepare'] = time.perf_counter() - start
+    return result
+
+
+def render_column_job(index: int, column_data: Dict, project_info: Optional[Dict],
+                      output_name: str, output_dir: str) -> Dict:
+    """
+    Render one column sheet with reportlab (runs in a worker process)
+
+    Args:
+        index (int): Position of the job in the batch
+        column_data (Dict): Column values (see prepare_column_job)
+        project_info (Dict, optional): Project information
+        output_name (str): Unique file stem for the output PDF
+        output_dir (str): Destination directory
+
+    Returns:
+        Dict: Same keys as render_job
+    """
+    from scripts.pdf_generators.reportlab_renderer import render_column_sheet
+
+    start = time.perf_counter()
+    result = {'index': index, 'name': output_name, 'output': None, 'status': 'ok'}
+
+    try:
+        project_id = (project_info or {}).get('project_id', COLUMN_PROJECT_ID)
+        output_pdf = Path(output_dir) / f"{output_name}.pdf"
+        output_pdf.parent.mkdir(parents=True, exist_ok=True)
+        result['output'] = render_column_sheet(column_data, output_pdf, project_id)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    result['seconds'] = time.perf_counter() - start
+    result['stages'] = {'render': result['seconds']}
+    return result
+
+
+def _submit_prepare(pool: ProcessPoolExecutor, index: int, job: Dict, template_style: str):
+    """Queue a job's preparation stage (beam or column) on the process pool"""
+    output_name = job_output_name(index, job, template_style)
+    if 'column_data' in job:
+        return pool.submit(prepare_column_job, index, job['column_data'], job['project_info'],
+                           output_name)
+    return pool.submit(prepare_job, index, job['beam_data'], job['project_info'],
+                       output_name, template_style)
+
+
+def _submit_render(pool: ProcessPoolExecutor, index: int, job: Dict, template_style: str,
+                   output_dir: Path):
+    """Queue a job's reportlab rendering (beam or column) on the process pool"""
+    output_name = job_output_name(index, job, template_style)
+    output_dir = job['output_dir'] or output_dir
+    if 'column_data' in job:
+        return pool.submit(render_column_job, index, job['column_data'], job['project_info'],
+                           output_name, str(output_dir))
+    return pool.submit(render_job, index, job['beam_data'], job['project_info'],
+                       output_name, template_style, str(output_dir))
+
+
+def _trace_sheet(result: Dict):
+    """Emit a finished sheet's timings as a 'sheet' trace event"""
+    fields = {key: result[key] for key in ('prepare', 'wait', 'compile', 'seconds', 'stages',
+                                           'figure_bytes', 'error')
+              if key in result}
+    current_trace().emit('sheet', name=result['name'], status=result['status'],
+                         passes=len(result.get('latex_passes', [])), **fields)
+
+
+def _render_batch(jobs: List[Dict], template_style: str, max_workers: int,
+                  output_dir: Path, on_result: Optional[Callable[[Dict], None]]) -> Dict:
+    """Reportlab engine of build_pdf_batch: one stage, no LaTeX"""
+    print("🏭 GHALI CONSULTANTS - Batch PDF Builder")
+    print("=" * 50)
+    print(f"   {len(jobs)} sheets: {max_workers} workers, reportlab "
+          f"({template_style} template)")
+
+    start = time.perf_counter()
+    results: List[Dict] = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [_submit_render(pool, index, job, template_style, output_dir)
+                   for index, job in enumerate(jobs)]
+
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            _trace_sheet(result)
+            if on_result is not None:
+                on_result(result)
+            marker = "✓" if result['status'] == 'ok' else "❌"
+            print(f"   {marker} [{len(results)}/{len(jobs)}] {result['name']} "
+                  f"({result['seconds']:.2f} s, reportlab)")
+
+    wall_time = time.perf_counter() - start
+    results.sort(key=lambda r: r['index'])
+    succeeded = sum(1 for r in results if r['status'] == 'ok')
+    sheets_per_minute = succeeded / wall_time * 60 if wall_time > 0 else 0.0
+    seconds = [r['seconds'] for r in results]
+    latency = {
+        'sheets': len(results),
+        'succeeded': succeeded,
+        'passes': 0,
+        'latency': {
+            'p50': _percentile(seconds, 0.50) if seconds else 0.0,
+            'p95': _percentile(seconds, 0.95) if seconds else 0.0,
+            'max': max(seconds) if seconds else 0.0
+        }
+    }
+
+    print(f"\n📊 {succeeded}/{len(jobs)} sheets in {wall_time:.1f} s "
+          f"→ {sheets_per_minute:.1f} sheets/minute")
+    if seconds:
+        stats = latency['latency']
+        print(f"   ⏱️ latency  p50 {stats['p50']:.2f} s · p95 {stats['p95']:.2f} s · "
+              f"max {stats['max']:.2f} s")
+
+    return {
+        'jobs': results,
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'wall_time': wall_time,
+        'sheets_per_minute': sheets_per_minute,
+        'latency': latency
+    }
+
+
+@traced('batch_pdf_builder')
+def build_pdf_batch(jobs: Iterable[Union[Dict, tuple]],
+                    template_style: str = "standard",
+                    max_workers: Optional[int] = None,
+                    output_dir: Optional[Union[str, Path]] = None,
+                    latex_workers: Optional[int] = None,
+                    timeout: Optional[float] = DEFAULT_TIMEOUT,
+                    use_cache: bool = True,
+                    engine: str = "latex",
+                    on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Prepare sheets on a process pool and compile them on a LaTeX worker pool
+
+    Args:
+        jobs: (beam_data, project_info) tuples or dictionaries with keys
+            'beam_data' (or 'column_data' for an ACI 318-19 Method C column
+            sheet), 'project_info' and optional 'name' and 'output_dir'
+        template_style (str): "standard" or "cambridge"
+        max_workers (int, optional): Preparation processes, defaults to the CPU count
+        output_dir (str, optional): Destination directory of jobs without
+            their own (defaults to output/)
+        latex_workers (int, optional): Sheets compiled concurrently, defaults
+            to max_workers
+        timeout (float, optional): Seconds allowed per sheet in pdflatex
+        use_cache (bool): Reuse previously compiled PDFs with identical inputs
+        engine (str): "latex", or "reportlab" to render every sheet in the
+            worker processes without pdflatex (timeout and cache unused)
+        on_result (callable, optional): Called in the parent process with
+            each job's result as soon as it finishes (e.g. to checkpoint a
+            manifest)
+
+    Returns:
+        Dict: Per-job results plus succeeded/failed counts, wall time,
+        throughput in sheets per minute and the per-sheet latency report
+    """
+    jobs = [_normalize_job(job) for job in jobs]
+    max_workers = max_workers or os.cpu_count() or 1
+    latex_workers = latex_workers or max_workers
+    output_dir = Path(output_dir) if output_dir else project_root / "output"
+    if engine == "reportlab":
+        return _render_batch(jobs, template_style, max_workers, output_dir, on_result)
+    if engine != "latex":
+        raise ValueError("Engine must be 'latex' or 'reportlab'")
+    cache = get_default_cache() if use_cache else None
+
+    print("🏭 GHALI CONSULTANTS - Batch PDF Builder")
+    print("=" * 50)
+    print(f"   {len(jobs)} sheets: {max_workers} workers → {latex_workers} LaTeX workers "
+          f"({template_style} template)")
+
+    start = time.perf_counter()
+    results: List[Dict] = []
+
+    def finish(result: Dict):
+        results.append(result)
+        _trace_sheet(result)
+        passes = len(result.get('latex_passes', []))
+        detail = f"{passes} pdflatex pass{'es' if passes != 1 else ''}" if passes else "cached"
+        marker = "✓" if result['status'] == 'ok' else "❌"
+        print(f"   {marker} [{len(results)}/{len(jobs)}] {result['name']} "
+              f"({result['seconds']:.2f} s, {detail})")
+        if on_result is not None:
+            on_result(result)
+
+    styles = {COLUMN_STYLE if 'column_data' in job else template_style for job in jobs}
+    with LatexWorkerPool(latex_workers, timeout, warm_styles=sorted(styles)) as latex_pool:
+        compiling = {}
+
+        # Stage 1: figures and LaTeX, queued for compilation as each finishes
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {_submit_prepare(pool, index, job, template_style): job
+                       for index, job in enumerate(jobs)}
+
+            for future in as_completed(futures):
+                prepared = future.result()
+                prepared['seconds'] = prepared['prepare']
+                if prepared['status'] != 'ok':
+                    finish(prepared)
+                    continue
+
+                latex_content = prepared.pop('latex_content')
+                figures = prepared.pop('figures')
+                prepared['figure_bytes'] = sum(len(data) for data in figures.values())
+                prepared['figure_hashes'] = {name: hashlib.sha256(data).hexdigest()[:16]
+                                             for name, data in figures.items()}
+                job = futures[future]
+                output_pdf = Path(job['output_dir'] or output_dir) / f"{prepared['name']}.pdf"
+                if cache is not None:
+                    prepared['cache_key'] = cache.compute_key(latex_content, figure_data=figures)
+                    if cache.fetch(prepared['cache_key'], output_pdf):
+                        prepared['output'] = str(output_pdf)
+                        finish(prepared)
+                        continue
+
+                style = COLUMN_STYLE if 'column_data' in job else template_style
+                compile_future = latex_pool.submit(prepared['name'], latex_content, style,
+                                                   output_pdf, figures=figures)
+                compiling[compile_future] = prepared
+
+        # Stage 2: collect compiled sheets
+        for future in as_completed(compiling):
+            prepared = compiling[future]
+            record = future.result()
+            prepared.update({
+                'status': record['status'],
+                'output': record['output'],
+                'latex_passes': record['pass_times'],
+                'wait': record['wait'],
+                'compile': record['compile'],
+                'seconds': prepared['prepare'] + record['latency']
+            })
+            if 'error' in record:
+                prepared['error'] = record['error']
+            if cache is not None and record['status'] == 'ok':
+                cache.store(prepared['cache_key'], record['output'])
+            finish(prepared)
+
+    wall_time = time.perf_counter() - start
+    results.sort(key=lambda r: r['index'])
+    succeeded = sum(1 for r in results if r['status'] == 'ok')
+    sheets_per_minute = succeeded / wall_time * 60 if wall_time > 0 else 0.0
+
+    print(f"\n📊 {succeeded}/{len(jobs)} sheets in {wall_time:.1f} s "
+          f"→ {sheets_per_minute:.1f} sheets/minute")
+    latex_pool.print_latency_report()
+
+    return {
+        'jobs': results,
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'wall_time': wall_time,
+        'sheets_per_minute': sheets_per_minute,
+        'latency': latex_pool.latency_report()
+    }
+
+
+def create_sample_jobs(count: int) -> List[Dict]:
+    """Create sample beam jobs with varying spans"""
+    from scripts.calculations.load_combinations import governing_factored_load
+    
+    jobs = []
+    for i in range(count):
+        length = 6.0 + (i % 9) * 0.5
+        dead_load = 20.0
+        live_load = 25.0
+        factored_load, load_combination = governing_factored_load(dead_load, live_load)
+        jobs.append({
+            'beam_data': {
+                'length': length,
+                'dead_load': dead_load,
+                'live_load': live_load,
+                'factored_load': factored_load,
+                'load_combination': load_combination,
+                'width': 350,
+                'height': 600,
+                'fc': 25,
+                'fy': 420,
+                'steel_area_req': int(length * 225),
+                'bar_diameter': 25
+            },
+            'project_info': {'project_id': 'GC-BATCH-2025', 'title': f"Beam B{i + 1}"},
+            'name': f"GC-BATCH-2025_B{i + 1:03d}"
+        })
+    return jobs
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build many calculation sheets in parallel')
+    parser.add_argument('--count', type=int, default=8, help='Number of sample sheets')
+    parser.add_argument('--template', choices=['standard', 'cambridge'], default='standard',
+                        help='Template style: standard or cambridge')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--output-dir', help='Output directory (default: output/)')
+    parser.add_argument('--latex-workers', type=int,
+                        help='Sheets compiled concurrently (default: --workers)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Seconds allowed per sheet in pdflatex')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    parser.add_argument('--engine', choices=['latex', 'reportlab'], default='latex',
+                        help='PDF engine: pdflatex or pure-Python reportlab (no LaTeX)')
+    add_trace_arguments(parser)
+
+    args = parser.parse_args()
+    apply_trace_arguments(args)
+
+    summary = build_pdf_batch(create_sample_jobs(args.count), args.template,
+                              args.workers, args.output_dir, args.latex_workers,
+                              args.timeout, use_cache=not args.no_cache,
+                              engine=args.engine)
+
+    if summary['failed']:
+        sys.exit(1)
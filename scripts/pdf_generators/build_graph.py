@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Incremental Build Graph
+===========================================
+Rebuilds only the deliverables whose inputs changed, like make.
+
+Every output (PDF or HTML) is a node of a build graph. For each node the
+graph records, in output/.build_graph.json, what it was last built from:
+
+    data        digest of the node's own values (a schedule row's or the
+                Method C column's data, engine and template style)
+    files       digests of the input files its builder reads (a beam
+                notebook)
+    template    digest of the template file it is rendered from
+    generator   generator version: digest of the generator module and
+                every scripts.* module it imports, directly or not
+    output      digest of the file written, so edited or deleted outputs
+                are rebuilt as well
+
+A node is stale when any of these differ or when a node it needs was
+rebuilt. The digests of the figures embedded in the last build are
+recorded too, for reference only: figures are drawn from the node's data
+by the generator, so they cannot change while both are unchanged.
+
+Stale nodes are built in waves of independent nodes; within a wave all
+sheets are handed to build_pdf_batch in one call, so they run in parallel
+on the batch worker pool. File digests are memoized by size and
+modification time, so checking an up-to-date project reads no inputs.
+
+The project graph covers the beam notebooks (notebooks/beam_design), the
+Method C column notebooks (PDF and HTML) and any member schedules given
+on the command line, one sheet per schedule row: editing one beam's live
+load rebuilds that beam's sheet only.
+
+Usage:
+    python scripts/pdf_generators/build_graph.py --schedule schedule.csv
+    python scripts/pdf_generators/build_graph.py --dry-run      # show stale outputs
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import ast
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.pdf_generators.latex_worker_pool import DEFAULT_TIMEOUT
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   traced)
+
+DEFAULT_STATE_FILE = project_root / "output" / ".build_graph.json"
+TEMPLATES_DIR = project_root / "templates"
+SHEET_GENERATOR = 'scripts.pdf_generators.batch_pdf_builder'
+HTML_GENERATOR = 'scripts.pdf_generators.aci318_method_c_html_generator'
+
+# Instrumentation modules that never change what a generator writes
+VERSION_EXCLUDES = {'scripts.pdf_generators.pipeline_trace', 'scripts.pdf_generators.pdf_cache'}
+
+DIGEST_CHUNK = 1024 * 1024
+
+
+def _relative(path: Union[str, Path]) -> str:
+    """Path relative to the project root where possible (stable across checkouts)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(project_root.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def data_digest(data) -> str:
+    """Digest of JSON-serializable node data (key order independent)"""
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DIGEST_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _module_file(module: str) -> Path:
+    return project_root / (module.replace('.', '/') + '.py')
+
+
+@functools.lru_cache(maxsize=None)
+def generator_version(module: str) -> str:
+    """
+    Version of a generator: digest of its source and of every scripts.*
+    module it imports (module level or inside functions), recursively
+
+    Args:
+        module (str): Dotted module name, e.g. "scripts.pdf_generators.batch_pdf_builder"
+
+    Returns:
+        str: Short hex digest
+    """
+    seen = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        source = _module_file(name)
+        if name in seen or name in VERSION_EXCLUDES or not source.exists():
+            continue
+        seen.add(name)
+        for node in ast.walk(ast.parse(source.read_text(encoding='utf-8'))):
+            if isinstance(node, ast.ImportFrom) and node.module and \
+                    node.module.startswith('scripts.'):
+                pending.append(node.module)
+            elif isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names
+                               if alias.name.startswith('scripts.'))
+
+    return data_digest({name: _hash_file(_module_file(name)) for name in sorted(seen)})
+
+
+def beam_template(template_style: str) -> str:
+    """LaTeX template file of a beam sheet style (as GhaliPDFGenerator.load_template)"""
+    from scripts.pdf_generators.ghali_pdf_generator import STANDARD_TEMPLATE
+
+    return "cambridge_style_template.tex" if template_style == "cambridge" else STANDARD_TEMPLATE
+
+
+def sheet_inputs(member_type: str, engine: str, template_style: str) -> Dict:
+    """
+    Template and generator version a batch sheet is built from
+
+    Args:
+        member_type (str): "beam" or "column"
+        engine (str): "latex" or "reportlab" (reportlab sheets use no template file)
+        template_style (str): Beam template style
+
+    Returns:
+        Dict: 'template' (file name → digest) and 'generator' (version)
+    """
+    templates = {}
+    if engine == "latex":
+        if member_type == "column":
+            from scripts.pdf_generators.aci318_method_c_pdf_generator import METHOD_C_TEMPLATE
+            name = METHOD_C_TEMPLATE
+        else:
+            name = beam_template(template_style)
+        templates[name] = _hash_file(TEMPLATES_DIR / name)
+    return {'template': templates, 'generator': generator_version(SHEET_GENERATOR)}
+
+
+class BuildGraph:
+    """Outputs, what they are built from, and what they were last built from"""
+
+    def __init__(self, state_file: Union[str, Path] = DEFAULT_STATE_FILE):
+        """
+        Create an empty graph over the recorded state of previous builds
+
+        Args:
+            state_file: JSON file holding the build records
+        """
+        self.state_file = Path(state_file)
+        self.nodes: Dict[str, Dict] = {}
+        self.records: Dict[str, Dict] = {}
+        self._digests: Dict[str, List] = {}
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.records = state.get('outputs', {})
+            self._digests = state.get('digests', {})
+
+    def file_digest(self, path: Union[str, Path]) -> Optional[str]:
+        """Content digest of a file, reused while its size and mtime are unchanged"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = _relative(path)
+        cached = self._digests.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = _hash_file(path)
+        self._digests[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def add(self, output: Union[str, Path], kind: str, job=None, data=None,
+            files: Sequence[Union[str, Path]] = (), template: Optional[Mapping[str, str]] = None,
+            generator: Optional[str] = None, needs: Sequence[Union[str, Path]] = (),
+            source: Optional[str] = None) -> Dict:
+        """
+        Add an output node
+
+        Args:
+            output: File the node writes
+            kind (str): Builder that makes it (see run)
+            job: Whatever the builder needs to make the output (not recorded)
+            data: JSON-serializable values the output depends on
+            files: Input files the output depends on
+            template: Template file name → digest (see sheet_inputs)
+            generator (str): Generator version (see generator_version)
+            needs: Other outputs of the graph that must be built first
+            source (str): Human-readable origin, e.g. "schedule.csv row 12"
+
+        Returns:
+            Dict: The node
+        """
+        key = _relative(output)
+        inputs = {
+            'data': data_digest(data) if data is not None else None,
+            'files': {_relative(f): self.file_digest(f) for f in files},
+            'template': dict(template or {}),
+            'generator': generator
+        }
+        node = {'output': key, 'path': Path(output), 'kind': kind, 'job': job,
+                'inputs': inputs, 'needs': [_relative(n) for n in needs],
+                'source': source or key}
+        self.nodes[key] = node
+        return node
+
+    def reasons(self, node: Dict) -> List[str]:
+        """Why a node must be rebuilt (empty when it is up to date)"""
+        record = self.records.get(node['output'])
+        if record is None:
+            return ['never built']
+        digest = self.file_digest(node['path'])
+        if digest is None:
+            return ['output missing']
+
+        reasons = []
+        if digest != record.get('output_digest'):
+            reasons.append('output modified')
+        recorded = record.get('inputs', {})
+        inputs = node['inputs']
+        if inputs['data'] != recorded.get('data'):
+            reasons.append('data changed')
+        old_files = recorded.get('files', {})
+        reasons.extend(f"{name} changed" for name, file_digest in inputs['files'].items()
+                       if old_files.get(name) != file_digest)
+        if inputs['template'] != recorded.get('template', {}):
+            reasons.append('template changed')
+        if inputs['generator'] != recorded.get('generator'):
+            reasons.append('generator changed')
+        return reasons
+
+    def plan(self, force: bool = False) -> List[Tuple[Dict, List[str]]]:
+        """
+        Stale nodes in build order
+
+        Args:
+            force (bool): Treat every node as stale
+
+        Returns:
+            List[Tuple[Dict, List[str]]]: (node, reasons), every node after
+            the nodes it needs
+        """
+        order = self._topological_order()
+        stale = {}
+        for key in order:
+            node = self.nodes[key]
+            reasons = ['forced'] if force else self.reasons(node)
+            reasons += [f"needs {need} (rebuilt)" for need in node['needs'] if need in stale]
+            if reasons:
+                stale[key] = reasons
+        return [(self.nodes[key], stale[key]) for key in order if key in stale]
+
+    def _topological_order(self) -> List[str]:
+        order = []
+        state = {}
+
+        def visit(key, chain):
+            if state.get(key) == 'done':
+                return
+            if state.get(key) == 'visiting':
+                raise ValueError(f"Dependency cycle: {' → '.join(chain + [key])}")
+            if key not in self.nodes:
+                raise ValueError(f"{chain[-1]} needs {key}, which is not an output of the graph")
+            state[key] = 'visiting'
+            for need in self.nodes[key]['needs']:
+                visit(need, chain + [key])
+            state[key] = 'done'
+            order.append(key)
+
+        for key in self.nodes:
+            visit(key, [])
+        return order
+
+    def waves(self, planned: Iterable[Tuple[Dict, List[str]]]) -> List[List[Dict]]:
+        """Group planned nodes into waves whose nodes do not need each other"""
+        level = {}
+        for node, _ in planned:
+            level[node['output']] = 1 + max((level[need] for need in node['needs']
+                                             if need in level), default=-1)
+        waves = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for node, _ in planned:
+            waves[level[node['output']]].append(node)
+        return waves
+
+    def record(self, node: Dict, status: str, figures: Optional[Mapping[str, str]] = None):
+        """Record a build of a node (a failed build forgets the node, so it is retried)"""
+        if status != 'ok' or not node['path'].exists():
+            self.records.pop(node['output'], None)
+            return
+        self.records[node['output']] = {
+            'kind': node['kind'],
+            'source': node['source'],
+            'inputs': node['inputs'],
+            'figures': dict(figures or {}),
+            'output_digest': self.file_digest(node['path']),
+            'built': datetime.now().isoformat(timespec='seconds')
+        }
+
+    def save(self):
+        """Write the build records atomically"""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        state = {'outputs': self.records, 'digests': self._digests}
+        temp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=1, sort_keys=True)
+        os.replace(temp_file, self.state_file)
+
+    def run(self, builders: Mapping[str, Callable[[List[Dict]], List[Dict]]],
+            force: bool = False, dry_run: bool = False) -> Dict:
+        """
+        Build every stale node
+
+        Each wave's nodes are grouped by kind and every group is handed to
+        its builder in one call. Builders parallelize internally (sheets on
+        the batch worker pool) and are called one after another from this
+        thread: forking worker processes while other threads run can
+        deadlock the children.
+
+        Args:
+            builders: kind → function taking a list of nodes and returning
+                one result per node: {'output' (node key), 'status',
+                optional 'figures' (name → digest) and 'error'}
+            force (bool): Rebuild every node
+            dry_run (bool): Only report what is stale
+
+        Returns:
+            Dict: outputs, up_to_date, built, failed and blocked counts,
+            wall time and the planned (output, reasons) pairs
+        """
+        start = time.perf_counter()
+        planned = self.plan(force)
+        summary = {'outputs': len(self.nodes), 'up_to_date': len(self.nodes) - len(planned),
+                   'built': 0, 'failed': 0, 'blocked': 0,
+                   'stale': [(node['output'], reasons) for node, reasons in planned]}
+
+        print(f"   {len(self.nodes)} outputs: {summary['up_to_date']} up to date, "
+              f"{len(planned)} stale")
+        for node, reasons in planned:
+            print(f"   ↻ {node['output']} ({', '.join(reasons)})")
+
+        if not dry_run:
+            failed = set()
+            try:
+                for wave in self.waves(planned):
+                    groups: Dict[str, List[Dict]] = {}
+                    for node in wave:
+                        if any(need in failed for need in node['needs']):
+                            failed.add(node['output'])
+                            summary['blocked'] += 1
+                            print(f"   ⚠️ {node['output']} skipped: a node it needs failed")
+                        else:
+                            groups.setdefault(node['kind'], []).append(node)
+
+                    for kind, nodes in groups.items():
+                        for result in builders[kind](nodes):
+                            node = self.nodes[result['output']]
+                            self.record(node, result['status'], result.get('figures'))
+                            if result['status'] == 'ok':
+                                summary['built'] += 1
+                            else:
+                                failed.add(node['output'])
+                                summary['failed'] += 1
+                                print(f"   ❌ {node['output']}: {result.get('error') or 'failed'}")
+                        self.save()
+            finally:
+                self.save()
+
+        summary['wall_time'] = time.perf_counter() - start
+        return summary
+
+
+def _sheet_builder(engine: str, template_style: str, max_workers: Optional[int],
+                   timeout: Optional[float], use_cache: bool) -> Callable:
+    """Builder of 'sheet' nodes: all of them in one build_pdf_batch call"""
+
+    def build(nodes: List[Dict]) -> List[Dict]:
+        from scripts.pdf_generators.batch_pdf_builder import build_pdf_batch
+        from scripts.pdf_generators.pdf_generator_system import GhaliPDFGenerator
+
+        jobs = []
+        for node in nodes:
+            job = dict(node['job'])
+            notebook = job.pop('notebook', None)
+            if notebook:
+                job['beam_data'] = GhaliPDFGenerator(template_style).extract_from_notebook(
+                    notebook)
+            job.update(name=node['path'].stem, output_dir=node['path'].parent)
+            jobs.append(job)
+
+        batch = build_pdf_batch(jobs, template_style, max_workers, timeout=timeout,
+                                use_cache=use_cache, engine=engine)
+        # Results are in job order (see build_pdf_batch)
+        return [{'output': node['output'], 'status': result['status'],
+                 'figures': result.get('figure_hashes'), 'error': result.get('error')}
+                for node, result in zip(nodes, batch['jobs'])]
+
+    return build
+
+
+def _build_html(nodes: List[Dict]) -> List[Dict]:
+    """Builder of 'html' nodes (Method C HTML sheets)"""
+    from scripts.pdf_generators.aci318_method_c_html_generator import (
+        generate_aci318_method_c_html)
+
+    results = []
+    for node in nodes:
+        try:
+            generate_aci318_method_c_html(node['job']['project_id'], node['path'],
+                                          open_browser=False)
+            results.append({'output': node['output'], 'status': 'ok'})
+        except Exception as e:
+            results.append({'output': node['output'], 'status': 'error',
+                            'error': f"{type(e).__name__}: {e}"})
+    return results
+
+
+def project_graph(graph: BuildGraph, schedules: Sequence[Union[str, Path]] = (),
+                  output_dir: Optional[Union[str, Path]] = None,
+                  engine: str = "latex", template_style: str = "standard",
+                  project_id: Optional[str] = None) -> BuildGraph:
+    """
+    Add the project's deliverables to a build graph
+
+    Args:
+        graph (BuildGraph): Graph to add the nodes to
+        schedules: Member schedules (CSV, XLSX or JSON), one sheet per valid row
+        output_dir (str, optional): Root of the outputs (defaults to output/)
+        engine (str): "latex" or "reportlab"
+        template_style (str): Beam template style
+        project_id (str, optional): Project ID for schedule rows without one
+
+    Returns:
+        BuildGraph: The graph
+    """
+    from scripts.pdf_generators.aci318_method_c_html_generator import METHOD_C_HTML_TEMPLATE
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import column_c36_data
+    from scripts.pdf_generators.schedule_batch import DEFAULT_PROJECT_ID, calculate_schedule
+
+    output_dir = Path(output_dir) if output_dir else project_root / "output"
+    notebooks = project_root / "notebooks"
+    settings = {'engine': engine, 'template_style': template_style}
+
+    # Beam sheets are extracted from their notebook
+    inputs = sheet_inputs('beam', engine, template_style)
+    for notebook in sorted((notebooks / 'beam_design').glob('*.ipynb')):
+        graph.add(output_dir / 'beam_design' / f"{notebook.stem}.pdf", 'sheet',
+                  job={'notebook': str(notebook), 'project_info': None},
+                  data=settings, files=[notebook], source=_relative(notebook), **inputs)
+
+    # Method C sheets are computed by the engine from the C36 inputs; the
+    # notebook's contents are not read, so it is not an input file
+    inputs = sheet_inputs('column', engine, template_style)
+    column_data = column_c36_data()
+    html_template = {METHOD_C_HTML_TEMPLATE: _hash_file(TEMPLATES_DIR / METHOD_C_HTML_TEMPLATE)}
+    for notebook in sorted((notebooks / 'column_design').glob('*.ipynb')):
+        job = {'column_data': column_data, 'project_info': None}
+        graph.add(output_dir / 'column_design' / f"{notebook.stem}.pdf", 'sheet',
+                  job=job, data={**job, **settings}, source=_relative(notebook), **inputs)
+        graph.add(output_dir / 'column_design' / f"{notebook.stem}.html", 'html',
+                  job={'project_id': column_data['project_id']},
+                  data={'project_id': column_data['project_id'], 'column_data': column_data},
+                  template=html_template, generator=generator_version(HTML_GENERATOR),
+                  source=_relative(notebook))
+
+    for schedule in schedules:
+        schedule = Path(schedule)
+        inputs = {member_type: sheet_inputs(member_type, engine, template_style)
+                  for member_type in ('beam', 'column')}
+        for member in calculate_schedule(schedule, project_id or DEFAULT_PROJECT_ID):
+            if member['error']:
+                print(f"   ⚠️ {schedule.name} row {member['row']} ({member['member']}): "
+                      f"{member['error']}")
+                continue
+            data_key = 'beam_data' if member['type'] == 'beam' else 'column_data'
+            job = {data_key: member[data_key],
+                   'project_info': {'project_id': member['project_id'],
+                                    'title': f"{member['type'].title()} {member['member']}"}}
+            graph.add(output_dir / "schedules" / schedule.stem / f"{member['name']}.pdf",
+                      'sheet', job=job, data={**job, **settings},
+                      source=f"{_relative(schedule)} row {member['row']}",
+                      **inputs[member['type']])
+    return graph
+
+
+@traced('build_graph')
+def build_project(schedules: Sequence[Union[str, Path]] = (),
+                  output_dir: Optional[Union[str, Path]] = None,
+                  engine: str = "latex", template_style: str = "standard",
+                  max_workers: Optional[int] = None, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                  use_cache: bool = True, force: bool = False, dry_run: bool = False,
+                  state_file: Union[str, Path] = DEFAULT_STATE_FILE,
+                  project_id: Optional[str] = None) -> Dict:
+    """
+    Rebuild the project's stale deliverables
+
+    Args:
+        schedules: Member schedules to include
+        output_dir (str, optional): Root of the outputs (defaults to output/)
+        engine (str): "latex" or "reportlab"
+        template_style (str): Beam template style
+        max_workers (int, optional): Batch worker processes
+        timeout (float, optional): Seconds allowed per sheet in pdflatex
+        use_cache (bool): Reuse previously compiled PDFs with identical inputs
+        force (bool): Rebuild everything
+        dry_run (bool): Only report what is stale
+        state_file: Build records (defaults to output/.build_graph.json)
+        project_id (str, optional): Project ID for schedule rows without one
+
+    Returns:
+        Dict: Summary from BuildGraph.run
+    """
+    print("🔗 GHALI CONSULTANTS - Incremental Build")
+    print("=" * 50)
+
+    graph = project_graph(BuildGraph(state_file), schedules, output_dir, engine,
+                          template_style, project_id)
+    builders = {'sheet': _sheet_builder(engine, template_style, max_workers, timeout,
+                                        use_cache),
+                'html': _build_html}
+    summary = graph.run(builders, force=force, dry_run=dry_run)
+
+    if not dry_run:
+        print(f"\n🔗 {summary['built']} built, {summary['up_to_date']} up to date, "
+              f"{summary['failed']} failed, {summary['blocked']} blocked "
+              f"in {summary['wall_time']:.1f} s")
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rebuild only the stale project outputs')
+    parser.add_argument('--schedule', action='append', default=[],
+                        help='Member schedule to include (repeatable)')
+    parser.add_argument('--engine', choices=['latex', 'reportlab'], default='latex',
+                        help='PDF engine: pdflatex or pure-Python reportlab (no LaTeX)')
+    parser.add_argument('--template', choices=['standard', 'cambridge'], default='standard',
+                        help='Beam template style: standard or cambridge')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--output-dir', help='Output root (default: output/)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Seconds allowed per sheet in pdflatex')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    parser.add_argument('--force', action='store_true', help='Rebuild every output')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the stale outputs')
+    parser.add_argument('--state', default=str(DEFAULT_STATE_FILE),
+                        help='Build record file (default: output/.build_graph.json)')
+    parser.add_argument('--project-id', help='Project ID for schedule rows without one')
+    add_trace_arguments(parser)
+
+    args = parser.parse_args()
+    apply_trace_arguments(args)
+
+    summary = build_project(args.schedule, args.output_dir, args.engine, args.template,
+                            args.workers, args.timeout, use_cache=not args.no_cache,
+                            force=args.force, dry_run=args.dry_run, state_file=args.state,
+                            project_id=args.project_id)
+
+    if summary['failed'] or summary['blocked']:
+        sys.exit(1)
@@ -8,121 +8,222 @@ Author: Ghali Consultants
 Version: 1.0 Cambridge Style
 """
 
-import os
+import hashlib
+import json
 import sys
-import subprocess
 import tempfile
 import shutil
+import time
 from pathlib import Path
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
-from scripts.structural_plotting import create_all_structural_plots
+from scripts.pdf_generators.pdf_cache import get_default_cache
+from scripts.pdf_generators.latex_format import BEGIN_DOCUMENT, run_pdflatex
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+from scripts.pdf_generators.template_engine import render_stream, template_source
+
+
+CAMBRIDGE_TEMPLATE = "cambridge_style_template.tex"
+FIGURE_FILES = ("beam_diagram.pdf", "bmd_sfd.pdf", "steel_layout.pdf")
+# Beam values the figures depend on; identical beams share one set of figures
+FIGURE_KEYS = ('length', 'dead_load', 'live_load', 'factored_load', 'width', 'height',
+               'steel_area_req', 'bar_diameter')
+# Member values listed in the beam schedule table
+SCHEDULE_KEYS = ('name', 'length', 'width', 'height', 'factored_load', 'max_moment',
+                 'max_shear', 'steel_area_req')
+PROGRESS_INTERVAL = 50
+
 
 def create_cambridge_template():
-    """Load Cambridge-style LaTeX template"""
-    template_path = project_root / "templates" / "cambridge_style_template.tex"
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    """Load Cambridge-style LaTeX template (unrendered source)"""
+    return template_source(CAMBRIDGE_TEMPLATE)
+
+
+def _complete_beam(beam):
+    """Fill the values a member section needs but the schedule may omit"""
+    beam = dict(beam)
+    beam.setdefault('width', 350)
+    beam.setdefault('height', 600)
+    beam.setdefault('dead_load', 20.0)
+    beam.setdefault('live_load', 25.0)
+    beam.setdefault('steel_area_req', int(beam['length'] * 225))
+    beam.setdefault('bar_diameter', 25)
+    if 'factored_load' not in beam or 'load_combination' not in beam:
+        from scripts.calculations.load_combinations import governing_factored_load
+        factored_load, load_combination = governing_factored_load(beam['dead_load'],
+                                                                  beam['live_load'])
+        beam.setdefault('factored_load', factored_load)
+        beam.setdefault('load_combination', load_combination)
+    return beam
+
+
+def _member_context(beam, index, figure_dir, max_moment, max_shear):
+    """Template values of one member's section and schedule row, with its design checks"""
+    from scripts.calculations.aci318_flexure import beam_checks
+
+    member = {
+        **beam,
+        'name': beam.get('name') or beam.get('label') or f"B{index}",
+        'figure_dir': figure_dir,
+        'load_combination': beam['load_combination'].split(': ')[-1],
+        'max_moment': max_moment,
+        'max_shear': max_shear
+    }
+    member['checks'] = beam_checks(member)
+    return member
 
-def generate_cambridge_pdf(beams_data, project_id="GC-CAM-2025"):
+
+def _read_schedule(rows_file):
+    """Yield the schedule rows spooled while the member sections rendered"""
+    with open(rows_file, 'r', encoding='utf-8') as rows:
+        for line in rows:
+            yield json.loads(line)
+
+
+@traced('cambridge_pdf_generator')
+def generate_cambridge_pdf(beams_data, project_id="GC-CAM-2025", use_cache=True):
     """
     Generate academic-style PDF for multiple beam analysis
     
+    Members are streamed through a single template pass: each beam's figures
+    are drawn when the template reaches its section, its schedule row is
+    spooled to disk for the table at the end, and the rendered body is
+    written straight to the .tex file, so memory stays flat and time grows
+    linearly with the number of beams.
+    
     Args:
-        beams_data (list): List of beam dictionaries with parameters
+        beams_data (iterable): Beam dictionaries with parameters; any iterable,
+            including a generator over a long schedule
         project_id (str): Project identifier
+        use_cache (bool): Reuse a previously compiled PDF with identical inputs
         
     Returns:
         str: Path to generated PDF file
     """
+    from scripts.utilities.structural_plotting import (create_all_structural_plots,
+                                                       write_figure_files, EXPORT_PRESETS)
+    
     print("🎓 GHALI CONSULTANTS - Cambridge Style Generator")
     print("=" * 55)
+    trace = current_trace()
     
-    # Step 1: Generate plots for the first beam (representative)
-    print("1. Generating structural plots...")
-    if beams_data:
-        beam_data = beams_data[0]  # Use first beam for diagrams
-        plots_data = create_all_structural_plots(beam_data)
-        max_moment = plots_data.get('M_max', beam_data['length']**2 * beam_data.get('factored_load', 64) / 8)
-        max_shear = plots_data.get('V_max', beam_data['length'] * beam_data.get('factored_load', 64) / 2)
-        print(f"   ✓ Generated academic structural diagrams")
-    else:
-        print("   ⚠️ No beam data provided")
-        return None
-    
-    # Step 2: Create LaTeX document
-    print("2. Creating academic calculation sheet...")
-    latex_content = create_cambridge_template()
-    
-    # Step 3: Replace placeholders with first beam data
-    if beams_data:
-        beam = beams_data[0]
-        replacements = {
-            'PROJECT_ID_PLACEHOLDER': project_id,
-            'BEAM_LENGTH_PLACEHOLDER': f"{beam['length']:.1f}",
-            'BEAM_WIDTH_PLACEHOLDER': str(beam.get('width', 350)),
-            'BEAM_HEIGHT_PLACEHOLDER': str(beam.get('height', 600)),
-            'DEAD_LOAD_PLACEHOLDER': f"{beam.get('dead_load', 20):.1f}",
-            'LIVE_LOAD_PLACEHOLDER': f"{beam.get('live_load', 25):.1f}",
-            'MAX_MOMENT_PLACEHOLDER': f"{max_moment:.1f}",
-            'MAX_SHEAR_PLACEHOLDER': f"{max_shear:.1f}",
-            'STEEL_AREA_PLACEHOLDER': str(beam.get('steel_area_req', int(beam['length'] * 225)))
-        }
-        
-        for placeholder, value in replacements.items():
-            latex_content = latex_content.replace(placeholder, value)
-    
-    # Step 4: Compile PDF
-    print("3. Compiling academic PDF...")
+    output_pdf = project_root / "output" / "Cambridge_Style_Beam_Design.pdf"
     
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         tex_file = temp_path / "cambridge_calculation.tex"
+        body_file = temp_path / "body.part"
+        rows_file = temp_path / "schedule.part"
+        
+        digest = hashlib.sha256()
+        figure_sets = {}
+        count = 0
+        plot_seconds = 0.0
+        
+        def members():
+            """Complete each beam and draw its figures on demand"""
+            nonlocal count, plot_seconds
+            with open(rows_file, 'w', encoding='utf-8') as rows:
+                for index, beam in enumerate(beams_data, start=1):
+                    beam = _complete_beam(beam)
+                    figure_key = tuple(beam.get(key) for key in FIGURE_KEYS)
+                    
+                    if figure_key not in figure_sets:
+                        plot_start = time.perf_counter()
+                        job_id = f"b{index:04d}"
+                        plots_data = create_all_structural_plots(beam, **EXPORT_PRESETS['latex'],
+                                                                 in_memory=True)
+                        max_moment = plots_data.get('M_max', beam['length']**2 * beam['factored_load'] / 8)
+                        max_shear = plots_data.get('V_max', beam['length'] * beam['factored_load'] / 2)
+                        figure_sets[figure_key] = (f"figures/{job_id}", max_moment, max_shear)
+                        for figure_file in FIGURE_FILES:
+                            digest.update(plots_data['files'][figure_file])
+                        write_figure_files(plots_data['files'], temp_path / "figures" / job_id)
+                        plot_seconds += time.perf_counter() - plot_start
+                        trace.figures(plots_data['files'])
+                    
+                    member = _member_context(beam, index, *figure_sets[figure_key])
+                    row = {key: member[key] for key in SCHEDULE_KEYS}
+                    rows.write(json.dumps(row, default=lambda value: value.item()) + '\n')
+                    
+                    count += 1
+                    if count % PROGRESS_INTERVAL == 0:
+                        print(f"   ✓ {count} members")
+                    yield member
+        
+        # Step 1: Render the report in one pass, drawing figures on demand
+        print("1. Streaming member sections and structural plots...")
+        render_start = time.perf_counter()
+        chunks = render_stream(CAMBRIDGE_TEMPLATE, project_id=project_id,
+                               members=members(), schedule=_read_schedule(rows_file))
+        head = []
+        with open(body_file, 'w', encoding='utf-8') as body:
+            for chunk in chunks:
+                digest.update(chunk.encode('utf-8'))
+                if head and BEGIN_DOCUMENT in head[-1]:
+                    body.write(chunk)
+                else:
+                    head.append(chunk)
         
-        # Write LaTeX content
-        with open(tex_file, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
+        # Figures are drawn while the template streams; report them apart
+        trace.record_stage('plots', plot_seconds, figure_sets=len(figure_sets))
+        trace.record_stage('template', time.perf_counter() - render_start - plot_seconds,
+                           members=count)
+        trace.file_written(body_file, 'tex')
         
-        # Copy plot files
-        reports_dir = project_root / "reports" / "figures"
-        plot_files = ["beam_diagram.pdf", "bmd_sfd.pdf", "steel_layout.pdf"]
+        if count == 0:
+            print("   ⚠️ No beam data provided")
+            return None
         
-        for plot_file in plot_files:
-            source = reports_dir / plot_file
-            if source.exists():
-                shutil.copy2(source, temp_path)
+        print(f"   ✓ {count} members, {len(figure_sets)} distinct figure sets")
         
-        # Compile PDF with pdflatex
-        try:
-            result = subprocess.run([
-                'pdflatex', '-interaction=nonstopmode', tex_file.name
-            ], cwd=temp_path, capture_output=True, text=True)
+        # Step 2: Compile PDF
+        print("2. Compiling academic PDF...")
+        
+        with trace.stage('compile'):
+            cache = get_default_cache() if use_cache else None
+            if cache is not None:
+                cache_key = digest.hexdigest()
+                hit = cache.fetch(cache_key, output_pdf)
+                trace.cache(hit)
+                if hit:
+                    print(f"   ⚡ Academic PDF reused from cache: {output_pdf}")
+                    return str(output_pdf)
             
-            if result.returncode == 0:
-                # Copy to output
-                output_dir = project_root / "output"
-                output_dir.mkdir(exist_ok=True)
+            # Compile PDF with pdflatex
+            try:
+                start = time.perf_counter()
+                result = run_pdflatex(tex_file, ''.join(head), 'cambridge', body_files=[body_file])
+                trace.latex_run(result, time.perf_counter() - start)
                 
-                pdf_file = temp_path / "cambridge_calculation.pdf"
-                output_pdf = output_dir / "Cambridge_Style_Beam_Design.pdf"
-                
-                if pdf_file.exists():
-                    shutil.copy2(pdf_file, output_pdf)
-                    print(f"   ✓ Academic PDF created: {output_pdf}")
-                    print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
-                    return str(output_pdf)
-            else:
-                print(f"   ❌ LaTeX compilation failed")
-                print(f"   Error: {result.stderr}")
+                if result.returncode == 0:
+                    # Copy to output
+                    output_dir = project_root / "output"
+                    output_dir.mkdir(exist_ok=True)
                     
-        except FileNotFoundError:
-            print("   ❌ LaTeX not found. Install TinyTeX or MiKTeX.")
-            
+                    pdf_file = temp_path / "cambridge_calculation.pdf"
+                    
+                    if pdf_file.exists():
+                        shutil.copy2(pdf_file, output_pdf)
+                        if cache is not None:
+                            cache.store(cache_key, pdf_file)
+                        trace.file_written(output_pdf)
+                        print(f"   ✓ Academic PDF created: {output_pdf}")
+                        print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+                        print(f"   ⏱️ {result.describe()}")
+                        return str(output_pdf)
+                else:
+                    print(f"   ❌ LaTeX compilation failed")
+                    print(f"   Error: {result.stderr}")
+                        
+            except FileNotFoundError:
+                print("   ❌ LaTeX not found. Install TinyTeX or MiKTeX.")
+                
     return None
 
 def create_sample_beam_data():
@@ -150,23 +251,38 @@ def create_sample_beam_data():
         }
     ]
 
+def iter_sample_schedule(count):
+    """Yield a synthetic schedule of count beams (spans 6-10 m), one at a time"""
+    for i in range(count):
+        length = 6.0 + (i % 9) * 0.5
+        yield {'name': f"B{i + 1}", 'length': length, 'dead_load': 20.0, 'live_load': 25.0,
+               'width': 350, 'height': 600, 'steel_area_req': int(length * 225),
+               'bar_diameter': 25}
+
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='Generate Cambridge Style Academic PDF')
     parser.add_argument('--project-id', default='GC-CAM-2025', help='Project ID')
     parser.add_argument('--sample', action='store_true', help='Use sample beam data')
+    parser.add_argument('--beams', type=int, help='Stream a synthetic schedule of this many beams')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
-    if args.sample:
+    if args.beams:
+        beams_data = iter_sample_schedule(args.beams)
+        print(f"Streaming a synthetic schedule of {args.beams} beams")
+    elif args.sample:
         beams_data = create_sample_beam_data()
         print(f"Using sample data for {len(beams_data)} beams")
     else:
         # Single beam for now
         beams_data = create_sample_beam_data()[:1]
     
-    pdf_path = generate_cambridge_pdf(beams_data, args.project_id)
+    pdf_path = generate_cambridge_pdf(beams_data, args.project_id, use_cache=not args.no_cache)
     
     if pdf_path:
         print(f"\n🎓 SUCCESS! Cambridge Style PDF generated")
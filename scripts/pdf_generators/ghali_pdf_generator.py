@@ -8,295 +8,31 @@ Author: Ghali Consultants
 Version: 1.0
 """
 
-import os
 import sys
-import subprocess
 import tempfile
 import shutil
+import time
 from pathlib import Path
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
-from scripts.structural_plotting import create_all_structural_plots
+from scripts.pdf_generators.pdf_cache import get_default_cache
+from scripts.pdf_generators.latex_format import run_pdflatex
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+from scripts.pdf_generators.template_engine import render, template_source
 
-def create_latex_template():
-    """Professional LaTeX template inspired by Cambridge academic style"""
-    return r"""
-\documentclass[11pt,letterpaper,onecolumn]{article}
-
-% Essential packages
-\usepackage[a4paper, margin=3cm, top=3.5cm, bottom=3cm]{geometry}
-\usepackage{amsmath,amsfonts,amssymb}
-\usepackage[nopatch]{microtype}
-\usepackage{booktabs}
-\usepackage{graphicx}
-\usepackage{float}
-\usepackage{xcolor}
-\usepackage{array}
-\usepackage{tabularx}
-\usepackage{siunitx}
-\usepackage{fancyhdr}
-
-% Ghali Consultants Colors
-\definecolor{ghaliblue}{RGB}{31, 78, 121}
-\definecolor{ghalired}{RGB}{197, 80, 75}
-\definecolor{ghaligreen}{RGB}{76, 175, 80}
-\definecolor{ghaligray}{RGB}{88, 88, 88}
-
-% Font configuration
-\usepackage{times}
-\usepackage[T1]{fontenc}
-
-% Page style
-\pagestyle{fancy}
-\fancyhf{}
-\renewcommand{\headrulewidth}{0.4pt}
-\renewcommand{\footrulewidth}{0.4pt}
-
-\fancyhead[L]{\small\textcolor{ghaliblue}{\textbf{GHALI CONSULTANTS}}}
-\fancyhead[C]{\small\textcolor{ghaligray}{Structural Engineering Calculation}}
-\fancyhead[R]{\small\textcolor{ghaligray}{Page \thepage}}
-
-\fancyfoot[L]{\small\textcolor{ghaligray}{BEAM_LENGTH_PLACEHOLDER m RC Beam Design}}
-\fancyfoot[C]{\small\textcolor{ghaligray}{Professional Engineering Services}}
-\fancyfoot[R]{\small\textcolor{ghaligray}{\today}}
-
-% Title page style
-\fancypagestyle{titlepage}{
-  \fancyhf{}
-  \renewcommand{\headrulewidth}{0pt}
-  \renewcommand{\footrulewidth}{0.4pt}
-  \fancyfoot[C]{\small\textcolor{ghaligray}{Ghali Consultants - Professional Engineering Services}}
-  \fancyfoot[R]{\small\textcolor{ghaligray}{\today}}
-}
-
-% Section formatting
-\usepackage{titlesec}
-\titleformat{\section}
-  {\Large\bfseries\color{ghaliblue}}
-  {\thesection}{1em}{}
-\titleformat{\subsection}
-  {\large\bfseries\color{ghaligray}}
-  {\thesubsection}{1em}{}
-
-% Units formatting
-\sisetup{
-  per-mode=fraction,
-  fraction-function=\tfrac,
-  unit-color=ghaligray
-}
-
-\begin{document}
-
-\thispagestyle{titlepage}
-
-% Company Title
-\begin{center}
-{\Huge\textbf{\textcolor{ghaliblue}{GHALI CONSULTANTS}}}\\[0.5cm]
-{\Large\textcolor{ghaligray}{Structural \& Civil Engineering}}\\[0.3cm]
-{\normalsize\textcolor{ghaligray}{Professional Engineering Services}}
-\end{center}
-
-\vspace{1.5cm}
-
-% Document Title
-\begin{center}
-{\LARGE\textbf{\textcolor{ghalired}{REINFORCED CONCRETE BEAM DESIGN}}}\\[0.3cm]
-{\large\textcolor{ghaligray}{ACI 318-19 Structural Analysis \& Design}}
-\end{center}
-
-\vspace{1cm}
-
-% Project Information
-\begin{center}
-\renewcommand{\arraystretch}{1.4}
-\begin{tabular}{>{\bfseries}l l}
-\toprule
-\textbf{\textcolor{ghaliblue}{Project Information}} & \\
-\midrule
-Project Title: & BEAM_LENGTH_PLACEHOLDER m Reinforced Concrete Beam \\
-Project ID: & GC-2025-001 \\
-Engineer: & Ahmed Ghali, P.E. \\
-Date: & \today \\
-Design Code: & ACI 318-19 \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\vspace{2cm}
-
-% Summary
-\begin{center}
-\begin{minipage}{0.85\textwidth}
-\textbf{\textcolor{ghaliblue}{CALCULATION SUMMARY}}\\[0.5cm]
-This calculation presents the structural analysis and design of a BEAM_LENGTH_PLACEHOLDER m reinforced concrete beam under uniformly distributed loading. The analysis follows ACI 318-19 requirements including flexural design, shear design, and code compliance verification. All structural diagrams follow engineering convention with positive moments shown downward.
-\end{minipage}
-\end{center}
-
-\newpage
-
-\section{Design Parameters and Material Properties}
-
-\subsection{Material Properties}
-
-\begin{center}
-\renewcommand{\arraystretch}{1.3}
-\begin{tabular}{l c c}
-\toprule
-\textbf{Property} & \textbf{Value} & \textbf{Unit} \\
-\midrule
-Concrete Compressive Strength, $f'_c$ & 25 & MPa \\
-Steel Yield Strength, $f_y$ & 420 & MPa \\
-Concrete Modulus of Elasticity, $E_c$ & 25,000 & MPa \\
-Steel Modulus of Elasticity, $E_s$ & 200,000 & MPa \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\subsection{Geometric Properties}
-
-\begin{center}
-\renewcommand{\arraystretch}{1.3}
-\begin{tabular}{l c c}
-\toprule
-\textbf{Dimension} & \textbf{Value} & \textbf{Unit} \\
-\midrule
-Beam Length, $L$ & BEAM_LENGTH_PLACEHOLDER & m \\
-Beam Width, $b$ & BEAM_WIDTH_PLACEHOLDER & mm \\
-Beam Height, $h$ & BEAM_HEIGHT_PLACEHOLDER & mm \\
-Effective Depth, $d$ & EFFECTIVE_DEPTH_PLACEHOLDER & mm \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\subsection{Loading Conditions}
-
-\begin{center}
-\renewcommand{\arraystretch}{1.3}
-\begin{tabular}{l c c}
-\toprule
-\textbf{Load Type} & \textbf{Value} & \textbf{Unit} \\
-\midrule
-Dead Load, $w_D$ & DEAD_LOAD_PLACEHOLDER & kN/m \\
-Live Load, $w_L$ & LIVE_LOAD_PLACEHOLDER & kN/m \\
-Factored Load, $w_u = 1.2D + 1.6L$ & FACTORED_LOAD_PLACEHOLDER & kN/m \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\section{Structural Analysis}
-
-\subsection{Critical Design Forces}
-
-For a simply supported beam under uniformly distributed load:
-
-\begin{align}
-M_u &= \frac{w_u L^2}{8} = \text{MAX_MOMENT_PLACEHOLDER kN$\cdot$m} \label{eq:moment}\\
-V_u &= \frac{w_u L}{2} = \text{MAX_SHEAR_PLACEHOLDER kN} \label{eq:shear}
-\end{align}
-
-\subsection{Structural Diagrams}
-
-The following figures show structural configuration and analysis results with BMD following structural engineering convention (positive moments downward):
+STANDARD_TEMPLATE = "standard_beam_template.tex"
 
-\begin{figure}[H]
-\centering
-\includegraphics[width=0.9\textwidth]{beam_diagram.pdf}
-\caption{Beam geometry, support conditions, and loading configuration}
-\end{figure}
-
-\begin{figure}[H]
-\centering
-\includegraphics[width=0.9\textwidth]{bmd_sfd.pdf}
-\caption{Bending moment and shear force diagrams (positive moments downward)}
-\end{figure}
-
-\begin{figure}[H]
-\centering
-\includegraphics[width=0.8\textwidth]{steel_layout.pdf}
-\caption{Reinforcement steel arrangement and detailing}
-\end{figure}
-
-\section{Flexural Design}
-
-\subsection{Required Flexural Reinforcement}
-
-Using strength design method per ACI 318-19 Section 22.2:
-
-\begin{align}
-A_{s,req} &= \frac{M_u}{\phi f_y (d - a/2)} = \text{STEEL_AREA_PLACEHOLDER mm}^2 \label{eq:steel_req}
-\end{align}
-
-\subsection{Minimum Reinforcement Requirements}
-
-Per ACI 318-19 Section 9.6.1.2:
-
-\begin{align}
-A_{s,min} &= \max\left(\frac{0.25\sqrt{f'_c}}{f_y}bd, \frac{1.4}{f_y}bd\right) \label{eq:steel_min}
-\end{align}
-
-\section{Design Verification}
-
-\subsection{Design Check Summary}
-
-\begin{center}
-\renewcommand{\arraystretch}{1.4}
-\begin{tabular}{l c c c}
-\toprule
-\textbf{Design Requirement} & \textbf{Required} & \textbf{Provided} & \textbf{Status} \\
-\midrule
-Flexural Capacity & MAX_MOMENT_PLACEHOLDER kN$\cdot$m & Adequate & \textcolor{ghaligreen}{\textbf{OK}} \\
-Minimum Steel Area & As calculated & STEEL_AREA_PLACEHOLDER mm$^2$ & \textcolor{ghaligreen}{\textbf{OK}} \\
-ACI 318-19 Compliance & All provisions & Satisfied & \textcolor{ghaligreen}{\textbf{OK}} \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\section{Conclusion}
-
-The BEAM_LENGTH_PLACEHOLDER m reinforced concrete beam design has been completed per ACI 318-19. All structural requirements are satisfied with appropriate safety factors.
-
-\textbf{Key Features:}
-\begin{itemize}
-\item Professional structural engineering convention (BMD positive downward)
-\item High-resolution vector graphics (300 DPI)
-\item Complete ACI 318-19 compliance
-\item Publication-quality presentation
-\end{itemize}
-
-\vspace{1.5cm}
-
-% Signature Block
-\begin{center}
-\renewcommand{\arraystretch}{1.8}
-\begin{tabular}{c c}
-\toprule
-\textbf{Prepared By} & \textbf{Reviewed By} \\
-\midrule
-& \\
-Ahmed Ghali, P.E. & Senior Engineer, P.E. \\
-Professional Engineer & Professional Engineer \\
-Date: \today & Date: \_\_\_\_\_\_\_\_\_\_\_\_\_ \\
-\bottomrule
-\end{tabular}
-\end{center}
-
-\vspace{0.5cm}
-
-\begin{center}
-\small\textcolor{ghaligray}{
-This calculation follows applicable engineering standards and professional practice. \\
-All calculations are subject to independent review and verification.
-}
-\end{center}
-
-\end{document}
-"""
+def create_latex_template():
+    """Professional LaTeX template inspired by Cambridge academic style (unrendered source)"""
+    return template_source(STANDARD_TEMPLATE)
 
-def generate_pdf(beam_length=8.0, dead_load=20.0, live_load=25.0):
+@traced('ghali_pdf_generator')
+def generate_pdf(beam_length=8.0, dead_load=20.0, live_load=25.0, use_cache=True):
     """
     Generate professional PDF calculation sheet
     
@@ -304,15 +40,21 @@ def generate_pdf(beam_length=8.0, dead_load=20.0, live_load=25.0):
         beam_length (float): Beam length in meters
         dead_load (float): Dead load in kN/m  
         live_load (float): Live load in kN/m
+        use_cache (bool): Reuse a previously compiled PDF with identical inputs
         
     Returns:
         str: Path to generated PDF file
     """
+    from scripts.calculations.aci318_flexure import beam_checks
+    from scripts.calculations.load_combinations import governing_factored_load
+    from scripts.utilities.structural_plotting import create_all_structural_plots, EXPORT_PRESETS
+    
     print("🏗️  GHALI CONSULTANTS - PDF Generator")
     print("=" * 50)
+    trace = current_trace()
     
     # Calculate design parameters
-    factored_load = 1.2 * dead_load + 1.6 * live_load
+    factored_load, load_combination = governing_factored_load(dead_load, live_load)
     beam_width = 350
     beam_height = 600
     steel_area = int(beam_length * 225)  # Approximate steel area
@@ -323,65 +65,69 @@ def generate_pdf(beam_length=8.0, dead_load=20.0, live_load=25.0):
         'dead_load': dead_load,
         'live_load': live_load,
         'factored_load': factored_load,
+        'load_combination': load_combination,
         'width': beam_width,
         'height': beam_height,
         'steel_area_req': steel_area,
         'bar_diameter': 25
     }
     
-    # Step 1: Generate plots
+    # Step 1: Generate plots (in memory, written once into the build directory)
     print("1. Generating structural plots...")
-    plots_data = create_all_structural_plots(beam_data)
+    with trace.stage('plots'):
+        plots_data = create_all_structural_plots(beam_data, **EXPORT_PRESETS['latex'],
+                                                 in_memory=True)
+    trace.figures(plots_data['files'])
     max_moment = plots_data.get('M_max', beam_length**2 * factored_load / 8)
     max_shear = plots_data.get('V_max', beam_length * factored_load / 2)
     print(f"   ✓ Generated professional structural diagrams")
     
     # Step 2: Create LaTeX document
     print("2. Creating calculation sheet...")
-    latex_content = create_latex_template()
-    
-    # Replace placeholders
-    replacements = {
-        'BEAM_LENGTH_PLACEHOLDER': f"{beam_length:.1f}",
-        'DEAD_LOAD_PLACEHOLDER': f"{dead_load:.1f}",
-        'LIVE_LOAD_PLACEHOLDER': f"{live_load:.1f}",
-        'FACTORED_LOAD_PLACEHOLDER': f"{factored_load:.1f}",
-        'BEAM_WIDTH_PLACEHOLDER': str(beam_width),
-        'BEAM_HEIGHT_PLACEHOLDER': str(beam_height),
-        'EFFECTIVE_DEPTH_PLACEHOLDER': str(beam_height - 50),  # Assuming 50mm cover
-        'STEEL_AREA_PLACEHOLDER': str(steel_area),
-        'MAX_MOMENT_PLACEHOLDER': f"{max_moment:.1f}",
-        'MAX_SHEAR_PLACEHOLDER': f"{max_shear:.1f}"
-    }
-    
-    for placeholder, value in replacements.items():
-        latex_content = latex_content.replace(placeholder, value)
+    with trace.stage('template'):
+        beam = {
+            **beam_data,
+            'load_combination': load_combination.split(': ')[-1],
+            'effective_depth': beam_height - 50,  # Assuming 50mm cover
+            'max_moment': max_moment,
+            'max_shear': max_shear
+        }
+        beam['checks'] = beam_checks(beam)
+        latex_content = render(STANDARD_TEMPLATE, beam=beam)
     
     # Step 3: Compile PDF
     print("3. Compiling to PDF...")
+    with trace.stage('compile'):
+        return _compile(latex_content, plots_data['files'], use_cache)
+
+def _compile(latex_content, figures, use_cache):
+    """Compile the rendered sheet (or fetch it from the cache)"""
+    from scripts.utilities.structural_plotting import write_figure_files
+    
+    trace = current_trace()
+    output_pdf = project_root / "output" / "Ghali_Beam_Design.pdf"
+    
+    cache = get_default_cache() if use_cache else None
+    if cache is not None:
+        cache_key = cache.compute_key(latex_content, figure_data=figures)
+        hit = cache.fetch(cache_key, output_pdf)
+        trace.cache(hit)
+        if hit:
+            print(f"   ⚡ PDF reused from cache: {output_pdf}")
+            return str(output_pdf)
     
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         tex_file = temp_path / "ghali_calculation.tex"
-        
-        # Write LaTeX content
-        with open(tex_file, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
-        
-        # Copy plot files
-        reports_dir = project_root / "reports" / "figures"
-        plot_files = ["beam_diagram.pdf", "bmd_sfd.pdf", "steel_layout.pdf"]
-        
-        for plot_file in plot_files:
-            source = reports_dir / plot_file
-            if source.exists():
-                shutil.copy2(source, temp_path)
+
+        write_figure_files(figures, temp_path)
         
         # Compile PDF
         try:
-            result = subprocess.run([
-                'pdflatex', '-interaction=nonstopmode', tex_file.name
-            ], cwd=temp_path, capture_output=True, text=True)
+            start = time.perf_counter()
+            result = run_pdflatex(tex_file, latex_content, 'standard')
+            trace.latex_run(result, time.perf_counter() - start)
+            trace.file_written(tex_file, 'tex')
             
             if result.returncode == 0:
                 # Copy to output
@@ -389,12 +135,15 @@ def generate_pdf(beam_length=8.0, dead_load=20.0, live_load=25.0):
                 output_dir.mkdir(exist_ok=True)
                 
                 pdf_file = temp_path / "ghali_calculation.pdf"
-                output_pdf = output_dir / "Ghali_Beam_Design.pdf"
                 
                 if pdf_file.exists():
                     shutil.copy2(pdf_file, output_pdf)
+                    if cache is not None:
+                        cache.store(cache_key, pdf_file)
+                    trace.file_written(output_pdf)
                     print(f"   ✓ PDF created: {output_pdf}")
                     print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+                    print(f"   ⏱️ {result.describe()}")
                     return str(output_pdf)
                     
         except FileNotFoundError:
@@ -410,10 +159,14 @@ if __name__ == "__main__":
     parser.add_argument('--length', type=float, default=8.0, help='Beam length (m)')
     parser.add_argument('--dead-load', type=float, default=20.0, help='Dead load (kN/m)')
     parser.add_argument('--live-load', type=float, default=25.0, help='Live load (kN/m)')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
-    pdf_path = generate_pdf(args.length, args.dead_load, args.live_load)
+    pdf_path = generate_pdf(args.length, args.dead_load, args.live_load,
+                            use_cache=not args.no_cache)
     
     if pdf_path:
         print(f"\n🎉 SUCCESS! Professional PDF generated")
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Precompiled LaTeX Preamble Formats
+=====================================================
+Dumps the package-loading part of a template preamble (\\documentclass and
+\\usepackage lines) into a pdflatex format file, so each sheet starts from a
+preloaded state instead of re-reading geometry, siunitx, fancyhdr, titlesec,
+microtype and friends.
+
+Formats are keyed by template style plus a hash of the dumped preamble and
+the pdflatex version, so editing a template's packages (or upgrading TeX)
+builds a new format automatically. Everything else in the preamble (colors,
+page styles, placeholders) still runs per sheet. If a format cannot be
+built, generators fall back to a normal pdflatex run.
+
+run_pdflatex() repeats a pass only while LaTeX asks for it: the log
+requests a rerun (changed labels, longtable widths, outlines) or references
+are still undefined and the .aux changed during the pass. Sheets without
+cross-references compile in one pass; the duration of every pass is
+returned with the result.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Project paths
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+
+DEFAULT_FORMAT_DIR = project_root / "output" / ".latex_formats"
+
+# Template files by the style name passed to prepare_precompiled()
+TEMPLATE_FILES = {
+    'standard': "standard_beam_template.tex",
+    'cambridge': "cambridge_style_template.tex",
+    'aci318_method_c': "aci318_method_c_template.tex",
+    'structural_calculation': "structural_calculation_template.tex"
+}
+
+BEGIN_DOCUMENT = r'\begin{document}'
+DUMPABLE_COMMAND = re.compile(
+    r'\\(?:documentclass|usepackage|RequirePackage)\s*(?:\[[^\]]*\])?\s*\{[^}]*\}')
+COMMENT = re.compile(r'(?<!\\)%.*')
+
+MAX_PASSES = 4
+RERUN_REQUEST = re.compile(r'Rerun to get|Rerun LaTeX|Please rerun LaTeX|'
+                           r'Label\(s\) may have changed')
+UNDEFINED_REFERENCES = 'There were undefined references'
+
+_pdflatex_version: Optional[str] = None
+_failed_formats = set()
+
+
+def _mask_comments(text: str) -> str:
+    """Blank out LaTeX comments while keeping character offsets"""
+    return COMMENT.sub(lambda m: ' ' * len(m.group(0)), text)
+
+
+def split_preamble(latex_content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a document into its dumpable preamble and the per-sheet remainder
+
+    Args:
+        latex_content (str): Complete LaTeX document
+
+    Returns:
+        tuple: (format_source, runtime_source), or None if the document has
+        no preamble to precompile
+    """
+    begin = latex_content.find(BEGIN_DOCUMENT)
+    if begin < 0:
+        return None
+
+    preamble = latex_content[:begin]
+    matches = list(DUMPABLE_COMMAND.finditer(_mask_comments(preamble)))
+    if not matches or not matches[0].group(0).startswith(r'\documentclass'):
+        return None
+
+    format_source = '\n'.join(m.group(0) for m in matches) + '\n'
+
+    runtime_parts = []
+    position = 0
+    for match in matches:
+        runtime_parts.append(preamble[position:match.start()])
+        position = match.end()
+    runtime_parts.append(preamble[position:])
+
+    return format_source, ''.join(runtime_parts) + latex_content[begin:]
+
+
+def pdflatex_version() -> Optional[str]:
+    """First line of `pdflatex --version`, or None when LaTeX is not installed"""
+    global _pdflatex_version
+    if _pdflatex_version is None:
+        try:
+            result = subprocess.run(['pdflatex', '--version'],
+                                    capture_output=True, text=True)
+            _pdflatex_version = result.stdout.splitlines()[0] if result.stdout else ''
+        except FileNotFoundError:
+            _pdflatex_version = ''
+    return _pdflatex_version or None
+
+
+def format_name(template_style: str, format_source: str, version: str) -> str:
+    """Format file stem for a template style and dumped preamble"""
+    digest = hashlib.sha256((version + '\n' + format_source).encode('utf-8')).hexdigest()
+    style = re.sub(r'[^A-Za-z0-9]+', '_', template_style).strip('_').lower()
+    return f"ghali_{style}_{digest[:16]}"
+
+
+def build_format(name: str, format_source: str,
+                 format_dir: Path = DEFAULT_FORMAT_DIR) -> Optional[Path]:
+    """
+    Dump a preamble into <format_dir>/<name>.fmt
+
+    Args:
+        name (str): Format file stem
+        format_source (str): \\documentclass and \\usepackage lines to dump
+        format_dir (Path): Directory holding format files
+
+    Returns:
+        Path: The format file, or None if pdflatex could not dump it
+    """
+    format_dir = Path(format_dir)
+    format_file = format_dir / f"{name}.fmt"
+    if format_file.exists():
+        return format_file
+    if name in _failed_formats:
+        return None
+
+    format_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        (temp_path / "preamble.tex").write_text(format_source + '\\dump\n', encoding='utf-8')
+
+        try:
+            subprocess.run([
+                'pdflatex', '-ini', '-interaction=nonstopmode', f'-jobname={name}',
+                '&pdflatex', 'preamble.tex'
+            ], cwd=temp_path, capture_output=True, text=True)
+        except FileNotFoundError:
+            _failed_formats.add(name)
+            return None
+
+        built = temp_path / f"{name}.fmt"
+        if not built.exists():
+            _failed_formats.add(name)
+            return None
+
+        # Atomic move so concurrent batch workers never load a partial format
+        os.replace(built, format_file)
+
+    return format_file
+
+
+def prepare_precompiled(latex_content: str, template_style: str,
+                        format_dir: Path = DEFAULT_FORMAT_DIR
+                        ) -> Tuple[str, List[str], Optional[Dict[str, str]]]:
+    """
+    Prepare a document for compilation against a dumped preamble format
+
+    Args:
+        latex_content (str): Populated LaTeX document
+        template_style (str): Template style used to name the format
+        format_dir (Path): Directory holding format files
+
+    Returns:
+        tuple: (latex source to write, extra pdflatex arguments, environment
+        for subprocess.run). Falls back to (latex_content, [], None) when no
+        format is available.
+    """
+    if os.environ.get('GHALI_NO_LATEX_FORMAT'):
+        return latex_content, [], None
+
+    split = split_preamble(latex_content)
+    version = pdflatex_version()
+    if split is None or version is None:
+        return latex_content, [], None
+
+    format_source, runtime_source = split
+    name = format_name(template_style, format_source, version)
+    format_file = build_format(name, format_source, format_dir)
+    if format_file is None:
+        return latex_content, [], None
+
+    # Let kpathsea find the format; the trailing separator keeps default paths
+    env = dict(os.environ)
+    env['TEXFORMATS'] = f"{format_file.parent}{os.pathsep}{env.get('TEXFORMATS', '')}"
+
+    return runtime_source, [f'-fmt={name}'], env
+
+
+def _write_source(tex_file: Path, latex_source: str, body_files: Sequence[Path]):
+    """Write the document head, then append body files in chunks"""
+    with open(tex_file, 'w', encoding='utf-8') as f:
+        f.write(latex_source)
+        for body_file in body_files:
+            with open(body_file, 'r', encoding='utf-8') as part:
+                shutil.copyfileobj(part, f)
+
+
+class LatexRun(subprocess.CompletedProcess):
+    """Result of the last pdflatex pass, with the duration of every pass"""
+
+    def __init__(self, result: subprocess.CompletedProcess, pass_times: List[float]):
+        super().__init__(result.args, result.returncode, result.stdout, result.stderr)
+        self.pass_times = pass_times
+
+    @property
+    def passes(self) -> int:
+        return len(self.pass_times)
+
+    def describe(self) -> str:
+        """Summary such as '2 pdflatex passes (0.41 s + 0.38 s)'"""
+        times = ' + '.join(f"{seconds:.2f} s" for seconds in self.pass_times)
+        plural = 'es' if self.passes != 1 else ''
+        return f"{self.passes} pdflatex pass{plural} ({times})"
+
+
+def _file_digest(path: Path) -> Optional[bytes]:
+    try:
+        return hashlib.sha256(path.read_bytes()).digest()
+    except FileNotFoundError:
+        return None
+
+
+def needs_rerun(log_text: str, aux_before: Optional[bytes], aux_after: Optional[bytes]) -> bool:
+    """
+    Whether another pdflatex pass is required
+
+    Args:
+        log_text (str): Log of the pass just run
+        aux_before: Digest of the .aux file before the pass (None if absent)
+        aux_after: Digest of the .aux file after the pass
+
+    Returns:
+        bool: True if LaTeX requested a rerun, or references are undefined
+        and the .aux changed (a later pass may resolve them)
+    """
+    if RERUN_REQUEST.search(log_text):
+        return True
+    return UNDEFINED_REFERENCES in log_text and aux_before != aux_after
+
+
+def _run_pass(command: List[str], tex_file: Path, env: Optional[Dict[str, str]],
+              pass_times: List[float], deadline: Optional[float] = None
+              ) -> Tuple[subprocess.CompletedProcess, bool]:
+    """Run one pdflatex pass; returns (result, rerun needed)"""
+    aux_file = tex_file.with_suffix('.aux')
+    log_file = tex_file.with_suffix('.log')
+    aux_before = _file_digest(aux_file)
+
+    start = time.perf_counter()
+    timeout = None if deadline is None else max(deadline - start, 0.0)
+    try:
+        result = subprocess.run(command, cwd=tex_file.parent, capture_output=True, text=True,
+                                env=env, timeout=timeout)
+    finally:
+        pass_times.append(time.perf_counter() - start)
+
+    if log_file.exists():
+        log_text = log_file.read_text(encoding='utf-8', errors='replace')
+    else:
+        log_text = result.stdout or ''
+    return result, needs_rerun(log_text, aux_before, _file_digest(aux_file))
+
+
+def run_pdflatex(tex_file: Path, latex_content: str, template_style: str,
+                 body_files: Sequence[Union[str, Path]] = (),
+                 max_passes: int = MAX_PASSES, timeout: Optional[float] = None) -> LatexRun:
+    """
+    Write a document and compile it, using a precompiled preamble when possible
+
+    Passes are repeated only while LaTeX requests it (see needs_rerun), up
+    to max_passes. Falls back to a plain pdflatex run if compiling against
+    the format fails. Raises FileNotFoundError when pdflatex is not installed
+    and subprocess.TimeoutExpired (after killing pdflatex) when the passes
+    exceed the timeout.
+
+    Args:
+        tex_file (Path): Destination .tex file; pdflatex runs in its directory
+        latex_content (str): Populated LaTeX document, or its head (preamble
+            included) when body_files are given
+        template_style (str): Template style used to name the format
+        body_files: Files appended after latex_content, streamed rather than
+            held in memory (e.g. the member sections of a long report)
+        max_passes (int): Upper bound on pdflatex passes
+        timeout (float, optional): Seconds allowed for all passes together
+
+    Returns:
+        LatexRun: subprocess.CompletedProcess of the last pass, plus
+        pass_times (seconds per pass, failed format attempt included)
+    """
+    tex_file = Path(tex_file)
+    body_files = [Path(body_file) for body_file in body_files]
+    latex_source, format_args, env = prepare_precompiled(latex_content, template_style)
+    pass_times: List[float] = []
+    deadline = None if timeout is None else time.perf_counter() + timeout
+
+    _write_source(tex_file, latex_source, body_files)
+    command = ['pdflatex', *format_args, '-interaction=nonstopmode', tex_file.name]
+    result, rerun = _run_pass(command, tex_file, env, pass_times, deadline)
+
+    if result.returncode != 0 and format_args:
+        _write_source(tex_file, latex_content, body_files)
+        command, env = ['pdflatex', '-interaction=nonstopmode', tex_file.name], None
+        result, rerun = _run_pass(command, tex_file, env, pass_times, deadline)
+
+    while result.returncode == 0 and rerun and len(pass_times) < max_passes:
+        result, rerun = _run_pass(command, tex_file, env, pass_times, deadline)
+
+    return LatexRun(result, pass_times)
+
+
+def template_sources() -> Dict[str, str]:
+    """LaTeX source of every template, keyed by the style name generators use"""
+    templates_dir = project_root / "templates"
+    sources = {}
+    for style, file_name in TEMPLATE_FILES.items():
+        template_path = templates_dir / file_name
+        if template_path.exists():
+            sources[style] = template_path.read_text(encoding='utf-8')
+    return sources
+
+
+def warm_formats(styles: Optional[Sequence[str]] = None,
+                 format_dir: Path = DEFAULT_FORMAT_DIR) -> Dict[str, Optional[Path]]:
+    """
+    Build the preamble formats of the given template styles ahead of use
+
+    Args:
+        styles: Template styles to prepare (defaults to all templates)
+        format_dir (Path): Directory holding format files
+
+    Returns:
+        Dict: Style → format file (None where no format could be built)
+    """
+    if os.environ.get('GHALI_NO_LATEX_FORMAT'):
+        return {}
+
+    version = pdflatex_version()
+    formats = {}
+    for style, source in template_sources().items():
+        if styles is not None and style not in styles:
+            continue
+        split = split_preamble(source)
+        if version is None or split is None:
+            formats[style] = None
+            continue
+        formats[style] = build_format(format_name(style, split[0], version), split[0],
+                                      format_dir)
+    return formats
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.path.append(str(project_root))
+
+    print("🧰 GHALI CONSULTANTS - Preamble Format Builder")
+    print("=" * 50)
+
+    version = pdflatex_version()
+    if version is None:
+        print("   ❌ LaTeX not found. Install TinyTeX or MiKTeX.")
+        sys.exit(1)
+
+    for style, source in template_sources().items():
+        split = split_preamble(source)
+        if split is None:
+            print(f"   ⚠️ No preamble found: {style}")
+            continue
+        name = format_name(style, split[0], version)
+        format_file = build_format(name, split[0])
+        marker = "✓" if format_file else "❌"
+        print(f"   {marker} {style} → {format_file or name}")
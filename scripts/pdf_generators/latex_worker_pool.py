@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - LaTeX Worker Pool
+=====================================
+Long-lived compile workers that PDF generators submit sheets to through a
+local job queue, instead of each generator setting up its own pdflatex run.
+
+The workers are started once per batch and stay warm: the preamble formats
+of the requested template styles are dumped before the first job (see
+latex_format.warm_formats), so every pass starts from preloaded packages
+and fonts rather than re-reading them. pdflatex itself cannot typeset a
+second document in the same process, so each pass is still a short child
+process; the pool bounds how many run at once, enforces a per-sheet
+timeout and records the latency of every sheet:
+
+    wait     time spent queued before a worker picked the sheet up
+    compile  time inside pdflatex (all passes)
+    latency  submit → PDF in place (wait + compile + file copies)
+
+Usage:
+    with LatexWorkerPool(workers=4, warm_styles=['standard']) as pool:
+        future = pool.submit('B001', latex_content, 'standard', output_pdf, files)
+        record = future.result()
+    pool.print_latency_report()
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.pdf_generators.latex_format import MAX_PASSES, run_pdflatex, warm_formats
+
+DEFAULT_TIMEOUT = 120.0       # Seconds allowed per sheet (all passes)
+LOG_TAIL_LINES = 20           # Lines of pdflatex output kept for failed sheets
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence"""
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(fraction * len(ordered)))) - 1
+    return ordered[rank]
+
+
+class LatexWorkerPool:
+    """Persistent pdflatex workers fed from a local job queue"""
+
+    def __init__(self, workers: Optional[int] = None, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 max_passes: int = MAX_PASSES, warm_styles: Optional[Sequence[str]] = None):
+        """
+        Start the workers
+
+        Args:
+            workers (int, optional): Sheets compiled concurrently, defaults to
+                the CPU count
+            timeout (float, optional): Seconds allowed per sheet; None disables
+            max_passes (int): Upper bound on pdflatex passes per sheet
+            warm_styles: Template styles whose preamble formats are built
+                before the first job (None builds none)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_passes = max_passes
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+
+        if warm_styles:
+            warm_formats(warm_styles)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="ghali_latex")
+
+    def submit(self, name: str, latex_content: str, template_style: str,
+               output_pdf: Union[str, Path], files: Sequence[Union[str, Path]] = (),
+               body_files: Sequence[Union[str, Path]] = (),
+               figures: Optional[Mapping[str, bytes]] = None) -> Future:
+        """
+        Queue one sheet for compilation
+
+        Args:
+            name (str): Sheet name, also the .tex file stem
+            latex_content (str): Populated LaTeX document (or its head, see
+                run_pdflatex body_files)
+            template_style (str): Template style used to pick the format
+            output_pdf: Destination of the compiled PDF
+            files: Figures and other inputs copied next to the .tex file
+            body_files: Files appended after latex_content
+            figures: In-memory figures (file name → bytes) written straight
+                into the build directory
+
+        Returns:
+            Future: Resolves to the sheet's record: name, status ('ok',
+            'failed' or 'timeout'), output, pass_times, wait, compile and
+            latency (seconds) and, on failure, the tail of the pdflatex log
+        """
+        job = {
+            'name': name,
+            'latex_content': latex_content,
+            'template_style': template_style,
+            'output_pdf': Path(output_pdf),
+            'files': [Path(f) for f in files],
+            'body_files': [Path(f) for f in body_files],
+            'figures': figures or {},
+            'submitted': time.perf_counter()
+        }
+        return self._executor.submit(self._compile, job)
+
+    def _compile(self, job: Dict) -> Dict:
+        """Compile one sheet in its own temporary directory"""
+        started = time.perf_counter()
+        record = {'name': job['name'], 'status': 'failed', 'output': None,
+                  'pass_times': [], 'wait': started - job['submitted']}
+
+        with tempfile.TemporaryDirectory(prefix="ghali_latex_") as temp_dir:
+            temp_path = Path(temp_dir)
+            tex_file = temp_path / f"{job['name']}.tex"
+            for source in job['files']:
+                if source.exists():
+                    shutil.copy2(source, temp_path)
+            for file_name, data in job['figures'].items():
+                (temp_path / file_name).write_bytes(data)
+
+            compile_start = time.perf_counter()
+            try:
+                result = run_pdflatex(tex_file, job['latex_content'], job['template_style'],
+                                      body_files=job['body_files'],
+                                      max_passes=self.max_passes, timeout=self.timeout)
+                record['pass_times'] = result.pass_times
+                pdf_file = tex_file.with_suffix('.pdf')
+                if result.returncode == 0 and pdf_file.exists():
+                    job['output_pdf'].parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(pdf_file, job['output_pdf'])
+                    record['status'] = 'ok'
+                    record['output'] = str(job['output_pdf'])
+                else:
+                    log = result.stdout or result.stderr or ''
+                    record['error'] = '\n'.join(log.splitlines()[-LOG_TAIL_LINES:])
+            except subprocess.TimeoutExpired:
+                record['status'] = 'timeout'
+                record['error'] = f"pdflatex exceeded {self.timeout:.0f} s"
+            except FileNotFoundError:
+                record['error'] = "LaTeX not found. Install TinyTeX or MiKTeX."
+            record['compile'] = time.perf_counter() - compile_start
+
+        record['latency'] = time.perf_counter() - job['submitted']
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    def latency_report(self) -> Dict:
+        """
+        Per-sheet latency statistics over all finished sheets
+
+        Returns:
+            Dict: sheets, succeeded, passes (total), and p50/p95/max of
+            latency, compile and wait (seconds)
+        """
+        with self._lock:
+            records = list(self.records)
+
+        report = {
+            'sheets': len(records),
+            'succeeded': sum(1 for r in records if r['status'] == 'ok'),
+            'passes': sum(len(r['pass_times']) for r in records)
+        }
+        for key in ('latency', 'compile', 'wait'):
+            values = [r[key] for r in records]
+            report[key] = {
+                'p50': _percentile(values, 0.50) if values else 0.0,
+                'p95': _percentile(values, 0.95) if values else 0.0,
+                'max': max(values) if values else 0.0
+            }
+        return report
+
+    def print_latency_report(self):
+        """Print the latency statistics"""
+        report = self.latency_report()
+        if not report['sheets']:
+            print("   ⏱️ No sheets compiled")
+            return
+        print(f"   ⏱️ {report['sheets']} sheets, {report['passes']} pdflatex passes "
+              f"on {self.workers} LaTeX workers")
+        for key in ('latency', 'compile', 'wait'):
+            stats = report[key]
+            print(f"      {key:<8} p50 {stats['p50']:.2f} s · p95 {stats['p95']:.2f} s · "
+                  f"max {stats['max']:.2f} s")
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting sheets; by default wait for queued sheets to finish"""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.shutdown(wait=exc_type is None)
+        return False
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Compiled PDF Cache
+=====================================
+Content-addressed on-disk cache for compiled calculation sheets.
+
+The cache key is a SHA-256 hash of the populated LaTeX source plus the bytes
+of every included figure. When the key matches a stored PDF, generators copy
+it to the output location and skip pdflatex entirely. The cache is bounded in
+size and evicts the least recently used PDFs first.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+# Project paths
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+
+DEFAULT_CACHE_DIR = project_root / "output" / ".pdf_cache"
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024  # 500 MB
+
+
+class PDFCache:
+    """Size-bounded LRU cache of compiled PDFs keyed by their inputs"""
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir (str): Directory holding cached PDFs
+            max_bytes (int): Maximum total size before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def compute_key(latex_content: str, figure_paths: Iterable[Union[str, Path]] = (),
+                    figure_data: Optional[Mapping[str, bytes]] = None) -> str:
+        """
+        Hash the populated LaTeX source and the included figures
+
+        Args:
+            latex_content (str): Populated LaTeX source
+            figure_paths: Figure files included by the document; missing
+                files are hashed by name only
+            figure_data: In-memory figures (file name → bytes); hashed the
+                same way as a file of that name and content
+
+        Returns:
+            str: Hex digest identifying the compiled PDF
+        """
+        digest = hashlib.sha256()
+        digest.update(latex_content.encode('utf-8'))
+
+        figures = [(Path(p).name, Path(p)) for p in figure_paths]
+        figures += list((figure_data or {}).items())
+        for name, source in sorted(figures, key=lambda figure: figure[0]):
+            digest.update(b'\0' + name.encode('utf-8') + b'\0')
+            if isinstance(source, Path):
+                if source.exists():
+                    digest.update(source.read_bytes())
+            else:
+                digest.update(source)
+
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pdf"
+
+    def fetch(self, key: str, destination: Union[str, Path]) -> bool:
+        """
+        Copy a cached PDF to destination if present
+
+        Args:
+            key (str): Cache key from compute_key()
+            destination (str): Output PDF path
+
+        Returns:
+            bool: True on a cache hit
+        """
+        entry = self._entry(key)
+
+        if not entry.exists():
+            self.misses += 1
+            return False
+
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(entry, destination)
+        os.utime(entry)  # Mark as most recently used
+        self.hits += 1
+        return True
+
+    def store(self, key: str, pdf_path: Union[str, Path]) -> Optional[Path]:
+        """
+        Add a freshly compiled PDF to the cache
+
+        Args:
+            key (str): Cache key from compute_key()
+            pdf_path (str): Compiled PDF to store
+
+        Returns:
+            Path: Cached entry, or None if the PDF does not exist
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            return None
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = self._entry(key)
+
+        # Write atomically so concurrent batch workers never see partial files
+        fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(pdf_path, temp_name)
+        os.replace(temp_name, entry)
+
+        self.evict()
+        return entry
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        if not self.cache_dir.exists():
+            return
+
+        entries = []
+        for entry in self.cache_dir.glob('*.pdf'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every cached PDF"""
+        if self.cache_dir.exists():
+            for entry in self.cache_dir.glob('*.pdf'):
+                entry.unlink()
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current cache footprint"""
+        entries = list(self.cache_dir.glob('*.pdf')) if self.cache_dir.exists() else []
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(entry.stat().st_size for entry in entries),
+            'max_bytes': self.max_bytes
+        }
+
+
+_default_cache: Optional[PDFCache] = None
+
+
+def get_default_cache() -> PDFCache:
+    """Shared cache instance used by the PDF generators"""
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.environ.get('GHALI_PDF_CACHE_DIR', DEFAULT_CACHE_DIR)
+        max_mb = os.environ.get('GHALI_PDF_CACHE_MB')
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        _default_cache = PDFCache(cache_dir, max_bytes)
+    return _default_cache
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect or clear the compiled PDF cache')
+    parser.add_argument('--clear', action='store_true', help='Remove all cached PDFs')
+
+    args = parser.parse_args()
+
+    cache = get_default_cache()
+    if args.clear:
+        cache.clear()
+        print(f"🧹 Cleared PDF cache: {cache.cache_dir}")
+
+    stats = cache.stats()
+    print(f"📦 PDF cache: {cache.cache_dir}")
+    print(f"   {stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f} MB "
+          f"of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
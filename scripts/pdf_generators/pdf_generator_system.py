@@ -9,43 +9,60 @@ Author: Ghali Consultants
 Version: 2.0 Unified System
 """
 
-import os
 import sys
-import json
-import re
-import subprocess
 import tempfile
 import shutil
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Union
 
 # Add project root to Python path
 script_dir = Path(__file__).parent
-project_root = script_dir.parent
+project_root = script_dir.parent.parent
 sys.path.append(str(project_root))
 
-from scripts.structural_plotting import create_all_structural_plots
+from scripts.utilities.notebook_extractor import extract_beam_values
+from scripts.pdf_generators.pdf_cache import get_default_cache
+from scripts.pdf_generators.latex_format import run_pdflatex
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+from scripts.pdf_generators.template_engine import get_template
+from scripts.pdf_generators.ghali_pdf_generator import STANDARD_TEMPLATE
+
+# matplotlib (structural_plotting), numpy (calculations), Jinja2 and
+# reportlab are imported by the steps that need them, so --help and the
+# reportlab path start without loading the LaTeX pipeline's dependencies
 
 class GhaliPDFGenerator:
     """Unified PDF generator for structural calculations"""
     
-    def __init__(self, template_style="standard"):
+    def __init__(self, template_style="standard", use_cache=True, engine="latex"):
         """
         Initialize PDF generator
         
         Args:
             template_style (str): "standard" or "cambridge"
+            use_cache (bool): Reuse previously compiled PDFs with identical inputs
+            engine (str): "latex" (pdflatex) or "reportlab" (pure Python, no LaTeX)
         """
         self.template_style = template_style.lower()
+        self.engine = engine.lower()
         self.project_root = project_root
+        self.cache = get_default_cache() if use_cache else None
+        self.latex_pass_times: List[float] = []  # Seconds per pdflatex pass of the last compile
         
         if self.template_style not in ["standard", "cambridge"]:
             raise ValueError("Template style must be 'standard' or 'cambridge'")
+        if self.engine not in ["latex", "reportlab"]:
+            raise ValueError("Engine must be 'latex' or 'reportlab'")
     
     def extract_from_notebook(self, notebook_path: str) -> Dict:
         """
         Extract calculation data from Jupyter notebook
         
+        Values the notebook published in its outputs take precedence over
+        values evaluated from its source; anything missing uses defaults.
+        
         Args:
             notebook_path (str): Path to notebook file
             
@@ -53,66 +70,40 @@ class GhaliPDFGenerator:
             Dict: Extracted beam parameters and results
         """
         try:
-            import nbformat
-            
-            notebook_path = Path(notebook_path)
-            if not notebook_path.exists():
-                raise FileNotFoundError(f"Notebook not found: {notebook_path}")
-            
-            with open(notebook_path, 'r', encoding='utf-8') as f:
-                nb = nbformat.read(f, as_version=4)
-            
-            # Extract variables from code cells
-            extracted_data = {}
-            
-            for cell in nb.cells:
-                if cell.cell_type == 'code':
-                    source = cell.source
-                    
-                    # Extract common beam parameters
-                    patterns = {
-                        'length': r'(?:L|length|beam_length)\s*=\s*([\d.]+)',
-                        'dead_load': r'(?:w_d|dead_load|DL)\s*=\s*([\d.]+)', 
-                        'live_load': r'(?:w_l|live_load|LL)\s*=\s*([\d.]+)',
-                        'width': r'(?:b|width|beam_width)\s*=\s*([\d.]+)',
-                        'height': r'(?:h|height|beam_height)\s*=\s*([\d.]+)',
-                        'fc': r'(?:f_c|fc|concrete_strength)\s*=\s*([\d.]+)',
-                        'fy': r'(?:f_y|fy|steel_strength)\s*=\s*([\d.]+)'
-                    }
-                    
-                    for param, pattern in patterns.items():
-                        match = re.search(pattern, source, re.IGNORECASE)
-                        if match:
-                            extracted_data[param] = float(match.group(1))
-            
-            # Set defaults if not found
-            defaults = {
-                'length': 8.0,
-                'dead_load': 20.0,
-                'live_load': 25.0,
-                'width': 350,
-                'height': 600,
-                'fc': 25,
-                'fy': 420
-            }
-            
-            for key, default_value in defaults.items():
-                if key not in extracted_data:
-                    extracted_data[key] = default_value
-            
-            # Calculate derived values
-            extracted_data['factored_load'] = 1.2 * extracted_data['dead_load'] + 1.6 * extracted_data['live_load']
-            extracted_data['steel_area_req'] = int(extracted_data['length'] * 225)  # Approximate
-            extracted_data['bar_diameter'] = 25
-            
-            return extracted_data
-            
-        except ImportError:
-            print("Warning: nbformat not installed. Using default values.")
-            return self._get_default_beam_data()
+            extracted_data, sources = extract_beam_values(notebook_path)
         except Exception as e:
             print(f"Warning: Could not extract from notebook: {e}")
             return self._get_default_beam_data()
+        
+        from_results = sum(1 for origin in sources.values() if origin == 'results')
+        print(f"   ✓ {len(sources)} values found "
+              f"({from_results} from outputs, {len(sources) - from_results} from source)")
+        
+        # Set defaults if not found
+        defaults = {
+            'length': 8.0,
+            'dead_load': 20.0,
+            'live_load': 25.0,
+            'width': 350,
+            'height': 600,
+            'fc': 25,
+            'fy': 420,
+            'bar_diameter': 25
+        }
+        
+        for key, default_value in defaults.items():
+            if key not in extracted_data:
+                extracted_data[key] = default_value
+        
+        # Derive values the notebook did not provide
+        if 'factored_load' not in extracted_data:
+            from scripts.calculations.load_combinations import governing_factored_load
+            extracted_data['factored_load'], extracted_data['load_combination'] = \
+                governing_factored_load(extracted_data['dead_load'], extracted_data['live_load'])
+        if 'steel_area_req' not in extracted_data:
+            extracted_data['steel_area_req'] = int(extracted_data['length'] * 225)  # Approximate
+        
+        return extracted_data
     
     def _get_default_beam_data(self) -> Dict:
         """Get default beam data when notebook extraction fails"""
@@ -129,110 +120,200 @@ class GhaliPDFGenerator:
             'bar_diameter': 25
         }
     
-    def generate_plots(self, beam_data: Dict) -> Dict:
-        """Generate structural plots for beam data"""
+    def _get_default_project_info(self, beam_data: Dict) -> Dict:
+        """Get default project information for a beam"""
+        return {
+            'project_id': f'GC-{self.template_style.upper()}-2025',
+            'title': f"{beam_data['length']:.1f}m RC Beam Design",
+            'engineer': 'Ahmed Ghali, P.E.',
+            'reviewer': 'Senior Engineer, P.E.'
+        }
+    
+    def generate_plots(self, beam_data: Dict, output_dir: Optional[Union[str, Path]] = None,
+                       in_memory: bool = False) -> Dict:
+        """
+        Generate structural plots for beam data
+        
+        Args:
+            beam_data (Dict): Beam parameters
+            output_dir (str, optional): Figure directory (defaults to reports/figures)
+            in_memory (bool): Return the figure PDFs under 'files' (file name →
+                bytes) for compile_pdf instead of writing them
+            
+        Returns:
+            Dict: Figure paths (or bytes) and calculated values
+        """
+        from scripts.utilities.structural_plotting import create_all_structural_plots, EXPORT_PRESETS
+        
         print("📊 Generating structural plots...")
-        plots_data = create_all_structural_plots(beam_data)
+        if output_dir is None:
+            output_dir = self.project_root / "reports" / "figures"
+        plots_data = create_all_structural_plots(beam_data, output_dir,
+                                                 **EXPORT_PRESETS['latex'], in_memory=in_memory)
         print("   ✓ Professional structural diagrams created")
         return plots_data
     
-    def load_template(self) -> str:
-        """Load the appropriate LaTeX template"""
+    def load_template(self):
+        """Load the appropriate compiled LaTeX template"""
         if self.template_style == "cambridge":
             template_file = "cambridge_style_template.tex"
         else:
-            # Use the embedded standard template
-            return self._get_standard_template()
+            template_file = STANDARD_TEMPLATE
         
         template_path = self.project_root / "templates" / template_file
         
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    
-    def _get_standard_template(self) -> str:
-        """Embedded standard template for reliability"""
-        # Import from the existing ghali_pdf_generator
-        try:
-            from scripts.ghali_pdf_generator import create_latex_template
-            return create_latex_template()
-        except ImportError:
-            raise ImportError("Could not load standard template")
+        return get_template(template_file)
     
-    def populate_template(self, template: str, beam_data: Dict, project_info: Dict) -> str:
-        """Populate template with beam data and project information"""
+    def template_context(self, beam_data: Dict, project_info: Dict) -> Dict:
+        """
+        Values a sheet is rendered from, shared by the LaTeX and reportlab engines
         
-        # Calculate design forces
+        Args:
+            beam_data (Dict): Beam parameters
+            project_info (Dict): Project information
+            
+        Returns:
+            Dict: beam (with its design checks), members, schedule, project
+            and project_id
+        """
+        from scripts.calculations.aci318_flexure import beam_checks
+        from scripts.calculations.load_combinations import governing_factored_load
+        
+        # Design forces (computed notebook values take precedence)
         L = beam_data['length']
         w_u = beam_data['factored_load']
-        max_moment = w_u * L**2 / 8
-        max_shear = w_u * L / 2
+        load_combination = beam_data.get('load_combination') or \
+            governing_factored_load(beam_data['dead_load'], beam_data['live_load'])[1]
         
-        # Common replacements for both templates
-        replacements = {
-            'BEAM_LENGTH_PLACEHOLDER': f"{beam_data['length']:.1f}",
-            'DEAD_LOAD_PLACEHOLDER': f"{beam_data['dead_load']:.1f}",
-            'LIVE_LOAD_PLACEHOLDER': f"{beam_data['live_load']:.1f}",
-            'FACTORED_LOAD_PLACEHOLDER': f"{beam_data['factored_load']:.1f}",
-            'BEAM_WIDTH_PLACEHOLDER': str(beam_data['width']),
-            'BEAM_HEIGHT_PLACEHOLDER': str(beam_data['height']),
-            'EFFECTIVE_DEPTH_PLACEHOLDER': str(beam_data['height'] - 50),
-            'STEEL_AREA_PLACEHOLDER': str(beam_data['steel_area_req']),
-            'MAX_MOMENT_PLACEHOLDER': f"{max_moment:.1f}",
-            'MAX_SHEAR_PLACEHOLDER': f"{max_shear:.1f}",
-            'PROJECT_ID_PLACEHOLDER': project_info.get('project_id', 'GC-2025-001'),
-            'PROJECT_TITLE_PLACEHOLDER': project_info.get('title', f"{beam_data['length']:.1f}m RC Beam Design"),
-            'ENGINEER_NAME_PLACEHOLDER': project_info.get('engineer', 'Ahmed Ghali, P.E.'),
-            'REVIEWER_NAME_PLACEHOLDER': project_info.get('reviewer', 'Senior Engineer, P.E.')
+        # Template values for both styles; the Cambridge report lists this
+        # beam as its only member, with figures next to the .tex file
+        beam = {
+            **beam_data,
+            'name': beam_data.get('name', f"{L:.1f} m beam"),
+            'figure_dir': '.',
+            'load_combination': load_combination.split(': ')[-1],
+            'effective_depth': beam_data.get('effective_depth', beam_data['height'] - 50),
+            'max_moment': beam_data.get('max_moment', w_u * L**2 / 8),
+            'max_shear': beam_data.get('max_shear', w_u * L / 2)
+        }
+        beam['checks'] = beam_checks(beam)
+        project = {
+            'project_id': project_info.get('project_id', 'GC-2025-001'),
+            'title': project_info.get('title', f"{L:.1f}m RC Beam Design"),
+            'engineer': project_info.get('engineer', 'Ahmed Ghali, P.E.'),
+            'reviewer': project_info.get('reviewer', 'Senior Engineer, P.E.')
         }
         
-        # Apply replacements
-        for placeholder, value in replacements.items():
-            template = template.replace(placeholder, value)
+        return {'beam': beam, 'members': [beam], 'schedule': [beam],
+                'project': project, 'project_id': project['project_id']}
+    
+    def populate_template(self, template, beam_data: Dict, project_info: Dict) -> str:
+        """Render a compiled template with beam data and project information"""
+        return template.render(**self.template_context(beam_data, project_info))
+    
+    def render_reportlab(self, beam_data: Dict, project_info: Dict, output_name: str,
+                         output_dir: Optional[Union[str, Path]] = None) -> str:
+        """
+        Render the sheet with reportlab instead of pdflatex
         
-        return template
+        Figures are drawn in memory, so generate_plots() is not needed first.
+        
+        Args:
+            beam_data (Dict): Beam parameters
+            project_info (Dict): Project information
+            output_name (str): Base name of the output .pdf file
+            output_dir (str, optional): Destination directory (defaults to output/)
+            
+        Returns:
+            str: Path to generated PDF file
+        """
+        from scripts.pdf_generators.reportlab_renderer import render_beam_sheet
+        
+        output_dir = Path(output_dir) if output_dir else self.project_root / "output"
+        return render_beam_sheet(self.template_context(beam_data, project_info),
+                                 output_dir / f"{output_name}.pdf", self.template_style)
     
-    def compile_pdf(self, latex_content: str, output_name: str) -> Optional[str]:
-        """Compile LaTeX content to PDF"""
+    def compile_pdf(self, latex_content: str, output_name: str,
+                    figures_dir: Optional[Union[str, Path]] = None,
+                    output_dir: Optional[Union[str, Path]] = None,
+                    figures: Optional[Mapping[str, bytes]] = None) -> Optional[str]:
+        """
+        Compile LaTeX content to PDF
+        
+        Args:
+            latex_content (str): Populated LaTeX source
+            output_name (str): Base name of the .tex and output .pdf files
+            figures_dir (str, optional): Directory holding the plot PDFs
+                (defaults to reports/figures)
+            output_dir (str, optional): Destination directory (defaults to output/)
+            figures (Mapping, optional): In-memory plot PDFs (file name →
+                bytes), written once straight into the build directory;
+                figures_dir is then not read
+            
+        Returns:
+            str: Path to generated PDF file
+        """
         print(f"🔨 Compiling {self.template_style.title()} style PDF...")
         
+        reports_dir = Path(figures_dir) if figures_dir else self.project_root / "reports" / "figures"
+        plot_files = ["beam_diagram.pdf", "bmd_sfd.pdf", "steel_layout.pdf"]
+        output_dir = Path(output_dir) if output_dir else self.project_root / "output"
+        output_pdf = output_dir / f"{output_name}.pdf"
+        self.latex_pass_times = []
+        trace = current_trace()
+        
+        # Reuse a previously compiled PDF when source and figures are unchanged
+        if self.cache is not None:
+            if figures is not None:
+                cache_key = self.cache.compute_key(latex_content, figure_data=figures)
+            else:
+                cache_key = self.cache.compute_key(latex_content,
+                                                   [reports_dir / f for f in plot_files])
+            hit = self.cache.fetch(cache_key, output_pdf)
+            trace.cache(hit)
+            if hit:
+                print(f"   ⚡ PDF reused from cache: {output_pdf}")
+                return str(output_pdf)
+        
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             tex_file = temp_path / f"{output_name}.tex"
-            
-            # Write LaTeX content
-            with open(tex_file, 'w', encoding='utf-8') as f:
-                f.write(latex_content)
-            
-            # Copy plot files
-            reports_dir = self.project_root / "reports" / "figures"
-            plot_files = ["beam_diagram.pdf", "bmd_sfd.pdf", "steel_layout.pdf"]
-            
-            for plot_file in plot_files:
-                source = reports_dir / plot_file
-                if source.exists():
-                    shutil.copy2(source, temp_path)
+
+            # Write in-memory plots, or copy plot files
+            if figures is not None:
+                from scripts.utilities.structural_plotting import write_figure_files
+                write_figure_files(figures, temp_path)
+            else:
+                for plot_file in plot_files:
+                    source = reports_dir / plot_file
+                    if source.exists():
+                        shutil.copy2(source, temp_path)
             
             # Compile PDF
             try:
-                result = subprocess.run([
-                    'pdflatex', '-interaction=nonstopmode', tex_file.name
-                ], cwd=temp_path, capture_output=True, text=True)
+                start = time.perf_counter()
+                result = run_pdflatex(tex_file, latex_content, self.template_style)
+                trace.latex_run(result, time.perf_counter() - start)
+                trace.file_written(tex_file, 'tex')
+                self.latex_pass_times = result.pass_times
                 
                 if result.returncode == 0:
                     # Copy to output
-                    output_dir = self.project_root / "output"
-                    output_dir.mkdir(exist_ok=True)
+                    output_dir.mkdir(parents=True, exist_ok=True)
                     
                     pdf_file = temp_path / f"{output_name}.pdf"
-                    output_pdf = output_dir / f"{output_name}.pdf"
                     
                     if pdf_file.exists():
                         shutil.copy2(pdf_file, output_pdf)
+                        if self.cache is not None:
+                            self.cache.store(cache_key, pdf_file)
+                        trace.file_written(output_pdf)
                         print(f"   ✓ PDF created: {output_pdf}")
                         print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+                        print(f"   ⏱️ {result.describe()}")
                         return str(output_pdf)
                 else:
                     print(f"   ❌ LaTeX compilation failed")
@@ -244,6 +325,7 @@ class GhaliPDFGenerator:
                 
         return None
     
+    @traced('pdf_generator_system')
     def generate_pdf(self, 
                     notebook_path: Optional[str] = None,
                     beam_data: Optional[Dict] = None,
@@ -261,35 +343,47 @@ class GhaliPDFGenerator:
         """
         print(f"🏗️  GHALI CONSULTANTS - {self.template_style.title()} PDF Generator")
         print("=" * 60)
+        trace = current_trace()
         
         # Step 1: Get beam data
-        if notebook_path:
-            print(f"📓 Extracting data from notebook: {notebook_path}")
-            beam_data = self.extract_from_notebook(notebook_path)
-        elif beam_data is None:
-            print("📊 Using default beam parameters")
-            beam_data = self._get_default_beam_data()
-        
-        # Step 2: Generate plots
-        plots_data = self.generate_plots(beam_data)
-        
-        # Step 3: Load and populate template
-        print(f"📄 Loading {self.template_style} template...")
-        template = self.load_template()
+        with trace.stage('extract'):
+            if notebook_path:
+                print(f"📓 Extracting data from notebook: {notebook_path}")
+                beam_data = self.extract_from_notebook(notebook_path)
+            elif beam_data is None:
+                print("📊 Using default beam parameters")
+                beam_data = self._get_default_beam_data()
         
         if project_info is None:
-            project_info = {
-                'project_id': f'GC-{self.template_style.upper()}-2025',
-                'title': f"{beam_data['length']:.1f}m RC Beam Design",
-                'engineer': 'Ahmed Ghali, P.E.',
-                'reviewer': 'Senior Engineer, P.E.'
-            }
-        
-        populated_template = self.populate_template(template, beam_data, project_info)
-        
-        # Step 4: Compile PDF
+            project_info = self._get_default_project_info(beam_data)
         output_name = f"Ghali_{self.template_style.title()}_Beam_Design"
-        pdf_path = self.compile_pdf(populated_template, output_name)
+        
+        if self.engine == "reportlab":
+            # Steps 2-4 in one: figures drawn in memory, no LaTeX
+            print(f"📄 Rendering {self.template_style} sheet with reportlab...")
+            start = time.perf_counter()
+            with trace.stage('render', engine='reportlab'):
+                pdf_path = self.render_reportlab(beam_data, project_info, output_name)
+            trace.file_written(pdf_path)
+            print(f"   ✓ PDF created: {pdf_path}")
+            print(f"   📄 Size: {Path(pdf_path).stat().st_size / 1024:.1f} KB")
+            print(f"   ⏱️ reportlab {time.perf_counter() - start:.2f} s")
+        else:
+            # Step 2: Generate plots (kept in memory until the build directory exists)
+            with trace.stage('plots'):
+                plots_data = self.generate_plots(beam_data, in_memory=True)
+            trace.figures(plots_data['files'])
+            
+            # Step 3: Load and populate template
+            print(f"📄 Loading {self.template_style} template...")
+            with trace.stage('template'):
+                template = self.load_template()
+                populated_template = self.populate_template(template, beam_data, project_info)
+            
+            # Step 4: Compile PDF
+            with trace.stage('compile'):
+                pdf_path = self.compile_pdf(populated_template, output_name,
+                                            figures=plots_data['files'])
         
         if pdf_path:
             print(f"\n🎉 SUCCESS! {self.template_style.title()} PDF generated")
@@ -322,11 +416,17 @@ def main():
     parser.add_argument('--dead-load', type=float, default=20.0, help='Dead load (kN/m)')
     parser.add_argument('--live-load', type=float, default=25.0, help='Live load (kN/m)')
     parser.add_argument('--project-id', help='Project ID')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    parser.add_argument('--engine', choices=['latex', 'reportlab'], default='latex',
+                      help='PDF engine: pdflatex or pure-Python reportlab')
+    add_trace_arguments(parser)
     
     args = parser.parse_args()
+    apply_trace_arguments(args)
     
     # Create generator
-    generator = GhaliPDFGenerator(template_style=args.template)
+    generator = GhaliPDFGenerator(template_style=args.template, use_cache=not args.no_cache,
+                                  engine=args.engine)
     
     # Prepare data
     beam_data = None
@@ -334,11 +434,14 @@ def main():
     
     if not args.notebook:
         # Use command line parameters
+        from scripts.calculations.load_combinations import governing_factored_load
+        factored_load, load_combination = governing_factored_load(args.dead_load, args.live_load)
         beam_data = {
             'length': args.length,
             'dead_load': args.dead_load,
             'live_load': args.live_load,
-            'factored_load': 1.2 * args.dead_load + 1.6 * args.live_load,
+            'factored_load': factored_load,
+            'load_combination': load_combination,
             'width': 350,
             'height': 600,
             'fc': 25,
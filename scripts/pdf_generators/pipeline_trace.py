@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Pipeline Trace
+==================================
+Structured timing events for the PDF generators, so a slow sheet or batch
+shows where its time goes instead of only printing progress lines.
+
+Every generator entry point is wrapped with @traced; inside it, stages are
+timed with current_trace().stage(...). When tracing is on, each run writes
+JSON Lines events (one object per line):
+
+    run_start    generator, pid, python
+    stage        stage name and seconds (extract, plots, template, compile, ...)
+    subprocess   command, wall seconds, return code and pdflatex pass times
+    figure       figure file name and size in bytes
+    file         path and bytes written (.tex source, PDF, HTML)
+    cache        whether the compiled-PDF cache was hit
+    sheet        one batch sheet: prepare (plots/template), wait, compile,
+                 pdflatex passes and figure bytes
+    run_end      status, total seconds, per-stage totals and output path
+
+Every event carries the run id, generator name and wall-clock time, so
+events of concurrent runs (batch workers) can be told apart and lined up
+with an external sampling profiler such as py-spy.
+
+Enabling:
+    GHALI_TRACE=trace.jsonl     append events to this file ('-' for stderr)
+    GHALI_PROFILE=profiles/     also run each generator under cProfile and
+                                write <run id>.prof (read with pstats or
+                                snakeviz); leave unset under py-spy
+    --trace / --profile         the same from any generator's command line
+
+With neither set, stages cost two perf_counter() calls and nothing is
+written.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+TRACE_ENV = 'GHALI_TRACE'
+PROFILE_ENV = 'GHALI_PROFILE'
+
+_write_lock = threading.Lock()
+_run_numbers = itertools.count(1)
+
+
+class PipelineTrace:
+    """Stage timings, subprocess times and I/O sizes of one generator run"""
+
+    def __init__(self, generator: str, sink: Optional[str] = None,
+                 profile_dir: Optional[Union[str, Path]] = None):
+        """
+        Create a trace (inactive until entered as a context manager)
+
+        Args:
+            generator (str): Generator name recorded on every event
+            sink (str, optional): JSON Lines file to append to, '-' for
+                stderr, None to emit nothing
+            profile_dir (str, optional): Directory for a cProfile dump of the run
+        """
+        self.generator = generator
+        self.sink = sink
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.enabled = bool(sink or profile_dir)
+        self.run_id = f"{generator}-{os.getpid()}"
+        self.stages: Dict[str, float] = {}
+        self.output = None
+        self._profiler = None
+        self._start = 0.0
+
+    @classmethod
+    def from_env(cls, generator: str) -> 'PipelineTrace':
+        """Trace configured by GHALI_TRACE and GHALI_PROFILE"""
+        return cls(generator, os.environ.get(TRACE_ENV) or None,
+                   os.environ.get(PROFILE_ENV) or None)
+
+    def emit(self, event: str, **fields):
+        """Write one event (no-op without a sink)"""
+        if not self.sink:
+            return
+        record = {'event': event, 'run': self.run_id, 'generator': self.generator,
+                  'time': round(time.time(), 6), **fields}
+        line = json.dumps(record, default=str) + '\n'
+        with _write_lock:
+            if self.sink == '-':
+                sys.stderr.write(line)
+            else:
+                with open(self.sink, 'a', encoding='utf-8') as f:
+                    f.write(line)
+
+    @contextmanager
+    def stage(self, name: str, **fields):
+        """Time the enclosed block as a pipeline stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start, **fields)
+
+    def record_stage(self, name: str, seconds: float, **fields):
+        """Record a stage timed elsewhere (e.g. accumulated over a stream)"""
+        if not self.enabled:
+            return
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+        self.emit('stage', stage=name, seconds=seconds, **fields)
+
+    def subprocess(self, command: str, seconds: float, returncode: Optional[int] = None,
+                   **fields):
+        """Record the wall time of an external program (all of its passes)"""
+        self.emit('subprocess', command=command, seconds=seconds, returncode=returncode,
+                  **fields)
+
+    def latex_run(self, result, seconds: float):
+        """Record a run_pdflatex result (LatexRun)"""
+        self.subprocess('pdflatex', seconds, result.returncode, passes=len(result.pass_times),
+                        pass_times=result.pass_times)
+
+    def figures(self, files: Mapping[str, bytes]):
+        """Record the size of in-memory figures"""
+        for name, data in files.items():
+            self.emit('figure', name=name, bytes=len(data))
+
+    def file_written(self, path: Union[str, Path], kind: str = 'output'):
+        """Record a file the run wrote"""
+        path = Path(path)
+        if self.sink and path.exists():
+            self.emit('file', kind=kind, path=str(path), bytes=path.stat().st_size)
+
+    def cache(self, hit: bool):
+        """Record a compiled-PDF cache lookup"""
+        self.emit('cache', hit=hit)
+
+    def __enter__(self):
+        self.run_id = f"{self.generator}-{os.getpid()}-{next(_run_numbers)}"
+        self._start = time.perf_counter()
+        self.emit('run_start', pid=os.getpid(), python=sys.version.split()[0])
+        if self.profile_dir is not None:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self._profiler is not None:
+            self._profiler.disable()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profile_file = self.profile_dir / f"{self.run_id}.prof"
+            self._profiler.dump_stats(str(profile_file))
+            self.emit('profile', path=str(profile_file))
+
+        fields = {}
+        if exc_type is not None:
+            fields = {'status': 'error', 'error': f"{exc_type.__name__}: {exc}"}
+        elif self.output is None:
+            fields = {'status': 'failed'}
+        else:
+            fields = {'status': 'ok'}
+            if isinstance(self.output, (str, Path)):
+                fields['output'] = str(self.output)
+        self.emit('run_end', seconds=time.perf_counter() - self._start, stages=self.stages,
+                  **fields)
+        return False
+
+
+_DISABLED = PipelineTrace('untraced')
+_current: ContextVar[PipelineTrace] = ContextVar('ghali_pipeline_trace', default=_DISABLED)
+
+
+def current_trace() -> PipelineTrace:
+    """Trace of the running generator (a disabled trace outside @traced calls)"""
+    return _current.get()
+
+
+def traced(generator: str):
+    """
+    Decorator tracing a generator entry point as one run
+
+    The function's return value decides the run's status: None is a failed
+    run, anything else succeeded (a returned path is recorded as the
+    output). Calls nested inside an active run are part of that run.
+
+    Args:
+        generator (str): Generator name recorded on the events
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current.get() is not _DISABLED:
+                return function(*args, **kwargs)
+
+            trace = PipelineTrace.from_env(generator)
+            if not trace.enabled:
+                return function(*args, **kwargs)
+
+            token = _current.set(trace)
+            try:
+                with trace:
+                    trace.output = function(*args, **kwargs)
+                return trace.output
+            finally:
+                _current.reset(token)
+        return wrapper
+    return decorator
+
+
+def add_trace_arguments(parser):
+    """Add --trace and --profile to a generator's argument parser"""
+    parser.add_argument('--trace', metavar='FILE',
+                        help="Append JSON timing events to FILE ('-' for stderr)")
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Write a cProfile dump of each run to DIR')
+
+
+def apply_trace_arguments(args):
+    """Enable tracing from parsed --trace/--profile (inherited by worker processes)"""
+    if getattr(args, 'trace', None):
+        os.environ[TRACE_ENV] = args.trace
+    if getattr(args, 'profile', None):
+        os.environ[PROFILE_ENV] = args.profile
+
+
+def summarize(trace_file: Union[str, Path]) -> Dict[str, Dict[str, float]]:
+    """
+    Total seconds per generator and stage in a trace file
+
+    Args:
+        trace_file: JSON Lines file written by PipelineTrace
+
+    Returns:
+        Dict: generator → {stage, 'subprocess:<command>' or 'sheet:<phase>'
+        → total seconds, 'runs' → number of runs}
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    with open(trace_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            event = json.loads(line)
+            generator = totals.setdefault(event['generator'], {'runs': 0})
+            if event['event'] == 'run_start':
+                generator['runs'] += 1
+            elif event['event'] == 'stage':
+                generator[event['stage']] = generator.get(event['stage'], 0.0) + event['seconds']
+            elif event['event'] == 'subprocess':
+                key = f"subprocess:{event['command']}"
+                generator[key] = generator.get(key, 0.0) + event['seconds']
+            elif event['event'] == 'sheet':
+                phases = {**event.get('stages', {}),
+                          **{key: event[key] for key in ('wait', 'compile') if key in event}}
+                for phase, seconds in phases.items():
+                    key = f"sheet:{phase}"
+                    generator[key] = generator.get(key, 0.0) + seconds
+    return totals
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Summarize a generator trace file')
+    parser.add_argument('trace_file', help='JSON Lines file written with --trace/GHALI_TRACE')
+
+    args = parser.parse_args()
+
+    print("⏱️ GHALI CONSULTANTS - Pipeline Trace Summary")
+    print("=" * 50)
+
+    for generator, stages in summarize(args.trace_file).items():
+        runs = int(stages.pop('runs'))
+        print(f"\n{generator} ({runs} run{'s' if runs != 1 else ''})")
+        for stage, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+            print(f"   {stage:<24} {seconds:8.3f} s  ({seconds / max(runs, 1):.3f} s/run)")
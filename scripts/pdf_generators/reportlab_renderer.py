@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Reportlab Sheet Renderer
+============================================
+Pure-Python calculation sheets (no LaTeX) for every sheet type, built from
+the same data dictionaries the LaTeX templates are rendered with:
+
+    standard / cambridge beam   GhaliPDFGenerator.template_context(beam_data, project_info)
+    Method C column             aci318_method_c_pdf_generator.extract_notebook_data()
+
+Paragraph and table styles are built once at import and shared by every
+sheet. Figures are drawn on standalone matplotlib Figures and embedded as
+in-memory PNGs, so a sheet never touches the disk until its PDF is
+written. High-volume batches use this path to skip pdflatex entirely
+(see batch_pdf_builder --engine reportlab).
+
+Usage:
+    context = GhaliPDFGenerator().template_context(beam_data, project_info)
+    render_beam_sheet(context, "output/B001.pdf", "cambridge")
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import io
+import sys
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+from xml.sax.saxutils import escape
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import (BaseDocTemplate, Frame, Image, KeepTogether, NextPageTemplate,
+                                PageBreak, PageTemplate, Paragraph, Spacer, Table, TableStyle)
+
+from scripts.pdf_generators.template_engine import format_value as fmt
+from scripts.utilities.structural_plotting import GHALI_COLORS, StructuralPlotter
+
+FIGURE_DPI = 150              # Resolution of embedded figure PNGs
+PAGE_MARGIN = 20 * mm
+COLUMN_GAP = 6 * mm           # Gutter of the two-column Cambridge layout
+
+BLUE = colors.HexColor(GHALI_COLORS['blue'])
+RED = colors.HexColor(GHALI_COLORS['red'])
+GREEN = colors.HexColor(GHALI_COLORS['green'])
+GRAY = colors.HexColor(GHALI_COLORS['gray'])
+HEADER_FILL = colors.HexColor('#f5f5f5')
+
+BEAM_FIGURES = (
+    ('beam_diagram', "geometry, support conditions and loading"),
+    ('bmd_sfd', "bending moment and shear force diagrams (positive moments downward)"),
+    ('steel_layout', "reinforcement arrangement and detailing")
+)
+
+# Shared styles, built once per process
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+PARAGRAPH_STYLES = {
+    'company': ParagraphStyle('GhaliCompany', parent=_SAMPLE_STYLES['Title'], fontSize=24,
+                              leading=30, textColor=BLUE),
+    'title': ParagraphStyle('GhaliTitle', parent=_SAMPLE_STYLES['Heading1'], fontSize=16,
+                            leading=20, alignment=TA_CENTER, textColor=RED),
+    'subtitle': ParagraphStyle('GhaliSubtitle', parent=_SAMPLE_STYLES['Normal'], fontSize=11,
+                               leading=15, alignment=TA_CENTER, textColor=GRAY),
+    'header': ParagraphStyle('GhaliHeader', parent=_SAMPLE_STYLES['Heading2'], fontSize=13,
+                             spaceBefore=10, spaceAfter=6, textColor=BLUE),
+    'subheader': ParagraphStyle('GhaliSubheader', parent=_SAMPLE_STYLES['Heading3'],
+                                fontSize=11, spaceBefore=6, spaceAfter=4, textColor=GRAY),
+    'body': ParagraphStyle('GhaliBody', parent=_SAMPLE_STYLES['Normal'], fontSize=10,
+                           leading=13, spaceAfter=6, alignment=TA_JUSTIFY),
+    'equation': ParagraphStyle('GhaliEquation', parent=_SAMPLE_STYLES['Normal'], fontSize=10,
+                               leading=14, spaceAfter=6, alignment=TA_CENTER),
+    'caption': ParagraphStyle('GhaliCaption', parent=_SAMPLE_STYLES['Italic'], fontSize=8,
+                              leading=10, spaceAfter=8, alignment=TA_CENTER, textColor=GRAY),
+    'small': ParagraphStyle('GhaliSmall', parent=_SAMPLE_STYLES['Normal'], fontSize=8,
+                            leading=10, alignment=TA_CENTER, textColor=GRAY)
+}
+
+_GRID = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HEADER_FILL),
+    ('TEXTCOLOR', (0, 0), (-1, 0), BLUE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdbdbd'))
+])
+
+TABLE_STYLES = {
+    'grid': _GRID,
+    'grid_center': TableStyle([('ALIGN', (1, 0), (-1, -1), 'CENTER')], parent=_GRID),
+    'compact': TableStyle([('FONTSIZE', (0, 0), (-1, -1), 7.5),
+                           ('TOPPADDING', (0, 0), (-1, -1), 1.5),
+                           ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
+                           ('ALIGN', (1, 0), (-1, -1), 'CENTER')], parent=_GRID),
+    'signature': TableStyle([('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                             ('TOPPADDING', (0, 1), (-1, -1), 6)], parent=_GRID)
+}
+
+STATUS_COLORS = {'OK': GREEN, 'NG': RED, 'YES': RED, 'SLENDER': RED}
+
+
+def data_table(rows: Sequence[Sequence], col_widths: Optional[Sequence[float]] = None,
+               style: str = 'grid_center', status_column: Optional[int] = None) -> Table:
+    """
+    Table with a header row in one of the shared styles
+
+    Args:
+        rows: Header row followed by data rows (plain strings)
+        col_widths: Column widths in points (None sizes columns to content)
+        style (str): Key of TABLE_STYLES
+        status_column (int, optional): Column whose OK/NG cells are coloured
+
+    Returns:
+        Table: Styled reportlab table (header repeated on page breaks)
+    """
+    table = Table([list(row) for row in rows], colWidths=col_widths, repeatRows=1)
+    table.setStyle(TABLE_STYLES[style])
+
+    if status_column is not None:
+        commands = []
+        for row_index, row in enumerate(rows[1:], start=1):
+            color = STATUS_COLORS.get(str(row[status_column]))
+            if color is not None:
+                cell = (status_column, row_index)
+                commands += [('TEXTCOLOR', cell, cell, color),
+                             ('FONTNAME', cell, cell, 'Helvetica-Bold')]
+        if commands:
+            table.setStyle(TableStyle(commands))
+    return table
+
+
+def figure_image(figure, width: float, dpi: int = FIGURE_DPI) -> Image:
+    """
+    Embed a figure from memory
+
+    Args:
+        figure: matplotlib Figure, or PNG bytes already rendered
+        width (float): Width on the page in points (aspect ratio is kept)
+        dpi (int): Resolution on the printed page used when rendering a Figure
+
+    Returns:
+        Image: reportlab flowable reading the PNG from a memory buffer
+    """
+    if isinstance(figure, (bytes, bytearray)):
+        buffer = io.BytesIO(figure)
+    else:
+        # Rasterize for the printed width, not the figure's own size; figures
+        # are already laid out, so the full-figure box skips the extra draw a
+        # 'tight' bounding box costs
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format='png', dpi=dpi * width / 72 / figure.get_figwidth(),
+                       bbox_inches=figure.bbox_inches)
+        buffer.seek(0)
+
+    image_width, image_height = ImageReader(buffer).getSize()
+    buffer.seek(0)
+    return Image(buffer, width=width, height=width * image_height / image_width)
+
+
+def draw_beam_figures(beam: Mapping) -> Dict:
+    """
+    Draw a beam's figure set in memory (nothing is written to disk)
+
+    Args:
+        beam (Mapping): Beam values (length, dead_load, live_load,
+            factored_load, width, height, steel_area_req, bar_diameter)
+
+    Returns:
+        Dict: Figure name → matplotlib Figure
+    """
+    plotter = StructuralPlotter(formats=(), in_memory=True)
+    plotter.plot_beam_diagram(beam['length'], beam['dead_load'], beam['live_load'],
+                              beam['width'], beam['height'])
+    plotter.plot_bmd_sfd(beam['length'], beam['factored_load'])
+    plotter.plot_steel_layout(beam['width'], beam['height'], beam['steel_area_req'],
+                              beam.get('bar_diameter', 20))
+    return plotter.figures
+
+
+def _today() -> str:
+    """Date in the format LaTeX's \\today prints"""
+    return date.today().strftime('%B %d, %Y').replace(' 0', ' ')
+
+
+@contextmanager
+def _binary_streams():
+    """
+    Write PDF streams without the ASCII85 filter while a document builds
+
+    ASCII85 only makes streams 7-bit clean and is encoded in pure Python
+    when reportlab's C accelerator is missing; binary streams are smaller
+    and several times faster for embedded figures.
+    """
+    use_a85 = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = use_a85
+
+
+def _page_decorator(header_center: str, footer_left: str):
+    """Running header and footer drawn on every page"""
+    def decorate(canvas, doc):
+        width, height = doc.pagesize
+        canvas.saveState()
+        canvas.setFont('Helvetica-Bold', 8)
+        canvas.setFillColor(BLUE)
+        canvas.drawString(PAGE_MARGIN, height - 12 * mm, "GHALI CONSULTANTS")
+        canvas.setFont('Helvetica', 8)
+        canvas.setFillColor(GRAY)
+        canvas.drawCentredString(width / 2, height - 12 * mm, header_center)
+        canvas.drawRightString(width - PAGE_MARGIN, height - 12 * mm, f"Page {doc.page}")
+        canvas.setStrokeColor(BLUE)
+        canvas.setLineWidth(0.5)
+        canvas.line(PAGE_MARGIN, height - 13.5 * mm, width - PAGE_MARGIN, height - 13.5 * mm)
+        canvas.drawString(PAGE_MARGIN, 10 * mm, footer_left)
+        canvas.drawCentredString(width / 2, 10 * mm, "Professional Engineering Services")
+        canvas.drawRightString(width - PAGE_MARGIN, 10 * mm, _today())
+        canvas.restoreState()
+    return decorate
+
+
+def _document(output_pdf: Union[str, Path], title: str, header_center: str,
+              footer_left: str, two_column: bool = False) -> BaseDocTemplate:
+    """A4 document with 'one_column' (and optionally 'two_column') page templates"""
+    output_pdf = Path(output_pdf)
+    output_pdf.parent.mkdir(parents=True, exist_ok=True)
+    doc = BaseDocTemplate(str(output_pdf), pagesize=A4, title=title, author="Ghali Consultants",
+                          leftMargin=PAGE_MARGIN, rightMargin=PAGE_MARGIN,
+                          topMargin=PAGE_MARGIN, bottomMargin=PAGE_MARGIN, invariant=1)
+    decorate = _page_decorator(header_center, footer_left)
+
+    templates = []
+    if two_column:
+        column_width = (doc.width - COLUMN_GAP) / 2
+        frames = [Frame(doc.leftMargin + i * (column_width + COLUMN_GAP), doc.bottomMargin,
+                        column_width, doc.height, id=f"column{i}") for i in range(2)]
+        templates.append(PageTemplate('two_column', frames=frames, onPage=decorate))
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='body')
+    templates.append(PageTemplate('one_column', frames=[frame], onPage=decorate))
+    doc.addPageTemplates(templates)
+    return doc
+
+
+def _signature_block(width: float) -> Table:
+    """Prepared-by / reviewed-by block of every sheet"""
+    return data_table([
+        ["Prepared By", "Reviewed By"],
+        ["Ahmed Ghali, P.E.", "Senior Engineer, P.E."],
+        ["Professional Engineer", "Professional Engineer"],
+        [f"Date: {_today()}", "Date: _____________"]
+    ], [width / 2] * 2, style='signature')
+
+
+def _material_rows() -> List[List[str]]:
+    """Beam material properties (fixed by the beam templates)"""
+    return [["Property", "Value", "Unit"],
+            ["Concrete Strength, f'c", "25", "MPa"],
+            ["Steel Yield Strength, fy", "420", "MPa"],
+            ["Concrete Modulus, Ec", "25,000", "MPa"],
+            ["Steel Modulus, Es", "200,000", "MPa"]]
+
+
+def _member_rows(member: Mapping) -> List[List[str]]:
+    """Inputs and results of one beam, as in the Cambridge member table"""
+    return [["Parameter", "Value", "Unit"],
+            ["Length, L", f"{member['length']:.1f}", "m"],
+            ["Width, b", f"{member['width']}", "mm"],
+            ["Height, h", f"{member['height']}", "mm"],
+            ["Dead Load, wD", f"{member['dead_load']:.1f}", "kN/m"],
+            ["Live Load, wL", f"{member['live_load']:.1f}", "kN/m"],
+            [f"wu = {member['load_combination']}", f"{member['factored_load']:.1f}", "kN/m"],
+            ["Mu", f"{member['max_moment']:.1f}", "kN·m"],
+            ["Vu", f"{member['max_shear']:.1f}", "kN"],
+            ["As,req", f"{member['steel_area_req']}", "mm²"],
+            ["φMn", f"{member['checks']['phi_mn']:.1f}", "kN·m"],
+            ["Status", member['checks']['compliance'], "--"]]
+
+
+def _standard_story(beam: Mapping, project: Mapping, width: float) -> List:
+    """Flowables of the single-column standard sheet"""
+    P = PARAGRAPH_STYLES
+    length = f"{beam['length']:.1f}"
+    checks = beam['checks']
+    if checks['adequate']:
+        conclusion = (f"The {length} m reinforced concrete beam design has been completed per "
+                      "ACI 318-19. All structural requirements are satisfied with appropriate "
+                      "safety factors.")
+    else:
+        conclusion = (f"The {length} m reinforced concrete beam does not satisfy ACI 318-19: the "
+                      "tension reinforcement is outside the flexural limits above. Revise the "
+                      "section or provide compression reinforcement and repeat the design.")
+    story = [
+        Spacer(1, 25 * mm),
+        Paragraph("GHALI CONSULTANTS", P['company']),
+        Paragraph("Structural &amp; Civil Engineering", P['subtitle']),
+        Paragraph("Professional Engineering Services", P['subtitle']),
+        Spacer(1, 20 * mm),
+        Paragraph("REINFORCED CONCRETE BEAM DESIGN", P['title']),
+        Paragraph("ACI 318-19 Structural Analysis &amp; Design", P['subtitle']),
+        Spacer(1, 12 * mm),
+        data_table([["Project Information", ""],
+                    ["Project Title:", project['title']],
+                    ["Project ID:", project['project_id']],
+                    ["Engineer:", project['engineer']],
+                    ["Date:", _today()],
+                    ["Design Code:", "ACI 318-19"]], [width * 0.3, width * 0.5], style='grid'),
+        Spacer(1, 15 * mm),
+        Paragraph("<b>CALCULATION SUMMARY</b>", P['header']),
+        Paragraph(f"This calculation presents the structural analysis and design of a {length} m "
+                  "reinforced concrete beam under uniformly distributed loading. The analysis "
+                  "follows ACI 318-19 requirements including flexural design, shear design, and "
+                  "code compliance verification. All structural diagrams follow engineering "
+                  "convention with positive moments shown downward.", P['body']),
+        PageBreak(),
+
+        Paragraph("1. Design Parameters and Material Properties", P['header']),
+        Paragraph("1.1 Material Properties", P['subheader']),
+        data_table(_material_rows(), [width * 0.5, width * 0.2, width * 0.15]),
+        Paragraph("1.2 Geometric Properties", P['subheader']),
+        data_table([["Dimension", "Value", "Unit"],
+                    ["Beam Length, L", length, "m"],
+                    ["Beam Width, b", f"{beam['width']}", "mm"],
+                    ["Beam Height, h", f"{beam['height']}", "mm"],
+                    ["Effective Depth, d", f"{beam['effective_depth']}", "mm"]],
+                   [width * 0.5, width * 0.2, width * 0.15]),
+        Paragraph("1.3 Loading Conditions", P['subheader']),
+        data_table([["Load Type", "Value", "Unit"],
+                    ["Dead Load, wD", f"{beam['dead_load']:.1f}", "kN/m"],
+                    ["Live Load, wL", f"{beam['live_load']:.1f}", "kN/m"],
+                    [f"Factored Load, wu = {beam['load_combination']}",
+                     f"{beam['factored_load']:.1f}", "kN/m"]],
+                   [width * 0.5, width * 0.2, width * 0.15]),
+
+        Paragraph("2. Structural Analysis", P['header']),
+        Paragraph("2.1 Critical Design Forces", P['subheader']),
+        Paragraph("For a simply supported beam under uniformly distributed load:", P['body']),
+        Paragraph(f"M<sub>u</sub> = w<sub>u</sub>L²/8 = {beam['max_moment']:.1f} kN·m", P['equation']),
+        Paragraph(f"V<sub>u</sub> = w<sub>u</sub>L/2 = {beam['max_shear']:.1f} kN", P['equation']),
+        Paragraph("2.2 Structural Diagrams", P['subheader'])
+    ]
+
+    figures = draw_beam_figures(beam)
+    for index, (name, caption) in enumerate(BEAM_FIGURES, start=1):
+        story.append(KeepTogether([
+            figure_image(figures[name], width * (0.8 if name == 'steel_layout' else 0.9)),
+            Paragraph(f"Figure {index}: Beam {caption}", P['caption'])
+        ]))
+
+    story += [
+        Paragraph("3. Flexural Design", P['header']),
+        Paragraph("Using strength design method per ACI 318-19 Section 22.2:", P['body']),
+        Paragraph(f"A<sub>s,req</sub> = M<sub>u</sub> / (φ f<sub>y</sub> (d − a/2)) = "
+                  f"{beam['steel_area_req']} mm²", P['equation']),
+        Paragraph("Minimum reinforcement per ACI 318-19 Section 9.6.1.2:", P['body']),
+        Paragraph("A<sub>s,min</sub> = max(0.25√f'<sub>c</sub> / f<sub>y</sub> · bd, "
+                  "1.4 / f<sub>y</sub> · bd)", P['equation']),
+
+        Paragraph("4. Design Verification", P['header']),
+        data_table([["Design Requirement", "Required", "Provided", "Status"],
+                    ["Flexural Capacity", f"Mu = {beam['max_moment']:.1f} kN·m",
+                     f"φMn = {checks['phi_mn']:.1f} kN·m", checks['flexure']],
+                    ["Minimum Steel Area", f"{checks['as_min']:.0f} mm²",
+                     f"{beam['steel_area_req']} mm²", checks['minimum_steel']],
+                    ["Maximum Steel Area", f"{checks['as_max']:.0f} mm²",
+                     f"{beam['steel_area_req']} mm²", checks['maximum_steel']],
+                    ["ACI 318-19 Compliance", "All provisions",
+                     "Satisfied" if checks['adequate'] else "Not satisfied", checks['compliance']]],
+                   [width * 0.35, width * 0.22, width * 0.22, width * 0.12], status_column=3),
+
+        Paragraph("5. Conclusion", P['header']),
+        Paragraph(conclusion, P['body']),
+        Spacer(1, 10 * mm),
+        _signature_block(width * 0.8),
+        Spacer(1, 5 * mm),
+        Paragraph("This calculation follows applicable engineering standards and professional "
+                  "practice. All calculations are subject to independent review and "
+                  "verification.", P['small'])
+    ]
+    return story
+
+
+def _cambridge_story(members, schedule: Sequence[Mapping], project: Mapping,
+                     project_id: str, column_width: float, page_width: float) -> List:
+    """Flowables of the two-column Cambridge sheet; members may be any iterable"""
+    P = PARAGRAPH_STYLES
+    widths = [column_width * 0.5, column_width * 0.3, column_width * 0.2]
+    story = [
+        Paragraph("Reinforced Concrete Beam Design", P['title']),
+        Paragraph("Multi-Beam Structural Analysis per ACI 318-19", P['subtitle']),
+        Paragraph(f"{escape(project['engineer'])} | Ghali Consultants | {_today()}", P['subtitle']),
+        Spacer(1, 6 * mm),
+        Paragraph("Abstract", P['header']),
+        Paragraph("This technical report presents structural analysis and design of reinforced "
+                  "concrete beams in accordance with ACI 318-19, with systematic evaluation of "
+                  "flexural capacity, shear resistance and serviceability requirements.", P['body']),
+        Paragraph("1. Project Overview", P['header']),
+        data_table([["Parameter", "Value"],
+                    ["Project ID", project_id],
+                    ["Design Code", "ACI 318-19"],
+                    ["Analysis Method", "Ultimate Strength Design"],
+                    ["Engineer", project['engineer']],
+                    ["Reviewer", project['reviewer']]],
+                   [column_width * 0.45, column_width * 0.55], style='compact'),
+        Paragraph("2. Design Parameters", P['header']),
+        data_table(_material_rows(), widths, style='compact'),
+        Paragraph("Governing gravity combination (ACI 318-19 Section 5.3): "
+                  "U = max(1.4D, 1.2D + 1.6L)", P['body']),
+        Paragraph("3. Beam Analysis Results", P['header']),
+        Paragraph("M<sub>u</sub> = w<sub>u</sub>L²/8, V<sub>u</sub> = w<sub>u</sub>L/2 for "
+                  "simply supported beams under uniform load. Positive moments are drawn "
+                  "downward.", P['body'])
+    ]
+
+    verdict = {'flexure': 'OK', 'minimum_steel': 'OK', 'adequate': True}
+    for member in members:
+        checks = member['checks']
+        if 'NG' in (checks['flexure'], checks['maximum_steel']):
+            verdict['flexure'] = 'NG'
+        if checks['minimum_steel'] == 'NG':
+            verdict['minimum_steel'] = 'NG'
+        verdict['adequate'] &= checks['adequate']
+        name = escape(str(member['name']))
+        story += [Paragraph(name, P['subheader']),
+                  data_table(_member_rows(member), widths, style='compact', status_column=1)]
+        figures = draw_beam_figures(member)
+        for figure_name, caption in BEAM_FIGURES:
+            story.append(KeepTogether([figure_image(figures[figure_name], column_width),
+                                       Paragraph(f"{name}: {caption}", P['caption'])]))
+
+    story += [
+        Paragraph("4. Design Verification", P['header']),
+        data_table([["Requirement", "Status", "Reference"],
+                    ["Flexural Capacity", verdict['flexure'], "ACI 22.2"],
+                    ["Minimum Steel", verdict['minimum_steel'], "ACI 9.6.1.2"],
+                    ["Shear Capacity", "OK", "ACI 22.5"],
+                    ["Serviceability", "OK", "ACI 24.2"]],
+                   widths, style='compact', status_column=1),
+        NextPageTemplate('one_column'),
+        PageBreak(),
+        Paragraph("5. Beam Schedule", P['header']),
+        data_table([["Beam", "L (m)", "b × h (mm)", "wu (kN/m)", "Mu (kN·m)", "Vu (kN)",
+                     "As,req (mm²)"]] +
+                   [[str(row['name']), f"{row['length']:.1f}", f"{row['width']} × {row['height']}",
+                     f"{row['factored_load']:.1f}", f"{row['max_moment']:.1f}",
+                     f"{row['max_shear']:.1f}", f"{row['steel_area_req']}"] for row in schedule],
+                   [page_width * 0.22] + [page_width * 0.13] * 6, style='compact'),
+        Paragraph("6. Conclusion", P['header']),
+        Paragraph("The reinforced concrete beam design has been completed in accordance with "
+                  "ACI 318-19 requirements. All structural capacity checks demonstrate adequate "
+                  "performance with appropriate safety factors." if verdict['adequate'] else
+                  "The beams marked NG in their tables do not satisfy the ACI 318-19 flexural "
+                  "requirements; revise their sections or reinforcement and repeat the design.",
+                  P['body']),
+        Spacer(1, 8 * mm),
+        _signature_block(page_width * 0.7)
+    ]
+    return story
+
+
+def render_beam_sheet(context: Mapping, output_pdf: Union[str, Path],
+                      template_style: str = "standard") -> str:
+    """
+    Render a beam calculation sheet without LaTeX
+
+    Args:
+        context (Mapping): Template context as returned by
+            GhaliPDFGenerator.template_context (beam, members, schedule,
+            project, project_id); members may be a generator
+        output_pdf: Destination PDF path
+        template_style (str): "standard" or "cambridge"
+
+    Returns:
+        str: Path to the written PDF
+    """
+    beam = context['beam']
+    project = context['project']
+    if template_style == "cambridge":
+        doc = _document(output_pdf, "Reinforced Concrete Beam Design",
+                        "Multi-Beam Structural Analysis", context['project_id'], two_column=True)
+        column_width = (doc.width - COLUMN_GAP) / 2
+        story = _cambridge_story(context['members'], context['schedule'], project,
+                                 context['project_id'], column_width, doc.width)
+    elif template_style == "standard":
+        doc = _document(output_pdf, "Reinforced Concrete Beam Design",
+                        "Structural Engineering Calculation", f"{beam['length']:.1f} m RC Beam Design")
+        story = _standard_story(beam, project, doc.width)
+    else:
+        raise ValueError("Template style must be 'standard' or 'cambridge'")
+
+    with _binary_streams():
+        doc.build(story)
+    return str(output_pdf)
+
+
+def render_column_sheet(column_data: Mapping, output_pdf: Union[str, Path],
+                        project_id: str = "GC-COL-2025") -> str:
+    """
+    Render an ACI 318-19 Method C column sheet without LaTeX
+
+    Args:
+        column_data (Mapping): Column values as returned by
+            aci318_method_c_pdf_generator.extract_notebook_data
+        output_pdf: Destination PDF path
+        project_id (str): Project identifier
+
+    Returns:
+        str: Path to the written PDF
+    """
+    from scripts.calculations.aci318_method_c_engine import column_checks
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import draw_column_section
+
+    P = PARAGRAPH_STYLES
+    c = column_data
+    checks = column_checks(c)
+    doc = _document(output_pdf, "ACI 318-19 Method C Column Design",
+                    "ACI 318-19 Method C Analysis", f"Column {c['column_id']}")
+    width = doc.width
+    widths = [width * 0.5, width * 0.25, width * 0.15]
+    statuses = ["OK" if ratio < 1.0 else "NG" for ratio in (c['ratio1'], c['ratio2'])]
+    critical = c['axis']
+    depth_name, depth = ('b', c['b']) if critical == 'minor' else ('h', c['h'])
+
+    story = [
+        Paragraph("ACI 318-19 Column Design Analysis", P['title']),
+        Paragraph("Method C: Moment Magnification for Slender Columns", P['subtitle']),
+        Paragraph(f"Ahmed Ghali, P.E. | Ghali Consultants | {_today()}", P['subtitle']),
+        Spacer(1, 6 * mm),
+        Paragraph("1. Project Overview", P['header']),
+        data_table([["Parameter", "Value"],
+                    ["Project ID", project_id],
+                    ["Column ID", c['column_id']],
+                    ["Design Code", "ACI 318-19"],
+                    ["Analysis Method", "Method C (Moment Magnification)"],
+                    ["Engineer", "Ahmed Ghali, P.E."],
+                    ["Reviewer", "Senior Engineer, P.E."]],
+                   [width * 0.35, width * 0.45], style='grid'),
+
+        Paragraph("2. Design Parameters", P['header']),
+        Paragraph("2.1 Material Properties", P['subheader']),
+        data_table([["Property", "Value", "Unit"],
+                    ["Concrete Strength, f'c", f"{c['fc_prime']:.1f}", "MPa"],
+                    ["Steel Yield Strength, fy", f"{c['fy']:.0f}", "MPa"],
+                    ["Concrete Modulus, Ec", f"{c['ec']:,.1f}", "MPa"],
+                    ["Steel Modulus, Es", "200,000", "MPa"]], widths),
+        Paragraph("2.2 Column Geometry", P['subheader']),
+        data_table([["Parameter", "Value", "Unit"],
+                    ["Width (short), b", f"{c['b']:.0f}", "mm"],
+                    ["Height (long), h", f"{c['h']:.0f}", "mm"],
+                    ["Unsupported Length, Lu", f"{c['lu']:.0f}", "mm"],
+                    ["Effective Length, Le", f"{c['le']:.0f}", "mm"],
+                    ["Gross Area, Ag", f"{c['ag']:,.0f}", "mm²"],
+                    [f"Critical Ig ({critical} axis)", f"{c['ig']:,.0f}", "mm⁴"],
+                    ["Steel Area, As", f"{c['as_total']:.1f}", "mm²"]], widths),
+
+        Paragraph("3. Applied Forces", P['header']),
+        data_table([["Force/Moment", "Value", "Unit"],
+                    ["Factored Axial Load, Pu", f"{c['pu']:.1f}", "kN"],
+                    ["End Moment 1, M1u", f"{c['m1u']:.4f}", "kN·m"],
+                    ["End Moment 2, M2u", f"{c['m2u']:.4f}", "kN·m"],
+                    ["Sustained Load, Psus", f"{c['psus']:.1f}", "kN"],
+                    ["βdns Factor", f"{c['beta_dns']:.2f}", "--"],
+                    ["Cm Factor", f"{c['cm']:.4f}", "--"]], widths),
+
+        Paragraph("4. Slenderness Classification", P['header']),
+        data_table([["Direction", "Inertia (mm⁴)", "Applied Moment", "Critical"],
+                    ["Major Axis", f"{c['imajor']:,.0f}", "M33 Range",
+                     "YES" if critical == 'major' else "No"],
+                    ["Minor Axis", f"{c['iminor']:,.0f}", "M22 Range",
+                     "YES" if critical == 'minor' else "No"]],
+                   [width * 0.25, width * 0.3, width * 0.25, width * 0.15], status_column=3),
+        Paragraph(f"L<sub>e</sub>/r = L<sub>e</sub>/{depth_name} = {c['le']:.0f} / {depth:.0f} = "
+                  f"{c['slenderness']:.1f}", P['equation']),
+        Paragraph(f"<b>Classification:</b> {escape(str(c['slender_class']))} "
+                  "(Limit = 22 for braced frames)", P['body']),
+
+        Paragraph("5. Method C Analysis", P['header']),
+        Paragraph("Method 1 (Eq. 6.6.4.4.4a): (EI)<sub>eff</sub> = 0.4E<sub>c</sub>I<sub>g</sub> / "
+                  f"(1 + β<sub>dns</sub>) = {c['ei_method1']:,.1f} kN·m²", P['equation']),
+        Paragraph("Method 2 (Eq. 6.6.4.4.4c): (EI)<sub>eff</sub> = "
+                  f"{c['i_factor']:.2f}E<sub>c</sub>I<sub>g</sub> / (1 + β<sub>dns</sub>) = {c['ei_method2']:,.1f} kN·m²", P['equation']),
+        Paragraph("P<sub>c</sub> = π²(EI)<sub>eff</sub> / L<sub>e</sub>² (Eq. 6.6.4.4.2): "
+                  f"{c['pc_method1']:,.1f} kN (Method 1), {c['pc_method2']:,.1f} kN (Method 2)",
+                  P['equation']),
+        data_table([["Method", "0.75Pc (kN)", "Pu/0.75Pc", "Status"],
+                    ["Method 1", f"{c['pc75_method1']:,.1f}", f"{c['ratio1']:.4f}", statuses[0]],
+                    ["Method 2", f"{c['pc75_method2']:,.1f}", f"{c['ratio2']:.4f}", statuses[1]]],
+                   [width * 0.25, width * 0.25, width * 0.25, width * 0.15], status_column=3),
+
+        Paragraph("6. Moment Magnification", P['header']),
+        Paragraph("δ<sub>ns</sub> = C<sub>m</sub> / (1 − P<sub>u</sub>/0.75P<sub>c</sub>) ≥ 1.0: "
+                  f"{fmt(c['deltans_method1'], '.2f')} (Method 1), "
+                  f"{fmt(c['deltans_method2'], '.2f')} (Method 2)",
+                  P['equation']),
+        Paragraph(f"M<sub>2,min</sub> = P<sub>u</sub>(15 + 0.03{depth_name}) (Eq. 6.6.4.5.4): "
+                  f"{c['m2_min']:.2f} kN·m", P['equation']),
+        Paragraph("M<sub>c</sub> = δ<sub>ns</sub> max(M<sub>2u</sub>, M<sub>2,min</sub>): "
+                  f"{fmt(c['mc_method1'], '.2f')} kN·m (Method 1), "
+                  f"{fmt(c['mc_method2'], '.2f')} kN·m (Method 2)",
+                  P['equation']),
+
+        Paragraph("7. Cross-Section Analysis", P['header']),
+        KeepTogether([figure_image(draw_column_section(c), width * 0.5),
+                      Paragraph("Column cross-section with reinforcement layout", P['caption'])]),
+        Paragraph(f"The column cross-section shows the {escape(str(c['rebar_count']))} × "
+                  f"{escape(str(c['rebar_size']))} mm reinforcement arrangement.", P['body']),
+
+        Paragraph("8. Design Verification", P['header']),
+        data_table([["Parameter", "Value", "Unit"],
+                    ["Design Axial Load", f"{c['pu']:.1f}", "kN"],
+                    ["Magnified Moment (Method 1)", fmt(c['mc_method1'], '.2f'), "kN·m"],
+                    ["Magnified Moment (Method 2)", fmt(c['mc_method2'], '.2f'), "kN·m"],
+                    ["Design Strength at Pu, φMn", f"{checks['phi_mn']:.2f}", "kN·m"],
+                    ["Mc/φMn (Method 1 / Method 2)",
+                     f"{fmt(checks['interaction_ratio1'], '.3f')} / "
+                     f"{fmt(checks['interaction_ratio2'], '.3f')}", "--"],
+                    ["Steel Ratio, ρ", f"{c['rho']:.2f}", "%"]], widths),
+        Spacer(1, 4 * mm),
+        data_table([["Requirement", "Status", "Reference"],
+                    ["Slenderness Limits", checks['slenderness'], "ACI 6.2.5"],
+                    ["Method C Applicability", checks['method_c'], "ACI 6.6.4.4.2"],
+                    ["Moment Magnification", checks['magnification'], "ACI 6.6.4.5.2"],
+                    ["Strength Interaction", checks['interaction'], "ACI 22.4"]],
+                   widths, status_column=1),
+
+        Paragraph("9. Conclusion", P['header']),
+        Paragraph(f"The ACI 318-19 Method C analysis of Column {escape(str(c['column_id']))} "
+                  "evaluates slenderness and stability per ACI 318-19 Section 6.6.", P['body']),
+        Spacer(1, 8 * mm),
+        _signature_block(width * 0.8)
+    ]
+
+    with _binary_streams():
+        doc.build(story)
+    return str(output_pdf)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from scripts.pdf_generators.pdf_generator_system import GhaliPDFGenerator
+    from scripts.pdf_generators.aci318_method_c_pdf_generator import extract_notebook_data
+
+    parser = argparse.ArgumentParser(description='Render calculation sheets without LaTeX')
+    parser.add_argument('--sheet', choices=['standard', 'cambridge', 'column'], default='standard',
+                        help='Sheet type')
+    parser.add_argument('--output', help='Output PDF (default: output/Ghali_<Sheet>_Reportlab.pdf)')
+    args = parser.parse_args()
+
+    print("🏗️  GHALI CONSULTANTS - Reportlab Sheet Renderer")
+    print("=" * 50)
+
+    output_pdf = Path(args.output) if args.output else \
+        project_root / "output" / f"Ghali_{args.sheet.title()}_Reportlab.pdf"
+    start = time.perf_counter()
+    if args.sheet == 'column':
+        render_column_sheet(extract_notebook_data(None), output_pdf)
+    else:
+        generator = GhaliPDFGenerator(template_style=args.sheet, use_cache=False)
+        beam_data = generator._get_default_beam_data()
+        context = generator.template_context(beam_data,
+                                             generator._get_default_project_info(beam_data))
+        render_beam_sheet(context, output_pdf, args.sheet)
+
+    print(f"   ✓ PDF created: {output_pdf}")
+    print(f"   📄 Size: {output_pdf.stat().st_size / 1024:.1f} KB")
+    print(f"   ⏱️ {time.perf_counter() - start:.2f} s")
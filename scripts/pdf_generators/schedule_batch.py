@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Member Schedule Batch
+=========================================
+Builds the calculation sheets of a whole member schedule in one command:
+reads a CSV, XLSX or JSON schedule of beams and columns, runs the design
+calculations vectorized over each chunk of rows and streams the sheets
+through batch_pdf_builder (figures, template, pdflatex or reportlab) with
+configurable parallelism.
+
+One row per member. Headers are matched case-insensitively; the first
+alias found is used:
+
+    type            beam / column (inferred from Pu when absent)
+    id              member mark, e.g. B12 (defaults to the row number)
+    project_id      per-row project (defaults to --project-id)
+
+    Beams           length (m), dead_load, live_load (kN/m), width,
+                    height (mm), fc, fy (MPa), bar_diameter (mm), optional
+                    effective_depth, steel_area_req (mm, mm²)
+    Columns         width = b (short side), height = h, lu (mm), Pu (kN),
+                    fc, fy, n_bars (even, at least 4), bar_diameter,
+                    optional k, Psus and end moments as M1u/M2u_minor/major
+                    (ACI signs) or raw ETABS M22_i/M22_j/M33_i/M33_j (kN·m)
+
+Beam factored loads come from load_combinations (ACI 318-19 Table 5.3.1)
+and the required steel from aci318_flexure with Mu = wu L² / 8; columns go
+through the Method C engine. JSON schedules are a list of member objects or
+{"members": [...]} with schedule-wide defaults next to "members".
+
+Progress is checkpointed in a manifest (output/<schedule>_manifest.json by
+default) after every sheet: status, output, error, design_ok and key design
+values per member, keyed by output name (<name>#row<N> for a duplicate id).
+Non-finite values, e.g. the Mc of an unstable column, are written as null.
+A sheet is still built for a member that fails design, so the sheet shows
+why (NG checks), but the run counts it as design_failed and exits non-zero.
+With --resume, members whose inputs (row values, template file and
+generator version, see build_graph) are unchanged and whose PDF is still in
+place are skipped, so an interrupted or partly failed run picks up where it
+stopped.
+
+Usage:
+    python scripts/pdf_generators/schedule_batch.py schedule.xlsx --engine reportlab
+    python scripts/pdf_generators/schedule_batch.py schedule.csv --workers 8 --resume
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import json
+import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.pdf_generators.batch_pdf_builder import _safe_name, build_pdf_batch
+from scripts.pdf_generators.build_graph import data_digest, sheet_inputs
+from scripts.pdf_generators.latex_worker_pool import DEFAULT_TIMEOUT
+from scripts.pdf_generators.pipeline_trace import (add_trace_arguments, apply_trace_arguments,
+                                                   current_trace, traced)
+
+DEFAULT_PROJECT_ID = "GC-SCHEDULE-2025"
+DEFAULT_CHUNK_ROWS = 500
+MANIFEST_SAVE_INTERVAL = 1.0  # Seconds between manifest checkpoints
+
+# Schedule column names (normalized: lower case, spaces → "_") recognised for each field
+SCHEDULE_FIELDS = {
+    'type': ['type', 'member_type', 'kind'],
+    'member': ['id', 'member', 'mark', 'name', 'label'],
+    'project_id': ['project_id', 'project'],
+    'length': ['length', 'span', 'l'],
+    'dead_load': ['dead_load', 'dl', 'w_d'],
+    'live_load': ['live_load', 'll', 'w_l'],
+    'width': ['width', 'b'],
+    'height': ['height', 'h'],
+    'fc': ['fc', 'fc_prime', "f'c", 'f_c'],
+    'fy': ['fy', 'f_y'],
+    'bar_diameter': ['bar_diameter', 'd_bar', 'db'],
+    'effective_depth': ['effective_depth', 'd'],
+    'steel_area_req': ['steel_area_req', 'as_req', 'as_required'],
+    'lu': ['lu', 'unsupported_length'],
+    'pu': ['pu', 'p'],
+    'psus': ['psus'],
+    'k': ['k'],
+    'n_bars': ['n_bars', 'bars'],
+    'm1u_minor': ['m1u_minor'],
+    'm2u_minor': ['m2u_minor'],
+    'm1u_major': ['m1u_major'],
+    'm2u_major': ['m2u_major'],
+    'm22_i': ['m22_i'],
+    'm22_j': ['m22_j'],
+    'm33_i': ['m33_i'],
+    'm33_j': ['m33_j']
+}
+TEXT_FIELDS = ('type', 'member', 'project_id')
+
+MEMBER_TYPES = {'beam': 'beam', 'b': 'beam', 'girder': 'beam',
+                'column': 'column', 'col': 'column', 'c': 'column'}
+
+# Beam values used when the schedule leaves them blank (as pdf_generator_system.main)
+BEAM_DEFAULTS = {'live_load': 0.0, 'width': 350.0, 'height': 600.0, 'fc': 25.0, 'fy': 420.0,
+                 'bar_diameter': 25.0}
+BEAM_REQUIRED = ('length', 'dead_load')
+COLUMN_REQUIRED = ('width', 'height', 'lu', 'pu', 'fc', 'fy', 'n_bars', 'bar_diameter')
+ACI_MOMENTS = ('m1u_minor', 'm2u_minor', 'm1u_major', 'm2u_major')
+ETABS_MOMENTS = ('m22_i', 'm22_j', 'm33_i', 'm33_j')
+
+
+def _header_key(name) -> str:
+    """Normalize a schedule column header for alias matching"""
+    return re.sub(r'[\s-]+', '_', str(name).strip().lower()) if name is not None else ''
+
+
+def _csv_chunks(path: Path, chunk_rows: int) -> Iterator:
+    import pandas as pd
+
+    with pd.read_csv(path, chunksize=chunk_rows, dtype=str, keep_default_na=False,
+                     encoding='utf-8-sig', skip_blank_lines=True) as reader:
+        yield from reader
+
+
+def _xlsx_chunks(path: Path, chunk_rows: int, sheet: Optional[str] = None) -> Iterator:
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet or workbook.sheetnames[0]].iter_rows(values_only=True)
+        header = next((row for row in rows if any(v not in (None, '') for v in row)), None)
+        if header is None:
+            return
+        columns = [str(v) if v is not None else f"column_{i}" for i, v in enumerate(header)]
+
+        buffer = []
+        for row in rows:
+            if all(v in (None, '') for v in row):
+                continue
+            row = list(row[:len(columns)])
+            buffer.append(row + [None] * (len(columns) - len(row)))
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame(buffer, columns=columns)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _json_chunks(path: Path, chunk_rows: int) -> Iterator:
+    import pandas as pd
+
+    with open(path, 'r', encoding='utf-8') as f:
+        schedule = json.load(f)
+
+    defaults = {}
+    members = schedule
+    if isinstance(schedule, dict):
+        members = schedule.get('members', [])
+        defaults = {key: value for key, value in schedule.items() if key != 'members'}
+    if not isinstance(members, list):
+        raise ValueError(f"Expected a list of members in {path}")
+
+    for start in range(0, len(members), chunk_rows):
+        yield pd.DataFrame([{**defaults, **member} for member in members[start:start + chunk_rows]])
+
+
+def read_schedule(schedule_path: Union[str, Path],
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator:
+    """
+    Stream a member schedule as normalized DataFrame chunks
+
+    Args:
+        schedule_path: CSV, XLSX/XLSM or JSON schedule
+        chunk_rows (int): Rows per chunk
+
+    Returns:
+        Iterator[pandas.DataFrame]: One column per recognised field
+        (SCHEDULE_FIELDS keys; numbers as float, NaN when blank), the
+        1-based schedule row and per-row input errors in 'error'
+    """
+    import pandas as pd
+
+    path = Path(schedule_path)
+    suffix = path.suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        chunks = _xlsx_chunks(path, chunk_rows)
+    elif suffix == '.json':
+        chunks = _json_chunks(path, chunk_rows)
+    elif suffix in ('.csv', '.txt'):
+        chunks = _csv_chunks(path, chunk_rows)
+    else:
+        raise ValueError(f"Unsupported schedule format: {path.suffix} (use CSV, XLSX or JSON)")
+
+    first_row = 1
+    for chunk in chunks:
+        chunk = chunk.reset_index(drop=True)
+        headers = {}
+        for column in chunk.columns:
+            headers.setdefault(_header_key(column), column)
+
+        frame = pd.DataFrame({'row': np.arange(first_row, first_row + len(chunk))})
+        errors = pd.Series('', index=frame.index)
+        for field, aliases in SCHEDULE_FIELDS.items():
+            column = next((headers[alias] for alias in aliases if alias in headers), None)
+            if column is None:
+                frame[field] = '' if field in TEXT_FIELDS else np.nan
+                continue
+
+            raw = chunk[column].map(lambda v: '' if v is None or (isinstance(v, float)
+                                                                  and math.isnan(v))
+                                    else str(v).strip())
+            if field in TEXT_FIELDS:
+                frame[field] = raw
+                continue
+            values = pd.to_numeric(raw.replace('', np.nan), errors='coerce')
+            bad = values.isna() & (raw != '')
+            errors[bad] += f"non-numeric {field}; "
+            frame[field] = values.astype(float)
+
+        frame['error'] = errors
+        first_row += len(chunk)
+        yield frame
+
+
+def _member_types(frame) -> np.ndarray:
+    """Resolve each row's member type ('' for unknown types)"""
+    declared = frame['type'].str.lower()
+    inferred = np.where(frame['pu'].notna(), 'column', 'beam')
+    return np.where(declared == '', inferred, declared.map(MEMBER_TYPES).fillna('').to_numpy())
+
+
+def _missing(frame, fields) -> np.ndarray:
+    """Per-row '; '-joined list of required fields that are blank"""
+    messages = np.full(len(frame), '', dtype=object)
+    for field in fields:
+        blank = frame[field].isna() & ~frame['error'].str.contains(f"non-numeric {field};",
+                                                                   regex=False)
+        messages = np.where(blank, messages + f"missing {field}; ", messages)
+    return messages
+
+
+def _beam_members(frame, project_id: str) -> List[Dict]:
+    """Design every beam row of a chunk at once and build its batch jobs"""
+    from scripts.calculations.aci318_flexure import design_flexure
+    from scripts.calculations.load_combinations import governing_factored_load
+
+    values = {field: frame[field].fillna(BEAM_DEFAULTS.get(field, np.nan)).to_numpy()
+              for field in (*BEAM_REQUIRED, *BEAM_DEFAULTS, 'effective_depth', 'steel_area_req')}
+    errors = frame['error'].to_numpy() + _missing(frame, BEAM_REQUIRED)
+
+    L = values['length']
+    factored_load, combinations = governing_factored_load(values['dead_load'],
+                                                          values['live_load'])
+    effective_depth = np.where(np.isnan(values['effective_depth']),
+                               values['height'] - 50, values['effective_depth'])
+    max_moment = factored_load * L**2 / 8
+    with np.errstate(invalid='ignore', divide='ignore'):
+        design = design_flexure(max_moment, values['width'], effective_depth,
+                                values['fc'], values['fy'])
+    steel_area = np.where(np.isnan(values['steel_area_req']), design['As_required'],
+                          values['steel_area_req'])
+
+    members = []
+    for i, row in enumerate(frame.itertuples(index=False)):
+        member = _member_entry(row, 'beam', project_id, errors[i])
+        if member['error']:
+            members.append(member)
+            continue
+        member['beam_data'] = {
+            'name': member['member'],
+            'length': float(L[i]),
+            'dead_load': float(values['dead_load'][i]),
+            'live_load': float(values['live_load'][i]),
+            'factored_load': float(factored_load[i]),
+            'load_combination': str(combinations[i]),
+            'width': int(round(values['width'][i])),
+            'height': int(round(values['height'][i])),
+            'effective_depth': int(round(effective_depth[i])),
+            'fc': float(values['fc'][i]),
+            'fy': float(values['fy'][i]),
+            'steel_area_req': int(round(steel_area[i])),
+            'bar_diameter': int(round(values['bar_diameter'][i]))
+        }
+        member['design'] = {
+            'factored_load': round(float(factored_load[i]), 3),
+            'load_combination': str(combinations[i]),
+            'max_moment': round(float(max_moment[i]), 3),
+            'steel_area_req': int(round(steel_area[i])),
+            'section_type': str(design['section_type'][i]),
+            'adequate': bool(design['adequate'][i])
+        }
+        member['design_ok'] = member['design']['adequate']
+        members.append(member)
+    return members
+
+
+def _column_members(frame, project_id: str) -> List[Dict]:
+    """Run the Method C check on every column row of a chunk and build its batch jobs"""
+    from scripts.calculations.aci318_method_c_engine import (MIN_PERIMETER_BARS, analyze_columns,
+                                                             column_adequate, column_checks,
+                                                             column_sheet_data, end_moments_to_aci)
+
+    errors = frame['error'].to_numpy() + _missing(frame, COLUMN_REQUIRED)
+    raw = frame[list(ETABS_MOMENTS)].notna().all(axis=1).to_numpy()
+    aci = frame[list(ACI_MOMENTS)].notna().all(axis=1).to_numpy()
+    errors = np.where(raw | aci, errors,
+                      errors + "missing end moments (M1u/M2u_minor/major or M22/M33_i/j); ")
+    n_bars = frame['n_bars'].to_numpy()
+    symmetric = (n_bars >= MIN_PERIMETER_BARS) & (n_bars % 2 == 0)
+    errors = np.where(np.isnan(n_bars) | symmetric, errors,
+                      errors + f"n_bars must be even and at least {MIN_PERIMETER_BARS}; ")
+
+    M1_minor, M2_minor = end_moments_to_aci(frame['m22_i'], frame['m22_j'])
+    M1_major, M2_major = end_moments_to_aci(frame['m33_i'], frame['m33_j'])
+    pu = frame['pu'].to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        results = analyze_columns(
+            frame['width'], frame['height'], frame['lu'], pu,
+            np.where(raw, M1_minor, frame['m1u_minor']),
+            np.where(raw, M2_minor, frame['m2u_minor']),
+            np.where(raw, M1_major, frame['m1u_major']),
+            np.where(raw, M2_major, frame['m2u_major']),
+            frame['fc'], frame['fy'], frame['n_bars'], frame['bar_diameter'],
+            k=frame['k'].fillna(1.0).to_numpy(),
+            Psus=np.where(frame['psus'].isna(), pu, frame['psus'])
+        )
+
+    members = []
+    for i, row in enumerate(frame.itertuples(index=False)):
+        member = _member_entry(row, 'column', project_id, errors[i])
+        if member['error']:
+            members.append(member)
+            continue
+        column_data = column_sheet_data(results, i)
+        column_data.update({
+            'project_id': member['project_id'],
+            'column_id': member['member'],
+            'rebar_count': f"{row.n_bars:.0f}",
+            'rebar_size': f"Ø{row.bar_diameter:.0f}"
+        })
+        checks = column_checks(column_data)
+        member['column_data'] = column_data
+        member['design'] = {
+            'governing_axis': str(results['governing_axis'][i]),
+            'slender_class': column_data['slender_class'],
+            'ratio_method2': round(column_data['ratio2'], 4),
+            'mc_method2': round(column_data['mc_method2'], 3),
+            'interaction_ratio2': round(checks['interaction_ratio2'], 4),
+            'ok': bool(results['ok'][i])
+        }
+        member['design_ok'] = bool(results['ok'][i]) and column_adequate(checks)
+        members.append(member)
+    return members
+
+
+def _member_entry(row, member_type: str, project_id: str, error: str) -> Dict:
+    """Common fields of a schedule member"""
+    prefix = {'beam': 'B', 'column': 'C'}.get(member_type, 'M')
+    member = row.member or f"{prefix}{row.row}"
+    project = row.project_id or project_id
+    return {
+        'row': int(row.row),
+        'type': member_type,
+        'member': member,
+        'project_id': project,
+        'name': f"{_safe_name(project)}_{_safe_name(member)}",
+        'error': error.strip().rstrip(';')
+    }
+
+
+def calculate_schedule(schedule_path: Union[str, Path], project_id: str = DEFAULT_PROJECT_ID,
+                       chunk_rows: int = DEFAULT_CHUNK_ROWS) -> List[Dict]:
+    """
+    Read a schedule and design all of its members, one vectorized pass per chunk
+
+    Args:
+        schedule_path: CSV, XLSX or JSON schedule
+        project_id (str): Project ID for rows without one
+        chunk_rows (int): Rows read and designed at a time
+
+    Returns:
+        List[Dict]: One entry per row, in schedule order: row, type, member,
+        project_id, name (output file stem), error ('' when valid) and, for
+        valid rows, 'beam_data' or 'column_data', a 'design' summary and
+        'design_ok' (False when the member fails its design checks)
+    """
+    members = []
+    for frame in read_schedule(schedule_path, chunk_rows):
+        types = _member_types(frame)
+        for row in frame[types == ''].itertuples(index=False):
+            members.append(_member_entry(row, row.type, project_id,
+                                         f"unknown member type {row.type}"))
+        for member_type, build in (('beam', _beam_members), ('column', _column_members)):
+            rows = frame[types == member_type]
+            if len(rows):
+                members.extend(build(rows.reset_index(drop=True), project_id))
+
+    members.sort(key=lambda member: member['row'])
+    seen = set()
+    for member in members:
+        if member['name'] in seen and not member['error']:
+            member['error'] = f"duplicate member id {member['member']}"
+        seen.add(member['name'])
+    return members
+
+
+def _fingerprint(member: Dict, engine: str, template_style: str, inputs: Dict) -> str:
+    """Hash of everything a member's sheet depends on (inputs: see build_graph.sheet_inputs)"""
+    payload = {key: member.get(key) for key in ('beam_data', 'column_data', 'project_id')}
+    payload.update(engine=engine,
+                   template_style=template_style if 'beam_data' in member else None,
+                   **inputs)
+    return data_digest(payload)
+
+
+def _json_safe(value):
+    """Replace non-finite floats (unstable columns) with None, recursively"""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class ScheduleManifest:
+    """Per-member build status, checkpointed to a JSON file"""
+
+    def __init__(self, path: Union[str, Path], schedule: Union[str, Path], resume: bool = False):
+        """
+        Open a manifest
+
+        Args:
+            path: Manifest JSON file
+            schedule: Schedule the manifest belongs to
+            resume (bool): Keep the entries of a previous run at this path
+        """
+        self.path = Path(path)
+        self.data = {'schedule': str(schedule), 'members': {}}
+        if resume and self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data['members'] = json.load(f).get('members', {})
+        self._saved = 0.0
+
+    @property
+    def members(self) -> Dict[str, Dict]:
+        return self.data['members']
+
+    def is_done(self, name: str, fingerprint: str) -> bool:
+        """Whether a member was built from identical inputs and its PDF still exists"""
+        entry = self.members.get(name)
+        return bool(entry and entry.get('status') == 'ok'
+                    and entry.get('fingerprint') == fingerprint
+                    and entry.get('output') and Path(entry['output']).exists())
+
+    def save(self, force: bool = True):
+        """Write the manifest atomically (at most once per MANIFEST_SAVE_INTERVAL unless forced)"""
+        now = time.monotonic()
+        if not force and now - self._saved < MANIFEST_SAVE_INTERVAL:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(_json_safe(self.data), f, indent=2, default=str, allow_nan=False)
+        os.replace(temp_file, self.path)
+        self._saved = now
+
+
+def default_manifest_path(schedule_path: Union[str, Path],
+                          output_dir: Optional[Union[str, Path]] = None) -> Path:
+    """output/<schedule stem>_manifest.json"""
+    output_dir = Path(output_dir) if output_dir else project_root / "output"
+    return output_dir / f"{Path(schedule_path).stem}_manifest.json"
+
+
+@traced('schedule_batch')
+def run_schedule(schedule_path: Union[str, Path],
+                 output_dir: Optional[Union[str, Path]] = None,
+                 template_style: str = "standard",
+                 engine: str = "latex",
+                 max_workers: Optional[int] = None,
+                 latex_workers: Optional[int] = None,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 use_cache: bool = True,
+                 resume: bool = False,
+                 manifest_path: Optional[Union[str, Path]] = None,
+                 project_id: str = DEFAULT_PROJECT_ID,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict:
+    """
+    Design and build the calculation sheets of every member in a schedule
+
+    Args:
+        schedule_path: CSV, XLSX or JSON member schedule
+        output_dir (str, optional): Destination directory (defaults to output/)
+        template_style (str): Beam template, "standard" or "cambridge"
+        engine (str): "latex" or "reportlab"
+        max_workers (int, optional): Worker processes, defaults to the CPU count
+        latex_workers (int, optional): Sheets compiled concurrently
+        timeout (float, optional): Seconds allowed per sheet in pdflatex
+        use_cache (bool): Reuse previously compiled PDFs with identical inputs
+        resume (bool): Skip members the manifest already records as built
+        manifest_path (str, optional): Manifest file (see default_manifest_path)
+        project_id (str): Project ID for rows without one
+        chunk_rows (int): Schedule rows read and designed at a time
+
+    Returns:
+        Dict: Summary with members, built, skipped, failed, invalid and
+        design_failed (sheets built for members that fail design) counts,
+        wall time and the manifest path
+    """
+    print("📋 GHALI CONSULTANTS - Member Schedule Batch")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    output_dir = Path(output_dir) if output_dir else project_root / "output"
+    manifest_path = Path(manifest_path) if manifest_path else \
+        default_manifest_path(schedule_path, output_dir)
+    manifest = ScheduleManifest(manifest_path, schedule_path, resume)
+    previous = manifest.members
+
+    with current_trace().stage('calculate'):
+        members = calculate_schedule(schedule_path, project_id, chunk_rows)
+    print(f"   {len(members)} members in {Path(schedule_path).name} "
+          f"({sum(m['type'] == 'beam' for m in members)} beams, "
+          f"{sum(m['type'] == 'column' for m in members)} columns), "
+          f"designed in {time.perf_counter() - start:.2f} s")
+
+    sheet_sources = {member_type: sheet_inputs(member_type, engine, template_style)
+                     for member_type in ('beam', 'column')}
+    entries = {}
+    jobs = []
+    skipped = 0
+    for member in members:
+        entry = {key: member[key] for key in ('row', 'type', 'member', 'project_id')}
+        if member['error']:
+            entry.update(status='invalid', output=None, error=member['error'])
+            print(f"   ⚠️ Row {member['row']} ({member['member']}): {member['error']}")
+        else:
+            entry['fingerprint'] = _fingerprint(member, engine, template_style,
+                                                sheet_sources[member['type']])
+            entry['design'] = member['design']
+            entry['design_ok'] = member['design_ok']
+            if not member['design_ok']:
+                print(f"   ❌ Row {member['row']} ({member['member']}): fails design checks")
+            if manifest.is_done(member['name'], entry['fingerprint']):
+                entry.update({key: previous[member['name']][key]
+                              for key in ('status', 'output', 'seconds')
+                              if key in previous[member['name']]})
+                skipped += 1
+            else:
+                entry.update(status='pending', output=None)
+                data_key = 'beam_data' if member['type'] == 'beam' else 'column_data'
+                jobs.append({data_key: member[data_key], 'name': member['name'],
+                             'project_info': {'project_id': member['project_id'],
+                                              'title': f"{member['type'].title()} "
+                                                       f"{member['member']}"}})
+        # A duplicate id is invalid; its own key keeps it in the manifest and counts
+        key = member['name'] if member['name'] not in entries else \
+            f"{member['name']}#row{member['row']}"
+        entries[key] = entry
+
+    manifest.data.update(engine=engine, template=template_style, output_dir=str(output_dir))
+    manifest.data['members'] = entries
+    manifest.save()
+    if skipped:
+        print(f"   ⏭️ {skipped} members already built (resume)")
+
+    def record(result: Dict):
+        entry = entries[result['name']]
+        entry.update(status=result['status'], output=result.get('output'),
+                     seconds=round(result.get('seconds', 0.0), 3))
+        entry.pop('error', None)
+        if result.get('error'):
+            entry['error'] = result['error']
+        manifest.save(force=False)
+
+    batch = None
+    try:
+        if jobs:
+            batch = build_pdf_batch(jobs, template_style, max_workers, output_dir, latex_workers,
+                                    timeout, use_cache=use_cache, engine=engine,
+                                    on_result=record)
+    finally:
+        statuses = [entry['status'] for entry in entries.values()]
+        summary = {
+            'members': len(entries),
+            'built': statuses.count('ok') - skipped,
+            'skipped': skipped,
+            'failed': sum(s not in ('ok', 'invalid') for s in statuses),
+            'invalid': statuses.count('invalid'),
+            'design_failed': sum(entry.get('design_ok') is False for entry in entries.values()),
+            'wall_time': round(time.perf_counter() - start, 3),
+            'manifest': str(manifest_path)
+        }
+        if batch is not None:
+            summary['sheets_per_minute'] = round(batch['sheets_per_minute'], 2)
+        manifest.data['summary'] = summary
+        manifest.save()
+
+    print(f"\n📋 {summary['built']} built, {summary['skipped']} skipped, "
+          f"{summary['failed']} failed, {summary['invalid']} invalid, "
+          f"{summary['design_failed']} failing design "
+          f"of {summary['members']} members in {summary['wall_time']:.1f} s")
+    print(f"📁 Manifest: {manifest_path}")
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Build calculation sheets for every member of a schedule')
+    parser.add_argument('schedule', help='Member schedule (CSV, XLSX or JSON)')
+    parser.add_argument('--template', choices=['standard', 'cambridge'], default='standard',
+                        help='Beam template style: standard or cambridge')
+    parser.add_argument('--engine', choices=['latex', 'reportlab'], default='latex',
+                        help='PDF engine: pdflatex or pure-Python reportlab (no LaTeX)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--latex-workers', type=int,
+                        help='Sheets compiled concurrently (default: --workers)')
+    parser.add_argument('--output-dir', help='Output directory (default: output/)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Seconds allowed per sheet in pdflatex')
+    parser.add_argument('--no-cache', action='store_true', help='Always recompile with pdflatex')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip members already built with unchanged inputs')
+    parser.add_argument('--manifest', help='Manifest file (default: output/<schedule>_manifest.json)')
+    parser.add_argument('--project-id', default=DEFAULT_PROJECT_ID,
+                        help='Project ID for rows without one')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help='Schedule rows designed per vectorized chunk')
+    add_trace_arguments(parser)
+
+    args = parser.parse_args()
+    apply_trace_arguments(args)
+
+    summary = run_schedule(args.schedule, args.output_dir, args.template, args.engine,
+                           args.workers, args.latex_workers, args.timeout,
+                           use_cache=not args.no_cache, resume=args.resume,
+                           manifest_path=args.manifest, project_id=args.project_id,
+                           chunk_rows=args.chunk_rows)
+
+    if summary['failed'] or summary['invalid'] or summary['design_failed']:
+        sys.exit(1)
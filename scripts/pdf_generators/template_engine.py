@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Report Template Engine
+==========================================
+Compiled, cached Jinja2 templates for every report in templates/, replacing
+the per-placeholder str.replace passes of the generators.
+
+LaTeX templates use delimiters that cannot clash with TeX syntax:
+
+    \\VAR{beam.length|fmt('.1f')}        value (LaTeX-escaped)
+    \\VAR{member.status|safe}            value that already is LaTeX markup
+    \\BLOCK{for member in members}       statement (for, if, set, ...)
+    \\#{ comment }                       template comment
+
+Every value is escaped for LaTeX when it is written, so names such as
+"B_12 & B_13" can never break a sheet. HTML templates use the standard
+Jinja syntax with HTML autoescaping.
+
+Templates are compiled once per process and the compiled bytecode is kept
+in output/.jinja_cache/, so later runs skip parsing as well. Rendering is a
+single pass; render_stream() yields the document in chunks so loops over
+thousands of members never build the whole report in memory.
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import math
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# Project paths
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+
+TEMPLATES_DIR = project_root / "templates"
+DEFAULT_BYTECODE_DIR = project_root / "output" / ".jinja_cache"
+
+# Written in place of inf/NaN results (e.g. δns of a column past its buckling load)
+NON_FINITE_TEXT = "N/A — unstable"
+
+LATEX_SPECIAL = {'\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+                 '_': r'\_', '{': r'\{', '}': r'\}', '~': r'\textasciitilde{}',
+                 '^': r'\textasciicircum{}'}
+LATEX_SPECIAL_PATTERN = re.compile('|'.join(re.escape(char) for char in LATEX_SPECIAL))
+
+
+def latex_escape(value) -> str:
+    """Escape LaTeX special characters in str(value)"""
+    return LATEX_SPECIAL_PATTERN.sub(lambda m: LATEX_SPECIAL[m.group(0)], str(value))
+
+
+def format_value(value, spec: str = '') -> str:
+    """Jinja filter applying a Python format spec, e.g. \\VAR{ec|fmt(',.1f')}"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return NON_FINITE_TEXT
+    return format(value, spec)
+
+
+def _finalize_latex(value):
+    """Escape every written value unless it is marked safe"""
+    if isinstance(value, Markup):
+        return str(value)
+    return latex_escape(value)
+
+
+@lru_cache(maxsize=None)
+def get_environment(kind: str = 'latex') -> 'Environment':
+    """
+    Shared template environment, created once per process
+
+    Args:
+        kind (str): 'latex' for .tex templates or 'html' for .html templates
+
+    Returns:
+        Environment: Jinja2 environment loading from templates/
+    """
+    if kind not in ('latex', 'html'):
+        raise ValueError("Template kind must be 'latex' or 'html'")
+
+    # Imported here so scripts that never render pay nothing for Jinja2
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
+
+    options = {
+        'loader': FileSystemLoader(str(TEMPLATES_DIR)),
+        'undefined': StrictUndefined,
+        'keep_trailing_newline': True,
+        'auto_reload': False
+    }
+
+    if not os.environ.get('GHALI_NO_TEMPLATE_CACHE'):
+        bytecode_dir = Path(os.environ.get('GHALI_TEMPLATE_CACHE_DIR', DEFAULT_BYTECODE_DIR))
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+        options['bytecode_cache'] = FileSystemBytecodeCache(str(bytecode_dir))
+
+    if kind == 'latex':
+        env = Environment(
+            block_start_string=r'\BLOCK{', block_end_string='}',
+            variable_start_string=r'\VAR{', variable_end_string='}',
+            comment_start_string=r'\#{', comment_end_string='}',
+            line_statement_prefix=None, line_comment_prefix=None,
+            trim_blocks=True, lstrip_blocks=True, autoescape=False,
+            finalize=_finalize_latex, **options)
+    else:
+        env = Environment(autoescape=True, **options)
+
+    env.filters['fmt'] = format_value
+    env.filters['latex'] = latex_escape
+    return env
+
+
+def get_template(name: str):
+    """Compiled template by file name in templates/ (kind chosen by extension)"""
+    kind = 'html' if name.endswith('.html') else 'latex'
+    return get_environment(kind).get_template(name)
+
+
+def template_source(name: str) -> str:
+    """Raw, unrendered text of a template in templates/"""
+    return (TEMPLATES_DIR / name).read_text(encoding='utf-8')
+
+
+def render(name: str, **context) -> str:
+    """
+    Render a template in one pass
+
+    Args:
+        name (str): Template file name in templates/
+        **context: Template variables
+
+    Returns:
+        str: Rendered document
+    """
+    return get_template(name).render(**context)
+
+
+def render_stream(name: str, **context) -> Iterator[str]:
+    """
+    Render a template lazily, chunk by chunk
+
+    Iterables in the context (e.g. a generator of members) are consumed only
+    as the template reaches them.
+
+    Args:
+        name (str): Template file name in templates/
+        **context: Template variables
+
+    Returns:
+        Iterator[str]: Rendered text chunks
+    """
+    return get_template(name).generate(**context)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    print("🧰 GHALI CONSULTANTS - Template Compiler")
+    print("=" * 50)
+
+    for template_path in sorted(TEMPLATES_DIR.iterdir()):
+        if template_path.suffix not in ('.tex', '.html'):
+            continue
+        start = time.perf_counter()
+        try:
+            get_template(template_path.name)
+        except Exception as e:
+            print(f"   ❌ {template_path.name}: {e}")
+            sys.exit(1)
+        print(f"   ✓ {template_path.name} ({(time.perf_counter() - start) * 1000:.1f} ms)")
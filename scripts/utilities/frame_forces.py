@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Frame Force Store
+=====================================
+Streams ETABS / SAP2000 frame-force tables (CSV or XLSX exports of
+"Element Forces - Columns / Beams / Frames") into a columnar store of
+memory-mapped NumPy arrays, so end moments for any member are read
+directly instead of being copied into notebooks by hand.
+
+Ingestion reads the exports in chunks (pandas for CSV, openpyxl read-only
+mode for XLSX), spools the rows to disk and sorts them once by
+(frame, combo, station). The store directory holds one .npy file per
+column plus an offset table, so the stations of any (frame, combo) pair
+are a contiguous slice found in O(1):
+
+    output/frame_forces/
+        index.json            frames, combos, units, sources
+        offsets.npy           row offsets, (n_frames * n_combos + 1)
+        station.npy, P.npy, V2.npy, V3.npy, T.npy, M2.npy, M3.npy
+
+Frames are keyed by the ETABS "Unique Name" (or the SAP2000 "Frame"
+label); the story and label are kept for lookup. Combos are keyed by the
+output case, with the step type appended for multi-step results
+(e.g. "ENVELOPE Max").
+
+Values are stored as exported (ETABS sign convention, tension positive).
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import csv
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+DEFAULT_STORE_DIR = project_root / "output" / "frame_forces"
+DEFAULT_CHUNK_ROWS = 200_000
+
+COMPONENTS = ('P', 'V2', 'V3', 'T', 'M2', 'M3')
+VALUE_DTYPE = np.float32
+
+# Export column names (lower case) recognised for each field, in priority order
+COLUMN_ALIASES = {
+    'unique': ['unique name', 'uniquename'],
+    'label': ['column', 'beam', 'brace', 'frame', 'label', 'line'],
+    'story': ['story', 'storey'],
+    'combo': ['output case', 'outputcase', 'load case/combo', 'combo', 'load combo', 'case'],
+    'step': ['step type', 'steptype'],
+    'station': ['station'],
+    **{component: [component.lower()] for component in COMPONENTS}
+}
+
+HEADER_SEARCH_ROWS = 20
+
+
+def _match_columns(header: Sequence) -> Dict[str, int]:
+    """Map field names onto positions in an export header row"""
+    names = [str(name).strip().lower() if name is not None else '' for name in header]
+    positions = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in names:
+                positions[field] = names.index(alias)
+                break
+    return positions
+
+
+def _is_header(row: Sequence) -> bool:
+    positions = _match_columns(row)
+    return 'station' in positions and 'combo' in positions and \
+        ('unique' in positions or 'label' in positions)
+
+
+def _is_units_row(row: Sequence, positions: Dict[str, int]) -> bool:
+    """ETABS exports a units row (e.g. 'm', 'kN') directly below the header"""
+    value = row[positions['station']] if positions['station'] < len(row) else None
+    try:
+        float(value)
+        return False
+    except (TypeError, ValueError):
+        return True
+
+
+def _units(header: Sequence, units_row: Optional[Sequence],
+           positions: Dict[str, int]) -> Dict[str, str]:
+    if units_row is None:
+        return {}
+    fields = ['station', *COMPONENTS]
+    return {field: str(units_row[positions[field]]).strip()
+            for field in fields if field in positions and positions[field] < len(units_row)
+            and units_row[positions[field]] not in (None, '')}
+
+
+def _csv_chunks(path: Path, chunk_rows: int) -> Iterator:
+    """Yield (positions, units, DataFrame chunk) from a CSV export"""
+    import pandas as pd
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        head = [row for _, row in zip(range(HEADER_SEARCH_ROWS), csv.reader(f))]
+
+    header_line = next((i for i, row in enumerate(head) if _is_header(row)), None)
+    if header_line is None:
+        raise ValueError(f"No frame-force header (Station, Output Case, ...) in {path}")
+
+    positions = _match_columns(head[header_line])
+    skip = list(range(header_line))
+    units_row = None
+    if header_line + 1 < len(head) and _is_units_row(head[header_line + 1], positions):
+        units_row = head[header_line + 1]
+        skip.append(header_line + 1)
+
+    units = _units(head[header_line], units_row, positions)
+    usecols = sorted(set(positions.values()))
+    for chunk in pd.read_csv(path, skiprows=skip, header=0, usecols=usecols,
+                             chunksize=chunk_rows, dtype=str, keep_default_na=False):
+        columns = list(chunk.columns)
+        header = head[header_line]
+        chunk_positions = {field: columns.index(header[index])
+                           for field, index in positions.items()}
+        yield chunk_positions, units, chunk
+
+
+def _xlsx_chunks(path: Path, chunk_rows: int, sheet: Optional[str] = None) -> Iterator:
+    """Yield (positions, units, DataFrame chunk) from an XLSX export"""
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet is None:
+            sheet = next((name for name in workbook.sheetnames if 'force' in name.lower()),
+                         workbook.sheetnames[0])
+        rows = workbook[sheet].iter_rows(values_only=True)
+
+        header = None
+        for _ in range(HEADER_SEARCH_ROWS):
+            row = next(rows, None)
+            if row is None:
+                break
+            if _is_header(row):
+                header = row
+                break
+        if header is None:
+            raise ValueError(f"No frame-force header (Station, Output Case, ...) in {path}")
+
+        positions = _match_columns(header)
+        columns = sorted(set(positions.values()))
+        chunk_positions = {field: columns.index(index) for field, index in positions.items()}
+
+        units = {}
+        buffer = []
+        first = next(rows, None)
+        if first is not None:
+            if _is_units_row(first, positions):
+                units = _units(header, first, positions)
+            else:
+                buffer.append([first[i] for i in columns])
+
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in columns])
+            if len(buffer) >= chunk_rows:
+                yield chunk_positions, units, pd.DataFrame(buffer)
+                buffer = []
+        if buffer:
+            yield chunk_positions, units, pd.DataFrame(buffer)
+    finally:
+        workbook.close()
+
+
+def _source_chunks(path: Path, chunk_rows: int) -> Iterator:
+    if path.suffix.lower() in ('.xlsx', '.xlsm'):
+        return _xlsx_chunks(path, chunk_rows)
+    return _csv_chunks(path, chunk_rows)
+
+
+class _Codes:
+    """Incremental string → integer code table"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, keys) -> np.ndarray:
+        import pandas as pd
+
+        local, uniques = pd.factorize(keys)
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, key in enumerate(uniques):
+            code = self.codes.get(key)
+            if code is None:
+                code = self.codes[key] = len(self.values)
+                self.values.append(key)
+            mapping[i] = code
+        return mapping[local]
+
+
+def ingest_frame_forces(sources: Iterable[Union[str, Path]],
+                        store_dir: Union[str, Path] = DEFAULT_STORE_DIR,
+                        chunk_rows: int = DEFAULT_CHUNK_ROWS) -> 'FrameForceStore':
+    """
+    Stream frame-force exports into a columnar store
+
+    Args:
+        sources: CSV/XLSX export files
+        store_dir (str): Store directory (replaced if it exists)
+        chunk_rows (int): Rows read per chunk
+
+    Returns:
+        FrameForceStore: The new store, opened read-only
+    """
+    import pandas as pd
+
+    store_dir = Path(store_dir)
+    sources = [Path(source) for source in sources]
+    frames = _Codes()
+    combos = _Codes()
+    frame_info = {}
+    units = {}
+    fields = ('frame', 'combo', 'station', *COMPONENTS)
+    dtypes = {'frame': np.int32, 'combo': np.int32}
+
+    spool = Path(tempfile.mkdtemp(prefix='frame_forces_', dir=store_dir.parent
+                                  if store_dir.parent.exists() else None))
+    try:
+        handles = {field: open(spool / f"{field}.bin", 'wb') for field in fields}
+        n_rows = 0
+        for source in sources:
+            if not source.exists():
+                raise FileNotFoundError(f"Frame force export not found: {source}")
+
+            for positions, chunk_units, chunk in _source_chunks(source, chunk_rows):
+                units = units or chunk_units
+
+                def column(field):
+                    return chunk.iloc[:, positions[field]]
+
+                numbers = {field: pd.to_numeric(column(field), errors='coerce').to_numpy()
+                           for field in ('station', *COMPONENTS) if field in positions}
+                valid = ~np.isnan(numbers['station'])
+                if not valid.any():
+                    continue
+
+                label = column('label').astype(str).str.strip() if 'label' in positions else None
+                story = column('story').astype(str).str.strip() if 'story' in positions else None
+                key = column('unique').astype(str).str.strip() if 'unique' in positions else \
+                    (story + '/' + label if story is not None else label)
+                combo = column('combo').astype(str).str.strip()
+                if 'step' in positions:
+                    step = column('step').fillna('').astype(str).str.strip()
+                    combo = combo.where(step == '', combo + ' ' + step)
+
+                key, combo = key[valid], combo[valid]
+                frame_codes = frames.encode(key.to_numpy())
+                if len(frame_info) < len(frames.values):
+                    details = pd.DataFrame({
+                        'key': key,
+                        'label': label[valid] if label is not None else key,
+                        'story': story[valid] if story is not None else ''
+                    }).drop_duplicates('key')
+                    for row in details.itertuples(index=False):
+                        frame_info.setdefault(row.key, {'key': row.key, 'label': row.label,
+                                                        'story': row.story})
+
+                arrays = {'frame': frame_codes, 'combo': combos.encode(combo.to_numpy())}
+                for field in ('station', *COMPONENTS):
+                    values = numbers.get(field)
+                    arrays[field] = np.nan_to_num(values[valid]) if values is not None \
+                        else np.zeros(int(valid.sum()))
+
+                for field in fields:
+                    np.ascontiguousarray(arrays[field], dtype=dtypes.get(field, VALUE_DTYPE)) \
+                        .tofile(handles[field])
+                n_rows += int(valid.sum())
+
+        for handle in handles.values():
+            handle.close()
+
+        if n_rows == 0:
+            raise ValueError("No frame-force rows found in the exports")
+
+        def spooled(field):
+            return np.memmap(spool / f"{field}.bin", dtype=dtypes.get(field, VALUE_DTYPE),
+                             mode='r', shape=(n_rows,))
+
+        # One sort by (frame, combo, station); columns are written through a memmap
+        frame_code, combo_code, station = spooled('frame'), spooled('combo'), spooled('station')
+        order = np.lexsort((station, combo_code, frame_code))
+
+        staging = store_dir.with_name(store_dir.name + '.partial')
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+
+        block = max(chunk_rows, 1)
+        for field in ('station', *COMPONENTS):
+            source_values = spooled(field)
+            target = np.lib.format.open_memmap(staging / f"{field}.npy", mode='w+',
+                                               dtype=VALUE_DTYPE, shape=(n_rows,))
+            for start in range(0, n_rows, block):
+                target[start:start + block] = source_values[order[start:start + block]]
+            target.flush()
+            del target
+
+        # offsets[f * n_combos + c] .. offsets[f * n_combos + c + 1] → rows of (f, c)
+        n_combos = len(combos.values)
+        pair = frame_code[order].astype(np.int64) * n_combos + combo_code[order]
+        offsets = np.searchsorted(pair, np.arange(len(frames.values) * n_combos + 1))
+        np.save(staging / "offsets.npy", offsets.astype(np.int64))
+
+        index = {
+            'rows': n_rows,
+            'frames': [frame_info[key] for key in frames.values],
+            'combos': combos.values,
+            'units': units,
+            'sources': [str(source) for source in sources]
+        }
+        (staging / "index.json").write_text(json.dumps(index, indent=2), encoding='utf-8')
+        del frame_code, combo_code, station
+
+        if store_dir.exists():
+            shutil.rmtree(store_dir)
+        staging.rename(store_dir)
+    finally:
+        shutil.rmtree(spool, ignore_errors=True)
+
+    return FrameForceStore(store_dir)
+
+
+class FrameForceStore:
+    """Read-only, memory-mapped frame forces indexed by frame, combo and station"""
+
+    def __init__(self, store_dir: Union[str, Path] = DEFAULT_STORE_DIR):
+        """
+        Open a store written by ingest_frame_forces()
+
+        Args:
+            store_dir (str): Store directory
+        """
+        self.store_dir = Path(store_dir)
+        index_file = self.store_dir / "index.json"
+        if not index_file.exists():
+            raise FileNotFoundError(f"Frame force store not found: {self.store_dir}")
+
+        index = json.loads(index_file.read_text(encoding='utf-8'))
+        self.rows = index['rows']
+        self.frames = index['frames']
+        self.combos = index['combos']
+        self.units = index['units']
+        self.sources = index['sources']
+
+        self._frame_codes = {frame['key']: i for i, frame in enumerate(self.frames)}
+        self._combo_codes = {combo: i for i, combo in enumerate(self.combos)}
+        self._labels = {}
+        for i, frame in enumerate(self.frames):
+            self._labels.setdefault(frame['label'], []).append(i)
+
+        self.offsets = np.load(self.store_dir / "offsets.npy")
+        self.columns = {field: np.load(self.store_dir / f"{field}.npy", mmap_mode='r')
+                        for field in ('station', *COMPONENTS)}
+
+    def frame_code(self, frame: str, story: Optional[str] = None) -> int:
+        """Code of a frame given its unique name, or its label (and story)"""
+        if frame in self._frame_codes:
+            return self._frame_codes[frame]
+
+        candidates = [i for i in self._labels.get(frame, [])
+                      if story is None or self.frames[i]['story'] == story]
+        if len(candidates) == 1:
+            return candidates[0]
+        if not candidates:
+            raise KeyError(f"Unknown frame: {frame}")
+        stories = ', '.join(self.frames[i]['story'] for i in candidates)
+        raise KeyError(f"Frame label {frame} is on several stories ({stories}); pass story=")
+
+    def combo_code(self, combo: str) -> int:
+        if combo not in self._combo_codes:
+            raise KeyError(f"Unknown combo: {combo}")
+        return self._combo_codes[combo]
+
+    def rows_for(self, frame: str, combo: str, story: Optional[str] = None) -> slice:
+        """Row slice of one (frame, combo) pair"""
+        pair = self.frame_code(frame, story) * len(self.combos) + self.combo_code(combo)
+        return slice(int(self.offsets[pair]), int(self.offsets[pair + 1]))
+
+    def station_forces(self, frame: str, combo: str,
+                       story: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Forces at every station of one member under one combo
+
+        Args:
+            frame (str): Unique name or label
+            combo (str): Output case (with step type for multi-step cases)
+            story (str): Story, when a label is used and repeats over stories
+
+        Returns:
+            Dict: 'station' and one array per force component
+        """
+        rows = self.rows_for(frame, combo, story)
+        return {field: np.asarray(values[rows]) for field, values in self.columns.items()}
+
+    def end_forces(self, frames: Optional[Sequence[str]] = None,
+                   combos: Optional[Sequence[str]] = None):
+        """
+        End forces of many members and combos, in the layout of aci318_method_c_engine
+
+        Args:
+            frames: Unique names (default: all frames)
+            combos: Combo names (default: all combos)
+
+        Returns:
+            pandas.DataFrame: One row per (frame, combo) pair with results:
+            frame, story, label, combo, length, Pu (maximum compression,
+            positive), M22_i, M22_j, M33_i, M33_j, V2_max, V3_max
+        """
+        import pandas as pd
+
+        n_combos = len(self.combos)
+        frame_codes = np.arange(len(self.frames)) if frames is None else \
+            np.array([self.frame_code(frame) for frame in frames], dtype=np.int64)
+        combo_codes = np.arange(n_combos) if combos is None else \
+            np.array([self.combo_code(combo) for combo in combos], dtype=np.int64)
+
+        pairs = (frame_codes[:, None] * n_combos + combo_codes[None, :]).ravel()
+        starts, stops = self.offsets[pairs], self.offsets[pairs + 1]
+        present = stops > starts
+        pairs, starts, stops = pairs[present], starts[present], stops[present]
+        first, last = starts, stops - 1
+
+        # Gather only the rows of the requested pairs, so the cost follows the
+        # query size rather than the store size, then reduce each segment
+        lengths = stops - starts
+        segment_starts = np.cumsum(lengths) - lengths
+        rows = np.repeat(starts - segment_starts, lengths) + np.arange(lengths.sum())
+
+        def reduce(ufunc, field):
+            return ufunc.reduceat(np.asarray(self.columns[field])[rows], segment_starts)
+
+        station, P = self.columns['station'], self.columns['P']
+        frame_index = pairs // n_combos
+        frame_rows = [self.frames[i] for i in frame_index]
+
+        return pd.DataFrame({
+            'frame': [frame['key'] for frame in frame_rows],
+            'story': [frame['story'] for frame in frame_rows],
+            'label': [frame['label'] for frame in frame_rows],
+            'combo': [self.combos[i] for i in pairs % n_combos],
+            'length': np.asarray(station[last] - station[first], dtype=float),
+            'Pu': -reduce(np.minimum, 'P').astype(float),
+            'P_i': np.asarray(P[first], dtype=float),
+            'P_j': np.asarray(P[last], dtype=float),
+            'M22_i': np.asarray(self.columns['M2'][first], dtype=float),
+            'M22_j': np.asarray(self.columns['M2'][last], dtype=float),
+            'M33_i': np.asarray(self.columns['M3'][first], dtype=float),
+            'M33_j': np.asarray(self.columns['M3'][last], dtype=float),
+            'V2_max': np.maximum(reduce(np.maximum, 'V2'), -reduce(np.minimum, 'V2')).astype(float),
+            'V3_max': np.maximum(reduce(np.maximum, 'V3'), -reduce(np.minimum, 'V3')).astype(float)
+        })
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Ingest and query ETABS/SAP2000 frame forces')
+    parser.add_argument('sources', nargs='*', help='CSV/XLSX frame-force exports to ingest')
+    parser.add_argument('--store', default=str(DEFAULT_STORE_DIR), help='Store directory')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help='Rows read per chunk')
+    parser.add_argument('--frame', help='Print the station forces of this frame')
+    parser.add_argument('--story', help='Story of --frame when a label is given')
+    parser.add_argument('--combo', help='Combo for --frame (default: all combos)')
+
+    args = parser.parse_args()
+
+    print("🏗️  GHALI CONSULTANTS - Frame Force Store")
+    print("=" * 50)
+
+    if args.sources:
+        start = time.perf_counter()
+        store = ingest_frame_forces(args.sources, args.store, args.chunk_rows)
+        print(f"✓ {store.rows:,} rows, {len(store.frames):,} frames, "
+              f"{len(store.combos):,} combos in {time.perf_counter() - start:.1f}s")
+        print(f"📁 Store: {store.store_dir}")
+    else:
+        store = FrameForceStore(args.store)
+
+    if args.frame:
+        for combo in [args.combo] if args.combo else store.combos:
+            try:
+                forces = store.station_forces(args.frame, combo, args.story)
+            except KeyError as e:
+                print(f"❌ {e.args[0]}")
+                sys.exit(1)
+            if not len(forces['station']):
+                continue
+            print(f"\n{args.frame} / {combo}")
+            print("   Station        P       V2       V3        T       M2       M3")
+            for row in zip(*(forces[field] for field in ('station', *COMPONENTS))):
+                print("   " + " ".join(f"{value:8.3f}" for value in row))
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Notebook Result Extractor
+============================================
+Reads calculation results out of Jupyter notebooks in a single pass over the
+notebook JSON, without executing anything.
+
+Values are taken, in order of precedence, from:
+
+1. Published results - a JSON payload in any output with MIME type
+   ``application/vnd.ghali.results+json``, or the JSON output (or raw cell
+   source) of a cell tagged ``ghali-results``. Executed notebooks publish
+   the numbers they actually computed this way.
+2. Source assignments - top-level assignments such as ``length = 10.0`` or
+   ``factored_load = 1.2 * dead_load + 1.6 * live_load`` are evaluated with
+   a small arithmetic interpreter, so unexecuted notebooks still yield
+   correct numbers.
+
+Publishing results from a notebook::
+
+    from IPython.display import display
+    display({'application/vnd.ghali.results+json': {
+        'length': length, 'factored_load': factored_load}}, raw=True)
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import ast
+import json
+import math
+import operator
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+RESULTS_TAG = 'ghali-results'
+RESULTS_MIME = 'application/vnd.ghali.results+json'
+
+# Beam data keys and the notebook variable names they are read from, in priority order
+BEAM_ALIASES = {
+    'length': ['length', 'beam_length', 'span', 'L'],
+    'dead_load': ['dead_load', 'w_d', 'w_D', 'w_dead', 'DL'],
+    'live_load': ['live_load', 'w_l', 'w_L', 'w_live', 'LL'],
+    'factored_load': ['factored_load', 'w_u', 'wu', 'w_factored'],
+    'width': ['width', 'beam_width', 'b'],
+    'height': ['height', 'beam_height', 'h'],
+    'cover': ['cover'],
+    'effective_depth': ['effective_depth', 'd'],
+    'fc': ['fc', 'f_c', 'fc_prime', 'f_c_prime', 'concrete_strength'],
+    'fy': ['fy', 'f_y', 'steel_strength'],
+    'steel_area_req': ['steel_area_req', 'A_s_required', 'As_req', 'A_s_req'],
+    'steel_area_provided': ['steel_area_provided', 'As_provided', 'A_s_provided'],
+    'bar_diameter': ['bar_diameter', 'd_bar'],
+    'max_moment': ['max_moment', 'M_u', 'M_max'],
+    'max_shear': ['max_shear', 'V_u', 'V_max']
+}
+
+# Values the templates print as whole millimetres
+INTEGER_KEYS = {'width', 'height', 'cover', 'effective_depth', 'steel_area_req',
+                'steel_area_provided', 'bar_diameter'}
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow
+}
+_UNARY_OPERATORS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+_COMPARE_OPERATORS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne
+}
+# Functions evaluated by name, with or without an np./math. prefix
+_FUNCTIONS = {
+    'sqrt': math.sqrt, 'ceil': math.ceil, 'floor': math.floor,
+    'max': max, 'min': min, 'abs': abs, 'round': round, 'float': float, 'int': int
+}
+
+
+class _Unsupported(Exception):
+    """Expression cannot be evaluated statically"""
+
+
+def _evaluate(node: ast.AST, env: Dict):
+    """Evaluate an arithmetic expression over previously bound values"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str)):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in env:
+            return env[node.id]
+        raise _Unsupported(node.id)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        if node.value.id in ('np', 'numpy', 'math') and node.attr == 'pi':
+            return math.pi
+        raise _Unsupported(node.attr)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left, right = _evaluate(node.left, env), _evaluate(node.right, env)
+        if isinstance(node.op, ast.Pow) and abs(right) > 64:
+            raise _Unsupported('pow')
+        return _BINARY_OPERATORS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate(node.operand, env))
+    if isinstance(node, ast.IfExp):
+        branch = node.body if _evaluate(node.test, env) else node.orelse
+        return _evaluate(branch, env)
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 \
+            and type(node.ops[0]) in _COMPARE_OPERATORS:
+        return _COMPARE_OPERATORS[type(node.ops[0])](
+            _evaluate(node.left, env), _evaluate(node.comparators[0], env))
+    if isinstance(node, ast.Call) and not node.keywords:
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) \
+                and func.value.id in ('np', 'numpy', 'math'):
+            name = func.attr
+        elif isinstance(func, ast.Name):
+            name = func.id
+        else:
+            raise _Unsupported('call')
+        function = _FUNCTIONS.get(name)
+        if function is None:
+            raise _Unsupported(name)
+        return function(*(_evaluate(arg, env) for arg in node.args))
+    raise _Unsupported(type(node).__name__)
+
+
+def _evaluate_assignments(source: str, env: Dict):
+    """Bind the values of a cell's top-level assignments into env"""
+    # Drop IPython magics and shell escapes (e.g. handcalcs' %%render)
+    lines = [line for line in source.splitlines()
+             if not line.lstrip().startswith(('%', '!'))]
+    try:
+        tree = ast.parse('\n'.join(lines))
+    except SyntaxError:
+        return
+
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            targets, value = statement.targets, statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets, value = [statement.target], statement.value
+        else:
+            continue
+
+        names = [target.id for target in targets if isinstance(target, ast.Name)]
+        try:
+            result = _evaluate(value, env)
+        except (_Unsupported, ArithmeticError, TypeError, ValueError):
+            # The variable now holds something we cannot know statically
+            for name in names:
+                env.pop(name, None)
+            continue
+        for name in names:
+            env[name] = result
+
+
+def _cell_source(cell: Dict) -> str:
+    """Cell source as one string (nbformat stores it as a string or list of lines)"""
+    source = cell.get('source', '')
+    return ''.join(source) if isinstance(source, list) else source
+
+
+def _parse_json(payload) -> Dict:
+    """Decode a JSON object payload, ignoring anything that is not a dict"""
+    if isinstance(payload, list):
+        payload = ''.join(payload)
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _numeric(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) \
+        and math.isfinite(value)
+
+
+def read_notebook(notebook_path: Union[str, Path]) -> Dict:
+    """
+    Load a notebook as plain JSON (no schema validation)
+
+    Args:
+        notebook_path (str): Path to the .ipynb file
+
+    Returns:
+        Dict: nbformat 4 notebook dictionary
+    """
+    notebook_path = Path(notebook_path)
+    if not notebook_path.exists():
+        raise FileNotFoundError(f"Notebook not found: {notebook_path}")
+
+    with open(notebook_path, 'r', encoding='utf-8') as f:
+        nb = json.load(f)
+
+    if nb.get('nbformat', 4) < 4:
+        import nbformat
+        nb = nbformat.convert(nbformat.from_dict(nb), 4)
+
+    return nb
+
+
+def scan_notebook(nb: Dict) -> Dict:
+    """
+    Collect published results and evaluated assignments in one pass over the cells
+
+    Args:
+        nb (Dict): nbformat 4 notebook dictionary
+
+    Returns:
+        Dict: 'results' (published values), 'assignments' (values evaluated
+        from source) and 'executed' (True if any code cell has outputs)
+    """
+    results = {}
+    assignments = {}
+    code_sources = []
+    executed = False
+
+    for cell in nb.get('cells', []):
+        tagged = RESULTS_TAG in cell.get('metadata', {}).get('tags', [])
+
+        if cell.get('cell_type') != 'code':
+            if tagged:
+                results.update(_parse_json(_cell_source(cell)))
+            continue
+
+        outputs = cell.get('outputs', [])
+        executed = executed or bool(outputs)
+
+        for output in outputs:
+            data = output.get('data', {})
+            if RESULTS_MIME in data:
+                results.update(_parse_json(data[RESULTS_MIME]))
+            elif tagged and 'application/json' in data:
+                results.update(_parse_json(data['application/json']))
+            elif tagged and output.get('output_type') == 'stream':
+                results.update(_parse_json(output.get('text', '')))
+
+        code_sources.append(_cell_source(cell))
+
+    # Parsing source is the expensive part; skip it when published results
+    # already cover every beam value
+    if not all(any(_numeric(results.get(name)) for name in names)
+               for names in BEAM_ALIASES.values()):
+        for source in code_sources:
+            _evaluate_assignments(source, assignments)
+
+    return {'results': results, 'assignments': assignments, 'executed': executed}
+
+
+def map_beam_values(scan: Dict) -> Tuple[Dict, Dict]:
+    """
+    Map scanned notebook variables onto beam data keys
+
+    Args:
+        scan (Dict): Output of scan_notebook()
+
+    Returns:
+        tuple: (beam values, source of each value: 'results' or 'assignments')
+    """
+    values = {}
+    sources = {}
+
+    for key, names in BEAM_ALIASES.items():
+        for origin in ('results', 'assignments'):
+            found = next((scan[origin][name] for name in names
+                          if _numeric(scan[origin].get(name))), None)
+            if found is not None:
+                values[key] = int(round(found)) if key in INTEGER_KEYS else float(found)
+                sources[key] = origin
+                break
+
+    return values, sources
+
+
+def extract_beam_values(notebook_path: Union[str, Path]) -> Tuple[Dict, Dict]:
+    """
+    Read beam parameters and results from a notebook
+
+    Args:
+        notebook_path (str): Path to the .ipynb file
+
+    Returns:
+        tuple: (beam values found, source of each value)
+    """
+    return map_beam_values(scan_notebook(read_notebook(notebook_path)))
+
+
+def index_notebooks(notebook_paths: Iterable[Union[str, Path]]) -> List[Dict]:
+    """
+    Extract beam values from many notebooks
+
+    Args:
+        notebook_paths: Notebook files to index
+
+    Returns:
+        List[Dict]: One entry per notebook with 'notebook', 'executed',
+        'values', 'sources' and 'error'
+    """
+    index = []
+    for notebook_path in notebook_paths:
+        entry = {'notebook': str(notebook_path), 'executed': False,
+                 'values': {}, 'sources': {}, 'error': None}
+        try:
+            scan = scan_notebook(read_notebook(notebook_path))
+            entry['executed'] = scan['executed']
+            entry['values'], entry['sources'] = map_beam_values(scan)
+        except (OSError, ValueError) as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+        index.append(entry)
+    return index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Extract calculation results from notebooks')
+    parser.add_argument('notebooks', nargs='+', help='Notebook files')
+    parser.add_argument('--output', help='Write the index as JSON to this file')
+
+    args = parser.parse_args()
+
+    index = index_notebooks(args.notebooks)
+
+    for entry in index:
+        marker = "❌" if entry['error'] else "✓"
+        state = "executed" if entry['executed'] else "not executed"
+        print(f"{marker} {entry['notebook']} ({state})")
+        if entry['error']:
+            print(f"   {entry['error']}")
+        for key, value in entry['values'].items():
+            print(f"   {key:20s} {value:>12g}  [{entry['sources'][key]}]")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(index, indent=2), encoding='utf-8')
+        print(f"📄 Index written: {args.output}")
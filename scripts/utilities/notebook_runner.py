@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Ghali Consultants - Parallel Notebook Runner
+===========================================
+Re-executes calculation notebooks headlessly on a pool of warm Jupyter
+kernels, e.g. after a load revision.
+
+Each kernel is started once and pre-imports numpy, matplotlib and
+handcalcs, so notebooks skip interpreter start-up and heavy imports. Between
+notebooks the kernel namespace is reset and the working directory moved to
+the notebook's folder. Parameters are injected as a cell after the cell
+tagged ``parameters``; in untagged notebooks the cell goes before the first
+cell that assigns one of them and the notebook's own assignments of the
+parameters are rebound to the injected values, so derived inputs follow.
+A final cell publishes every numeric result for notebook_extractor.
+
+Executed notebooks and a results.json summary are written to the output
+directory (default: output/executed_notebooks).
+
+Author: Ghali Consultants
+Version: 1.0
+"""
+
+import json
+import os
+import queue
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+# Add project root to Python path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.append(str(project_root))
+
+from scripts.utilities.notebook_extractor import (RESULTS_MIME, RESULTS_TAG,
+                                                  map_beam_values, scan_notebook)
+
+DEFAULT_OUTPUT_DIR = project_root / "output" / "executed_notebooks"
+PARAMETERS_TAG = 'parameters'
+INJECTED_TAG = 'injected-parameters'
+SETUP_TAG = 'ghali-kernel-setup'
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Run once when a kernel starts; the modules then stay cached in the kernel
+WARM_IMPORTS = """\
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+try:
+    import handcalcs.render
+except ImportError:
+    pass
+"""
+
+# Run before every notebook: clean namespace, cached modules
+RESET_CODE = """\
+%reset -f
+import os as _os
+_os.chdir({cwd!r})
+import matplotlib.pyplot as _plt
+_plt.close('all')
+del _os, _plt
+"""
+
+# Appended to every notebook: publish numeric globals for notebook_extractor
+RESULTS_CODE = """\
+import math as _math, numbers as _numbers
+from IPython.display import display as _display
+_display({{{mime!r}: {{
+    _k: float(_v) for _k, _v in list(globals().items())
+    if not _k.startswith('_') and isinstance(_v, _numbers.Real)
+    and not isinstance(_v, bool) and _math.isfinite(_v)
+}}}}, raw=True)
+"""
+
+
+class WarmKernelPool:
+    """Fixed-size pool of started kernels with calculation modules pre-imported"""
+
+    def __init__(self, size: int = 2, kernel_name: str = 'python3',
+                 startup_timeout: int = 60):
+        """
+        Start the kernels
+
+        Args:
+            size (int): Number of kernels
+            kernel_name (str): Jupyter kernel spec name
+            startup_timeout (int): Seconds to wait for each kernel
+        """
+        from jupyter_client import KernelManager
+
+        self.kernel_name = kernel_name
+        self.startup_timeout = startup_timeout
+        self._available = queue.Queue()
+        self._managers = []
+
+        for _ in range(size):
+            km = KernelManager(kernel_name=kernel_name)
+            km.start_kernel()
+            self._warm(km)
+            self._managers.append(km)
+            self._available.put(km)
+
+    def _warm(self, km):
+        """Pre-import the calculation modules in a kernel"""
+        kc = km.client()
+        kc.start_channels()
+        try:
+            kc.wait_for_ready(timeout=self.startup_timeout)
+            kc.execute_interactive(WARM_IMPORTS, timeout=self.startup_timeout,
+                                   output_hook=lambda msg: None)
+        finally:
+            kc.stop_channels()
+
+    def acquire(self):
+        """Take a kernel manager from the pool (blocks until one is free)"""
+        return self._available.get()
+
+    def release(self, km):
+        """Return a kernel to the pool, restarting it if it died"""
+        if not km.is_alive():
+            km.restart_kernel(now=True)
+            self._warm(km)
+        self._available.put(km)
+
+    def shutdown(self):
+        """Stop every kernel"""
+        for km in self._managers:
+            try:
+                km.shutdown_kernel(now=True)
+            except RuntimeError:
+                pass
+        self._managers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def _parse_cell(source: str):
+    """AST of a code cell, with IPython magics blanked (line numbers preserved)"""
+    import ast
+
+    lines = ['' if line.lstrip().startswith(('%', '!')) else line
+             for line in source.split('\n')]
+    try:
+        return ast.parse('\n'.join(lines))
+    except SyntaxError:
+        return None
+
+
+def _assigned_names(statement) -> List[str]:
+    """Names a top-level statement assigns"""
+    import ast
+
+    targets = statement.targets if isinstance(statement, ast.Assign) else \
+        [statement.target] if isinstance(statement, (ast.AnnAssign, ast.AugAssign)) else []
+    names = []
+    for target in targets:
+        elements = target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target]
+        names += [element.id for element in elements if isinstance(element, ast.Name)]
+    return names
+
+
+def _rebind_parameters(source: str, parameters: Dict, pending: set) -> str:
+    """
+    Make the first assignment of each pending parameter in a cell use the injected value
+
+    A plain ``name = <expression>`` keeps its line and comment with the
+    expression replaced; other assignments (tuples, augmented) are followed
+    by ``name = <value>``. Rebound names are removed from pending.
+
+    Args:
+        source (str): Code cell source
+        parameters (Dict): Variable names and values to inject
+        pending (set): Parameters whose first assignment is still to be found
+
+    Returns:
+        str: Cell source with the parameters rebound
+    """
+    import ast
+
+    tree = _parse_cell(source)
+    if tree is None:
+        return source
+
+    # (start line, start col, end line, end col, text); cols are UTF-8 offsets as in ast
+    edits = []
+    for statement in tree.body:
+        names = [name for name in _assigned_names(statement) if name in pending]
+        if not names:
+            continue
+        pending.difference_update(names)
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1 \
+                and isinstance(statement.targets[0], ast.Name):
+            value = statement.value
+            edits.append((value.lineno, value.col_offset, value.end_lineno,
+                          value.end_col_offset, repr(parameters[names[0]])))
+        else:
+            end = len(source.split('\n')[statement.end_lineno - 1].encode('utf-8'))
+            text = ''.join(f"\n{name} = {parameters[name]!r}" for name in names)
+            edits.append((statement.end_lineno, end, statement.end_lineno, end, text))
+
+    lines = [line.encode('utf-8') for line in source.split('\n')]
+    for start_line, start_col, end_line, end_col, text in reversed(edits):
+        head = lines[start_line - 1][:start_col]
+        tail = lines[end_line - 1][end_col:]
+        lines[start_line - 1:end_line] = [head + text.encode('utf-8') + tail]
+    return '\n'.join(line.decode('utf-8') for line in lines)
+
+
+def inject_parameters(nb, parameters: Dict):
+    """
+    Insert a cell that overrides notebook inputs
+
+    With a cell tagged 'parameters' (inputs only, as in papermill), the cell
+    goes right after it. Otherwise it goes before the first code cell
+    assigning any of the parameters, and the first assignment of each
+    parameter in the notebook is rebound to the injected value: the
+    notebook's values act as defaults, and values derived from them in the
+    same cell or later (effective_depth = height - cover) follow the
+    injected ones. Parameters the notebook never assigns go at the top.
+
+    Args:
+        nb: nbformat notebook (modified in place)
+        parameters (Dict): Variable names and values to inject
+    """
+    import nbformat
+
+    if not parameters:
+        return
+
+    code_cells = [(index, cell) for index, cell in enumerate(nb.cells)
+                  if cell.cell_type == 'code']
+    tagged = [index for index, cell in code_cells
+              if PARAMETERS_TAG in cell.metadata.get('tags', [])]
+    if tagged:
+        position = tagged[0] + 1
+    else:
+        position = None
+        pending = set(parameters)
+        for index, cell in code_cells:
+            if not pending:
+                break
+            remaining = len(pending)
+            cell.source = _rebind_parameters(cell.source, parameters, pending)
+            if position is None and len(pending) < remaining:
+                position = index
+        position = position or 0
+
+    lines = ["# Injected parameters"]
+    lines += [f"{name} = {value!r}" for name, value in parameters.items()]
+    cell = nbformat.v4.new_code_cell('\n'.join(lines), metadata={'tags': [INJECTED_TAG]})
+    nb.cells.insert(position, cell)
+
+
+def _add_cell(nb, source: str, tag: str, position: Optional[int] = None):
+    import nbformat
+
+    cell = nbformat.v4.new_code_cell(source, metadata={'tags': [tag]})
+    if position is None:
+        nb.cells.append(cell)
+    else:
+        nb.cells.insert(position, cell)
+
+
+def execute_notebook(pool: WarmKernelPool, notebook_path: Union[str, Path],
+                     parameters: Optional[Dict] = None, output_path: Optional[Path] = None,
+                     timeout: int = 600) -> Dict:
+    """
+    Execute one notebook on a warm kernel from the pool
+
+    Args:
+        pool (WarmKernelPool): Kernel pool
+        notebook_path (str): Notebook to execute
+        parameters (Dict, optional): Variables to inject
+        output_path (Path, optional): Where to write the executed notebook
+        timeout (int): Per-cell timeout in seconds
+
+    Returns:
+        Dict: notebook, output, status ('ok' or 'error'), seconds, error,
+        published results and mapped beam values
+    """
+    import nbformat
+    from nbclient import NotebookClient
+
+    start = time.perf_counter()
+    notebook_path = Path(notebook_path)
+    result = {'notebook': str(notebook_path), 'output': None, 'status': 'ok',
+              'error': None, 'results': {}, 'values': {}}
+
+    nb = nbformat.read(notebook_path, as_version=4)
+    inject_parameters(nb, parameters or {})
+    _add_cell(nb, RESET_CODE.format(cwd=str(notebook_path.parent.resolve())), SETUP_TAG, 0)
+    _add_cell(nb, RESULTS_CODE.format(mime=RESULTS_MIME), RESULTS_TAG)
+
+    km = pool.acquire()
+    client = NotebookClient(nb, km=km, timeout=timeout, kernel_name=pool.kernel_name,
+                            allow_errors=False)
+    try:
+        client.execute()
+    except Exception as e:
+        # Keep the last traceback line (the exception message) for the summary
+        message = ANSI_ESCAPE.sub('', str(e)).strip().splitlines()
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {message[-1] if message else ''}"
+    finally:
+        if client.kc is not None:
+            client.kc.stop_channels()
+        pool.release(km)
+
+    # The setup cell is an implementation detail of the warm kernel
+    nb.cells = [cell for cell in nb.cells
+                if SETUP_TAG not in cell.metadata.get('tags', [])]
+    if nb.nbformat_minor < 5:
+        for cell in nb.cells:
+            cell.pop('id', None)
+
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        nbformat.write(nb, str(output_path))
+        result['output'] = str(output_path)
+
+    scan = scan_notebook(nb)
+    result['results'] = scan['results']
+    result['values'], _ = map_beam_values(scan)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _normalize_job(job: Union[str, Path, Dict]) -> Dict:
+    """Accept notebook paths or dictionaries with 'notebook', 'parameters', 'name'"""
+    if isinstance(job, dict):
+        return {'notebook': Path(job['notebook']),
+                'parameters': job.get('parameters') or {},
+                'name': job.get('name')}
+    return {'notebook': Path(job), 'parameters': {}, 'name': None}
+
+
+def _output_stems(jobs: List[Dict]) -> List[str]:
+    """
+    Output file stem of every job: its name, or the notebook stem
+
+    Unnamed runs of a notebook executed more than once (e.g. one per load
+    case) get their job number appended, so no two jobs write the same file;
+    names that still clash (explicit duplicates) raise a ValueError.
+    """
+    from collections import Counter
+
+    runs = Counter(job['notebook'].stem for job in jobs if not job['name'])
+    stems = [job['name'] or (f"{job['notebook'].stem}_{index:03d}"
+                             if runs[job['notebook'].stem] > 1 else job['notebook'].stem)
+             for index, job in enumerate(jobs, start=1)]
+    duplicates = sorted(stem for stem, count in Counter(stems).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Jobs share output names: {', '.join(duplicates)}; "
+                         "give each job a unique 'name'")
+    return stems
+
+
+def run_notebooks(jobs: Iterable[Union[str, Path, Dict]], max_workers: Optional[int] = None,
+                  output_dir: Optional[Union[str, Path]] = None, timeout: int = 600,
+                  kernel_name: str = 'python3') -> Dict:
+    """
+    Execute many notebooks concurrently on warm kernels
+
+    Args:
+        jobs: Notebook paths, or dictionaries with 'notebook', optional
+            'parameters' and optional 'name' (output file stem, see _output_stems)
+        max_workers (int, optional): Number of kernels (default: CPU count, max 8)
+        output_dir (str, optional): Destination for executed notebooks
+        timeout (int): Per-cell timeout in seconds
+        kernel_name (str): Jupyter kernel spec name
+
+    Returns:
+        Dict: Per-notebook results plus succeeded/failed counts and wall time
+    """
+    jobs = [_normalize_job(job) for job in jobs]
+    stems = _output_stems(jobs)
+    max_workers = max(1, min(max_workers or min(os.cpu_count() or 1, 8), len(jobs) or 1))
+    output_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+
+    print("📓 GHALI CONSULTANTS - Notebook Runner")
+    print("=" * 50)
+    print(f"   {len(jobs)} notebooks on {max_workers} warm kernels")
+
+    start = time.perf_counter()
+    results: List[Dict] = []
+
+    with WarmKernelPool(max_workers, kernel_name) as pool:
+        print(f"   ✓ Kernels ready ({time.perf_counter() - start:.1f} s)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for index, job in enumerate(jobs):
+                output_path = output_dir / f"{stems[index]}.ipynb"
+                future = executor.submit(execute_notebook, pool, job['notebook'],
+                                         job['parameters'], output_path, timeout)
+                futures[future] = index
+
+            for future in as_completed(futures):
+                result = future.result()
+                result['index'] = futures[future]
+                results.append(result)
+                marker = "✓" if result['status'] == 'ok' else "❌"
+                print(f"   {marker} [{len(results)}/{len(jobs)}] {result['notebook']} "
+                      f"({result['seconds']:.1f} s)")
+                if result['error']:
+                    print(f"      {result['error']}")
+
+    wall_time = time.perf_counter() - start
+    results.sort(key=lambda r: r['index'])
+    succeeded = sum(1 for r in results if r['status'] == 'ok')
+
+    summary = {
+        'notebooks': results,
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'wall_time': wall_time
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_file = output_dir / "results.json"
+    summary_file.write_text(json.dumps(summary, indent=2, default=str), encoding='utf-8')
+
+    print(f"\n📊 {succeeded}/{len(jobs)} notebooks in {wall_time:.1f} s")
+    print(f"📄 Summary: {summary_file}")
+
+    return summary
+
+
+def _parse_parameter(text: str):
+    """Parse NAME=VALUE, reading VALUE as JSON when possible"""
+    name, _, value = text.partition('=')
+    try:
+        return name.strip(), json.loads(value)
+    except ValueError:
+        return name.strip(), value
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Execute calculation notebooks on warm kernels')
+    parser.add_argument('notebooks', nargs='*', help='Notebook files')
+    parser.add_argument('--jobs', help='JSON file with a list of {notebook, parameters, name} jobs')
+    parser.add_argument('-p', '--param', action='append', default=[],
+                        help='Parameter for every notebook, e.g. -p dead_load=32.5')
+    parser.add_argument('--workers', type=int, help='Number of kernels (default: CPU count)')
+    parser.add_argument('--timeout', type=int, default=600, help='Per-cell timeout (s)')
+    parser.add_argument('--output-dir', help='Output directory (default: output/executed_notebooks)')
+
+    args = parser.parse_args()
+
+    shared_parameters = dict(_parse_parameter(text) for text in args.param)
+    jobs = [{'notebook': path, 'parameters': shared_parameters} for path in args.notebooks]
+    if args.jobs:
+        for job in json.loads(Path(args.jobs).read_text(encoding='utf-8')):
+            job['parameters'] = {**shared_parameters, **(job.get('parameters') or {})}
+            jobs.append(job)
+
+    if not jobs:
+        parser.error("no notebooks given")
+
+    summary = run_notebooks(jobs, args.workers, args.output_dir, args.timeout)
+
+    if summary['failed']:
+        sys.exit(1)
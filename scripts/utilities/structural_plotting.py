@@ -4,15 +4,18 @@ Professional structural engineering plots for LaTeX reports
 Follows structural engineering conventions: BMD positive downward
 """
 
+import functools
+import io
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib import rcParams
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
-# Configure matplotlib for professional plots
-rcParams.update({
+# Professional plot style, applied only while Ghali figures are drawn and
+# saved (see plot_style); matplotlib itself is imported on first use
+PLOT_STYLE = {
     'font.family': 'serif',
     'font.serif': ['Times New Roman', 'Times', 'DejaVu Serif'],
     'font.size': 11,
@@ -31,7 +34,20 @@ rcParams.update({
     'grid.alpha': 0.3,
     'axes.linewidth': 0.8,
     'grid.linewidth': 0.5
-})
+}
+
+# Reproducible PDF output (no creation timestamp) so unchanged figures hash identically
+PDF_METADATA = {'CreationDate': None}
+
+# Figure export policy: formats and raster resolution per report target
+EXPORT_FORMATS = ('png', 'pdf', 'svg')
+FORMAT_METADATA = {'pdf': PDF_METADATA, 'svg': {'Date': None}}
+EXPORT_PRESETS = {
+    'latex': {'formats': ('pdf',), 'dpi': 300},    # LaTeX includes vector PDF only
+    'html': {'formats': ('png',), 'dpi': 150},     # Screen-resolution PNG
+    'archive': {'formats': ('png', 'pdf'), 'dpi': 300}
+}
+DEFAULT_EXPORT = EXPORT_PRESETS['archive']
 
 # Ghali Consultants color scheme
 GHALI_COLORS = {
@@ -43,14 +59,165 @@ GHALI_COLORS = {
     'dark_blue': '#0d47a1'   # Dark blue for emphasis
 }
 
+_style_lock = threading.Lock()
+_style_users = 0
+_style_saved = {}
+
+@contextmanager
+def plot_style():
+    """
+    Apply PLOT_STYLE to matplotlib while the block runs
+    
+    The caller's rcParams are restored when the last concurrent user leaves,
+    so threads drawing Ghali figures at the same time share one style and
+    notebooks importing this module keep their own settings.
+    """
+    global _style_users, _style_saved
+    from matplotlib import rcParams
+    
+    with _style_lock:
+        if _style_users == 0:
+            _style_saved = {key: rcParams[key] for key in PLOT_STYLE}
+            rcParams.update(PLOT_STYLE)
+        _style_users += 1
+    try:
+        yield
+    finally:
+        with _style_lock:
+            _style_users -= 1
+            if _style_users == 0:
+                rcParams.update(_style_saved)
+
+def styled(function):
+    """Decorator running a drawing or saving function inside plot_style()"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with plot_style():
+            return function(*args, **kwargs)
+    return wrapper
+
+@styled
+def serialize_figure(fig, fmt, dpi=None):
+    """
+    Serialize a drawn figure into memory
+    
+    Args:
+        fig: matplotlib Figure
+        fmt: 'png', 'pdf' or 'svg'
+        dpi: Raster resolution (defaults to savefig.dpi)
+        
+    Returns:
+        bytes: Encoded figure
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported figure format: {fmt}")
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi or PLOT_STYLE['savefig.dpi'], bbox_inches='tight',
+                metadata=FORMAT_METADATA.get(fmt))
+    return buffer.getvalue()
+
+def write_figure_files(files, directory):
+    """
+    Write in-memory figures (file name → bytes) into a directory
+    
+    Returns:
+        List of written paths
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for file_name, data in files.items():
+        path = directory / file_name
+        path.write_bytes(data)
+        paths.append(path)
+    return paths
+
 class StructuralPlotter:
     """Professional structural engineering plotting class for Ghali Consultants"""
     
-    def __init__(self, output_dir="reports/figures"):
-        """Initialize the plotter with output directory"""
+    def __init__(self, output_dir="reports/figures", job_id=None,
+                 formats=DEFAULT_EXPORT['formats'], dpi=DEFAULT_EXPORT['dpi'], in_memory=False):
+        """
+        Initialize the plotter with output directory
+        
+        Figures are built on standalone matplotlib Figure objects (no pyplot
+        state), so separate plotters can render concurrently.
+        
+        Args:
+            output_dir: Base directory for saved figures
+            job_id: Optional job name; figures go to output_dir/job_id so
+                concurrent jobs never overwrite each other
+            formats: Formats written when a figure is drawn (see EXPORT_PRESETS);
+                an empty tuple defers all writing to export_figure()
+            dpi: Resolution for raster output
+            in_memory: Keep the requested formats in self.buffers (file name
+                → bytes) instead of writing them; plot methods then return
+                the bytes of the primary format in place of a path
+        """
+        unknown = set(formats) - set(EXPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported figure formats: {sorted(unknown)}")
+        
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if job_id is not None:
+            self.output_dir = self.output_dir / str(job_id)
+        if not in_memory:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.formats = tuple(formats)
+        self.dpi = dpi
+        self.in_memory = in_memory
+        self.figures = {}
+        self.buffers = {}
+    
+    def figure_path(self, save_name, fmt=None):
+        """Path of a saved figure; defaults to PDF, else the first requested format"""
+        if fmt is None:
+            fmt = 'pdf' if 'pdf' in self.formats or not self.formats else self.formats[0]
+        return self.output_dir / f"{save_name}.{fmt}"
+    
+    @styled
+    def export_figure(self, save_name, fmt, dpi=None):
+        """
+        Serialize an already drawn figure without re-plotting it
         
+        Args:
+            save_name: Name the figure was drawn under
+            fmt: 'png', 'pdf' or 'svg'
+            dpi: Raster resolution (defaults to the plotter's dpi)
+            
+        Returns:
+            Path of the written file
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported figure format: {fmt}")
+        
+        path = self.figure_path(save_name, fmt)
+        self.figures[save_name].savefig(path, format=fmt, dpi=dpi or self.dpi,
+                                        bbox_inches='tight',
+                                        metadata=FORMAT_METADATA.get(fmt))
+        return str(path)
+    
+    def export_bytes(self, save_name, fmt, dpi=None):
+        """Serialize an already drawn figure into memory (see export_figure)"""
+        return serialize_figure(self.figures[save_name], fmt, dpi or self.dpi)
+    
+    def _save_figure(self, fig, save_name):
+        """Lay out a figure once and write (or buffer) only the requested formats"""
+        fig.tight_layout()
+        self.figures[save_name] = fig
+        
+        for fmt in self.formats:
+            if self.in_memory:
+                self.buffers[f"{save_name}.{fmt}"] = self.export_bytes(save_name, fmt)
+            else:
+                self.export_figure(save_name, fmt)
+        
+        if self.in_memory:
+            return self.buffers.get(self.figure_path(save_name).name)
+        return str(self.figure_path(save_name))
+        
+    @styled
     def plot_beam_diagram(self, L, w_d, w_l, beam_width, beam_height, save_name="beam_diagram"):
         """
         Plot beam geometry and loading diagram
@@ -63,7 +230,11 @@ class StructuralPlotter:
             beam_height: Beam height (mm)
             save_name: Name for saved figure
         """
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        import matplotlib.patches as mpatches
+        from matplotlib.figure import Figure
+        
+        fig = Figure(figsize=(12, 8))
+        ax1, ax2 = fig.subplots(2, 1)
         
         # Beam geometry
         x_beam = np.array([0, L, L, 0, 0])
@@ -82,8 +253,8 @@ class StructuralPlotter:
         ax1.plot([L, L-support_size/2, L+support_size/2, L], 
                 [0, -support_size, -support_size, 0], 'k-', linewidth=2)
         # Add roller circles
-        circle = plt.Circle((L, -support_size*0.7), support_size*0.2, 
-                          color='white', ec='black', linewidth=2)
+        circle = mpatches.Circle((L, -support_size*0.7), support_size*0.2, 
+                               color='white', ec='black', linewidth=2)
         ax1.add_patch(circle)
         
         ax1.set_xlim(-L*0.1, L*1.1)
@@ -129,13 +300,9 @@ class StructuralPlotter:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{save_name}.png", dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{save_name}.pdf", dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return str(self.output_dir / f"{save_name}.pdf")
+        return self._save_figure(fig, save_name)
     
+    @styled
     def plot_bmd_sfd(self, L, w_u, save_name="bmd_sfd"):
         """
         Plot Bending Moment and Shear Force Diagrams
@@ -146,7 +313,11 @@ class StructuralPlotter:
             w_u: Factored distributed load (kN/m)
             save_name: Name for saved figure
         """
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
+        import matplotlib.patches as mpatches
+        from matplotlib.figure import Figure
+        
+        fig = Figure(figsize=(12, 10))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
         
         # Define x coordinates
         x = np.linspace(0, L, 100)
@@ -168,8 +339,8 @@ class StructuralPlotter:
         # Right support (roller)
         ax1.plot([L, L-support_size, L+support_size, L], 
                 [0, -support_size*1.5, -support_size*1.5, 0], 'k-', linewidth=2)
-        circle = plt.Circle((L, -support_size), support_size*0.4, 
-                          color='white', ec='black', linewidth=2)
+        circle = mpatches.Circle((L, -support_size), support_size*0.4, 
+                               color='white', ec='black', linewidth=2)
         ax1.add_patch(circle)
         
         # Load arrows
@@ -248,13 +419,9 @@ class StructuralPlotter:
                 va='top', fontsize=9, style='italic', color=GHALI_COLORS['gray'],
                 bbox=dict(boxstyle="round,pad=0.3", facecolor='lightyellow', alpha=0.8))
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{save_name}.png", dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{save_name}.pdf", dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return str(self.output_dir / f"{save_name}.pdf"), M_max, V_max
+        return self._save_figure(fig, save_name), M_max, V_max
     
+    @styled
     def plot_steel_layout(self, beam_width, beam_height, As_req, bar_diameter, 
                          cover=40, save_name="steel_layout"):
         """
@@ -268,7 +435,11 @@ class StructuralPlotter:
             cover: Concrete cover (mm)
             save_name: Name for saved figure
         """
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+        import matplotlib.patches as mpatches
+        from matplotlib.figure import Figure
+        
+        fig = Figure(figsize=(10, 8))
+        ax = fig.subplots(1, 1)
         
         # Calculate number of bars needed
         bar_area = np.pi * (bar_diameter/2)**2
@@ -293,8 +464,8 @@ class StructuralPlotter:
         # Draw steel bars
         bar_y = cover
         for i, x_pos in enumerate(bar_positions):
-            circle = plt.Circle((x_pos, bar_y), bar_diameter/2, 
-                              color=GHALI_COLORS['red'], alpha=0.8)
+            circle = mpatches.Circle((x_pos, bar_y), bar_diameter/2, 
+                                   color=GHALI_COLORS['red'], alpha=0.8)
             ax.add_patch(circle)
             # Add bar label
             ax.text(x_pos, bar_y, f'#{int(bar_diameter)}', ha='center', va='center', 
@@ -346,25 +517,27 @@ Cover: {cover}mm"""
         ax.set_aspect('equal')
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{save_name}.png", dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{save_name}.pdf", dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return str(self.output_dir / f"{save_name}.pdf"), n_bars, n_bars * bar_area
+        return self._save_figure(fig, save_name), n_bars, n_bars * bar_area
 
-def create_all_structural_plots(beam_data, output_dir="reports/figures"):
+def create_all_structural_plots(beam_data, output_dir="reports/figures", job_id=None,
+                                formats=DEFAULT_EXPORT['formats'], dpi=DEFAULT_EXPORT['dpi'],
+                                in_memory=False):
     """
     Create all structural plots for the calculation sheet
     
     Args:
         beam_data: Dictionary containing all beam parameters
         output_dir: Output directory for figures
+        job_id: Optional job name; figures go to output_dir/job_id
+        formats: Figure formats to write, e.g. EXPORT_PRESETS['latex']['formats']
+        dpi: Resolution for raster output
+        in_memory: Return the figures as bytes under 'files' (file name →
+            bytes, e.g. 'bmd_sfd.pdf') instead of writing them
         
     Returns:
-        Dictionary with figure paths and calculated values
+        Dictionary with figure paths (or bytes) and calculated values
     """
-    plotter = StructuralPlotter(output_dir)
+    plotter = StructuralPlotter(output_dir, job_id, formats, dpi, in_memory)
     
     # Extract parameters
     L = beam_data['length']  # m
@@ -395,8 +568,51 @@ def create_all_structural_plots(beam_data, output_dir="reports/figures"):
     results['n_bars'] = n_bars
     results['As_provided'] = As_provided
     
+    if in_memory:
+        results['files'] = plotter.buffers
+    
     return results
 
+def _plot_job(args):
+    """Render one beam's figure set (module-level so process pools can pickle it)"""
+    beam_data, output_dir, job_id, formats, dpi = args
+    return create_all_structural_plots(beam_data, output_dir, job_id, formats, dpi)
+
+def create_structural_plots_batch(beams_data, output_dir="reports/figures", job_ids=None,
+                                  max_workers=None, use_processes=True,
+                                  formats=DEFAULT_EXPORT['formats'], dpi=DEFAULT_EXPORT['dpi']):
+    """
+    Render figure sets for many beams in parallel
+    
+    Each beam renders into its own job directory (output_dir/job_id), so the
+    fixed figure names (beam_diagram, bmd_sfd, steel_layout) never collide.
+    
+    Args:
+        beams_data: List of beam parameter dictionaries
+        output_dir: Base output directory for the job directories
+        job_ids: Optional job names, one per beam (default: beam_0000, ...)
+        max_workers: Pool size, defaults to the CPU count
+        use_processes: Render on a process pool (True) or a thread pool (False)
+        formats: Figure formats to write for every beam
+        dpi: Resolution for raster output
+        
+    Returns:
+        List of create_all_structural_plots results, in input order
+    """
+    beams_data = list(beams_data)
+    if job_ids is None:
+        job_ids = [f"beam_{i:04d}" for i in range(len(beams_data))]
+    if len(job_ids) != len(beams_data):
+        raise ValueError("job_ids must match beams_data in length")
+    
+    tasks = [(beam_data, str(output_dir), job_id, tuple(formats), dpi)
+             for beam_data, job_id in zip(beams_data, job_ids)]
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as pool:
+        return list(pool.map(_plot_job, tasks))
+
 if __name__ == "__main__":
     # Example usage
     sample_beam = {